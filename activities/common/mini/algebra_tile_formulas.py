@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 import datetime
@@ -23,9 +24,9 @@ _GAME_HTML = r"""<!DOCTYPE html>
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[{left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}]})"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
@@ -965,6 +966,6 @@ def render():
         "대수막대를 직접 드래그해서 격자를 채우세요. "
         "중학교 복습 5개 + 새 공식 3개 = 전 8개!"
     )
-    components.html(_GAME_HTML, height=920, scrolling=True)
+    components.html(vendor_html(_GAME_HTML), height=920, scrolling=True)
     st.divider()
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
@@ -6,6 +6,7 @@ p5.js 인터랙티브 활동 – 수 버전 & 다항식 버전 빈칸 채우기
 import datetime
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 
@@ -36,9 +37,9 @@ _HTML = r"""
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>갤로시아 곱셈 탐구</title>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderAllMath()"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
@@ -777,5 +778,5 @@ def render():
         "12세기 인도 수학자 **바스카라**의 《릴라바티》에 소개된 **격자 곱셈법(Gelosia)**으로 "
         "정수 곱셈과 다항식 곱셈을 직접 체험해 보세요."
     )
-    components.html(_HTML, height=1100, scrolling=False)
+    components.html(vendor_html(_HTML), height=1100, scrolling=False)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
@@ -6,6 +6,7 @@
 import datetime
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 
@@ -35,9 +36,9 @@ _GAME_HTML = r"""
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>항등식 탐정 게임</title>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMath()"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
@@ -483,7 +484,7 @@ def render():
     </style>
     """, unsafe_allow_html=True)
     
-    components.html(_GAME_HTML, height=850, scrolling=True)
+    components.html(vendor_html(_GAME_HTML), height=850, scrolling=True)
 
     # ── 성찰 기록 폼 ────────────────────────────────────────────────────────
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
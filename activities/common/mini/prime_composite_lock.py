@@ -5,6 +5,7 @@
 
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 from reflection_utils import render_reflection_form
 
@@ -57,8 +58,8 @@ _HTML = r"""
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>소수·합성수 잠금 해제</title>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
 :root{
@@ -1205,7 +1206,7 @@ def render():
         unsafe_allow_html=True,
     )
 
-    components.html(_HTML, height=3400, scrolling=False)
+    components.html(vendor_html(_HTML), height=3400, scrolling=False)
 
     # ── 성찰 기록 폼 ────────────────────────────────────────────────────────
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
@@ -7,6 +7,7 @@
 import datetime
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 
@@ -39,9 +40,9 @@ _HTML = r"""
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>나머지가 같은 식</title>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[{left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}]})"></script>
 <style>
 /* ── Base ── */
@@ -1096,5 +1097,5 @@ def render():
         "6장의 다항식 카드 중 하나를 골라 $x^2+1$로 나눈 나머지를 구하고, "
         "같은 나머지를 가지는 다항식을 직접 만들어 패턴을 탐구해 보세요."
     )
-    components.html(_HTML, height=1700, scrolling=True)
+    components.html(vendor_html(_HTML), height=1700, scrolling=True)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
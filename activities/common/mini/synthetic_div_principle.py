@@ -6,6 +6,7 @@ p5.js + KaTeX 인터랙티브 활동
 import datetime
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 
@@ -38,9 +39,9 @@ _HTML = r"""
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>조립제법 원리 탐구</title>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="window._katexReady=true; renderAllMath()"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
@@ -791,5 +792,5 @@ def render():
         "**계수 비교법**으로 조립제법 공식이 어떻게 유도되는지 단계별로 확인하고, "
         "직접 조립제법 표를 완성해 보세요."
     )
-    components.html(_HTML, height=960, scrolling=True)
+    components.html(vendor_html(_HTML), height=960, scrolling=True)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
@@ -5,6 +5,10 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 
+from ifs_utils import chaos_points, vertex_sequence
+from raster_utils import DensityRaster, polygon_overlay
+from state_utils import track_state
+
 try:
     from utils import page_header, anchor, scroll_to
 except Exception:
@@ -36,9 +40,11 @@ K_TRI_ON = "sier_triangle_on"
 # 내부 상태
 K_SIG  = "sier_signature"
 K_IDX  = "sier_idx"
-K_PTS  = "sier_pts"
+K_PTS  = "sier_pts"      # 앞부분 점(산점도용, 최대 _SCATTER_MAX개)
 K_DONE = "sier_done"
 K_P_LAST = "sier_plast"
+K_P0   = "sier_p0"       # 워밍업 직후 시작점(점 개수를 줄이면 여기서 다시 누적)
+K_RASTER = "sier_raster" # 밀도 래스터의 점 개수 격자(uint32 배열 — 세션 메모리 관리 대상)
 
 DEFAULTS = {
     K_NMAX:   50_000,
@@ -60,52 +66,113 @@ def _ensure_defaults():
 def _signature(nmax, warmup, seed, w1, w2, w3):
     return (int(nmax), int(warmup), int(seed), float(w1), float(w2), float(w3))
 
+_V = np.array([[0.0, 0.0],
+               [1.0, 0.0],
+               [0.5, np.sqrt(3)/2.0]], dtype=np.float32)
+
+# 이 개수까지는 점 하나하나가 보이는 산점도, 넘으면 서버에서 래스터화한 PNG로 표시
+_SCATTER_MAX = 20_000
+_RASTER_EXTENT = (-0.04, 1.04, -0.04, float(np.sqrt(3) / 2.0) + 0.04)
+_RASTER_WIDTH = 800
+_CHUNK = 1_000_000      # 한 번에 만드는 점 수(임시 메모리 상한)
+
 def _reset_sequence(nmax, warmup, seed, p_vec):
-    V = np.array([[0.0, 0.0],
-                  [1.0, 0.0],
-                  [0.5, np.sqrt(3)/2.0]], dtype=np.float32)
     rng = np.random.default_rng(int(seed))
-    idx = rng.choice(3, size=int(nmax) + int(warmup), p=p_vec)
-    p = V.mean(axis=0) + rng.normal(0, 0.01, size=2).astype(np.float32)
-    for i in range(int(warmup)):
-        v = V[idx[i]]
-        p = (p + v) / 2.0
+    # 꼭짓점 번호(0~2)만 담으므로 uint8로 보관(int64 대비 1/8)
+    idx = vertex_sequence(3, int(nmax) + int(warmup), weights=p_vec, seed=rng)
+    p = _V.mean(axis=0) + rng.normal(0, 0.01, size=2).astype(np.float32)
+    if int(warmup) > 0:
+        p = chaos_points(_V, idx[:int(warmup)], start=p)[-1]
     st.session_state[K_IDX] = idx
-    st.session_state[K_PTS] = np.empty((int(nmax), 2), dtype=np.float32)
+    st.session_state[K_PTS] = np.empty((min(int(nmax), _SCATTER_MAX), 2), dtype=np.float32)
     st.session_state[K_DONE] = 0
+    st.session_state[K_P0] = p
     st.session_state[K_P_LAST] = p
+    st.session_state[K_RASTER] = DensityRaster(_RASTER_EXTENT, width=_RASTER_WIDTH).counts
+
+def _raster() -> DensityRaster:
+    """세션의 점 개수 배열을 감싼 래스터(add/reset은 배열을 제자리에서 갱신)."""
+    return DensityRaster(_RASTER_EXTENT, width=_RASTER_WIDTH, counts=st.session_state[K_RASTER])
 
 def _extend_points_to(target_n):
-    V = np.array([[0.0, 0.0],
-                  [1.0, 0.0],
-                  [0.5, np.sqrt(3)/2.0]], dtype=np.float32)
+    """점을 target_n개까지 만들어 래스터에 누적(새 점만). 줄어들면 처음부터 다시 누적."""
     done = int(st.session_state[K_DONE])
     target = int(target_n)
+    raster = _raster()
+    p = st.session_state[K_P_LAST]
+    if target < done:
+        done = 0
+        p = st.session_state[K_P0]
+        raster.reset()
     if target <= done:
         return
+    warmup = int(st.session_state[K_WARMUP])
     idx = st.session_state[K_IDX]
-    pts = st.session_state[K_PTS]
-    p   = st.session_state[K_P_LAST]
-    CHUNK = 10_000
+    head = st.session_state[K_PTS]
     cur = done
     while cur < target:
-        end = min(target, cur + CHUNK)
-        for i in range(cur, end):
-            v = V[idx[i + st.session_state[K_WARMUP]]]
-            p = (p + v) / 2.0
-            pts[i] = p
+        end = min(target, cur + _CHUNK)
+        new = chaos_points(_V, idx[cur + warmup:end + warmup], start=p)
+        raster.add(new)
+        if cur < head.shape[0]:
+            k = min(end, head.shape[0]) - cur
+            head[cur:cur + k] = new[:k]
+        p = new[-1].copy()
         cur = end
     st.session_state[K_P_LAST] = p
     st.session_state[K_DONE] = target
 
+def _render_scatter(pts, sz, title):
+    """점 개수가 적을 때: 점 하나하나가 보이는 Plotly 산점도."""
+    fig = go.Figure()
+
+    # (옵션) 배경 삼각형 + 라벨(겹치지 않도록 x/yshift 적용)
+    if st.session_state[K_TRI_ON]:
+        V = np.array([[0.0, 0.0],
+                      [1.0, 0.0],
+                      [0.5, np.sqrt(3)/2.0]], dtype=float)
+        shapes = [
+            dict(type="line", x0=V[0,0], y0=V[0,1], x1=V[1,0], y1=V[1,1],
+                 line=dict(width=2, color="rgba(60,60,60,0.7)"), layer="below"),
+            dict(type="line", x0=V[1,0], y0=V[1,1], x1=V[2,0], y1=V[2,1],
+                 line=dict(width=2, color="rgba(60,60,60,0.7)"), layer="below"),
+            dict(type="line", x0=V[2,0], y0=V[2,1], x1=V[0,0], y1=V[0,1],
+                 line=dict(width=2, color="rgba(60,60,60,0.7)"), layer="below"),
+        ]
+        fig.update_layout(shapes=shapes)
+        # 점 이름이 선과 겹치지 않도록 픽셀 단위로 살짝 띄우기
+        fig.add_annotation(x=V[0,0], y=V[0,1], text="A", showarrow=False,
+                           font=dict(size=14), xshift=-14, yshift=-12)
+        fig.add_annotation(x=V[1,0], y=V[1,1], text="B", showarrow=False,
+                           font=dict(size=14), xshift=14, yshift=-12)
+        fig.add_annotation(x=V[2,0], y=V[2,1], text="C", showarrow=False,
+                           font=dict(size=14), yshift=14)
+
+    fig.add_scattergl(
+        x=pts[:, 0], y=pts[:, 1],
+        mode="markers",
+        marker=dict(size=sz, opacity=0.9),
+        showlegend=False
+    )
+    fig.update_yaxes(scaleanchor="x", scaleratio=1)
+    fig.update_layout(
+        title=title,
+        margin=dict(l=10, r=10, t=40, b=10),
+        xaxis=dict(visible=False), yaxis=dict(visible=False),
+        dragmode="pan",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
 def render():
     _ensure_defaults()
+    # 큰 배열 묶음: 화면을 떠나면 압축/파일로 내보내고, 세션 예산 초과 시 통째로 비움(→ 서명 불일치로 재계산)
+    track_state("sierpinski_chaos", K_SIG, K_IDX, K_PTS, K_DONE, K_P_LAST, K_P0, K_RASTER)
     page_header("시에르핀스키 삼각형 (Chaos Game)", "점이 하나씩 쌓이며 패턴이 형성되는 과정을 관찰합니다.", icon="🌀", top_rule=True)
 
     # ---- 사이드바 ----
     with st.sidebar:
         st.subheader("⚙️ 설정")
-        st.slider("최대 점 개수 Nₘₐₓ", 1, 300_000, key=K_NMAX, step=1)
+        st.slider("최대 점 개수 Nₘₐₓ", 1, 10_000_000, key=K_NMAX, step=1)
         st.slider("워밍업 단계(버리기)", 0, 500, key=K_WARMUP, step=5)
         st.slider("점 크기(px)", 1, 6, key=K_SIZE, step=1)
         st.number_input("난수 시드", value=int(st.session_state[K_SEED]), step=1, key=K_SEED)
@@ -178,46 +245,17 @@ def render():
     _extend_points_to(target)
 
     # ---- 시각화 ----
-    pts = st.session_state[K_PTS][:target]
     sz  = int(st.session_state[K_SIZE])
-    fig = go.Figure()
-
-    # (옵션) 배경 삼각형 + 라벨(겹치지 않도록 x/yshift 적용)
-    if st.session_state[K_TRI_ON]:
-        V = np.array([[0.0, 0.0],
-                      [1.0, 0.0],
-                      [0.5, np.sqrt(3)/2.0]], dtype=float)
-        shapes = [
-            dict(type="line", x0=V[0,0], y0=V[0,1], x1=V[1,0], y1=V[1,1],
-                 line=dict(width=2, color="rgba(60,60,60,0.7)"), layer="below"),
-            dict(type="line", x0=V[1,0], y0=V[1,1], x1=V[2,0], y1=V[2,1],
-                 line=dict(width=2, color="rgba(60,60,60,0.7)"), layer="below"),
-            dict(type="line", x0=V[2,0], y0=V[2,1], x1=V[0,0], y1=V[0,1],
-                 line=dict(width=2, color="rgba(60,60,60,0.7)"), layer="below"),
-        ]
-        fig.update_layout(shapes=shapes)
-        # 점 이름이 선과 겹치지 않도록 픽셀 단위로 살짝 띄우기
-        fig.add_annotation(x=V[0,0], y=V[0,1], text="A", showarrow=False,
-                           font=dict(size=14), xshift=-14, yshift=-12)
-        fig.add_annotation(x=V[1,0], y=V[1,1], text="B", showarrow=False,
-                           font=dict(size=14), xshift=14, yshift=-12)
-        fig.add_annotation(x=V[2,0], y=V[2,1], text="C", showarrow=False,
-                           font=dict(size=14), yshift=14)
-
-    fig.add_scattergl(
-        x=pts[:, 0], y=pts[:, 1],
-        mode="markers",
-        marker=dict(size=sz, opacity=0.9),
-        showlegend=False
-    )
-    fig.update_yaxes(scaleanchor="x", scaleratio=1)
-    fig.update_layout(
-        title=f"시에르핀스키 삼각형 — 현재 점 개수: {target:,} / 최대 {Nmax:,}",
-        margin=dict(l=10, r=10, t=40, b=10),
-        xaxis=dict(visible=False), yaxis=dict(visible=False),
-        dragmode="pan",
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    title = f"시에르핀스키 삼각형 — 현재 점 개수: {target:,} / 최대 {Nmax:,}"
+    if target > _SCATTER_MAX:
+        # 점이 많으면 Plotly JSON 대신 밀도 래스터 PNG(로그 음영) 한 장만 전송
+        raster = _raster()
+        overlay = polygon_overlay(_V, ("A", "B", "C")) if st.session_state[K_TRI_ON] else None
+        st.markdown(f"**{title}**")
+        st.image(raster.to_png(dot=sz, overlay=overlay), use_container_width=True)
+        st.caption("점이 많아 밀도(로그 음영)로 표시합니다. 진할수록 점이 많이 모인 곳입니다.")
+    else:
+        _render_scatter(st.session_state[K_PTS][:target], sz, title)
 
     st.progress(target / Nmax if Nmax > 0 else 0.0, text=f"{target:,} / {Nmax:,}")
 
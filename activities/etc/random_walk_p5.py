@@ -1,6 +1,7 @@
 # activities/probability/random_walk_p5.py
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title": "랜덤워크",
@@ -12,12 +13,12 @@ META = {
 def render():
     st.markdown("### 2D 랜덤워크")
     components.html(
-        """
+        vendor_html("""
 <!doctype html>
 <html>
 <head>
   <meta charset="utf-8">
-  <script src="https://cdn.jsdelivr.net/npm/p5@1.9.0/lib/p5.min.js"></script>
+  <script src="vendor:p5/p5.min.js"></script>
   <style>
     body{margin:0}
     #wrap{max-width:1100px;margin:0 auto;padding:8px 10px 14px}
@@ -195,7 +196,7 @@ new p5(sketch, document.body);
 </script>
 </body>
 </html>
-        """,
+        """),
         height=720,
         scrolling=True,
     )
@@ -1,11 +1,11 @@
 """설문 관리 대시보드 — 관리자 전용"""
+import numpy as np
 import streamlit as st
 import pandas as pd
 from survey_research_utils import (
     SHEET_PRE, SHEET_POST, PRE_HEADER, POST_HEADER,
-    get_config, set_config,
+    get_config, set_config, get_responses,
     current_user, is_admin,
-    _get_spreadsheet, _get_or_create_ws,
 )
 
 META = {
@@ -56,17 +56,23 @@ QUESTION_LABELS: dict[str, str] = {
     "[I]수업2": "I-2. 앞으로도 이와 같은 디지털 탐구 활동이 수업에 포함되었으면 한다.",
 }
 
-# ── 시트 전체 로드 ─────────────────────────────────────────────────────────────
-@st.cache_data(ttl=30, show_spinner=False)
-def _load_sheet(sheet_name: str, _bust: int = 0) -> pd.DataFrame:
+# 리커트 문항 (서술형 J 제외)
+_LIKERT_PRE  = [c for c in PRE_HEADER[4:]  if not c.startswith("[J]")]
+_LIKERT_POST = [c for c in POST_HEADER[4:] if not c.startswith("[J]")]
+# 공통 리커트 문항 (사전·사후에 동일하게 존재하는 열)
+_COMMON_LIKERT = [
+    "[A]흥미1", "[A]흥미2",
+    "[B]효능1", "[B]효능2",
+    "[C]불안1", "[C]불안2",
+    "[D]ICT1",  "[D]ICT2",
+    "[E]시각1", "[E]시각2",
+    "[F]학습1", "[F]학습2",
+]
+
+# ── 응답 로드 (공용 저장소에서 새로 추가된 행만 읽어 이어 붙임) ───────────────
+def _load_sheet(sheet_name: str, reload: bool = False) -> pd.DataFrame:
     try:
-        sh = _get_spreadsheet()
-        if sh is None:
-            return pd.DataFrame()
-        header = PRE_HEADER if sheet_name == SHEET_PRE else POST_HEADER
-        ws = _get_or_create_ws(sh, sheet_name, header)
-        records = ws.get_all_records(numericise_ignore=["all"])
-        return pd.DataFrame(records) if records else pd.DataFrame(columns=header)
+        return get_responses(sheet_name, reload=reload)
     except Exception as e:
         st.error(f"데이터 로드 실패: {e}")
         return pd.DataFrame()
@@ -80,33 +86,105 @@ def _score_col(col: str) -> float | None:
         return None
 
 
-def _add_score_cols(df: pd.DataFrame, likert_cols: list[str]) -> pd.DataFrame:
-    """리커트 문항을 숫자형 열로 추가."""
-    for col in likert_cols:
-        if col in df.columns:
-            df[col + "_점수"] = df[col].apply(_score_col)
-    return df
-
-
-def _render_stats(df: pd.DataFrame, likert_cols: list[str], label: str):
+def _score_matrix(df: pd.DataFrame, likert_cols: list[str]) -> np.ndarray:
+    """리커트 문항들을 (응답 수 × 문항 수) 점수 행렬로 변환.
+    전체 값을 범주 코드로 바꾼 뒤 고유값(보통 5~6개)만 _score_col로 해석합니다."""
+    if not likert_cols:
+        return np.empty((len(df), 0))
+    codes, uniques = pd.factorize(df[likert_cols].astype(str).to_numpy().ravel())
+    lut = np.array([_score_col(u) for u in uniques], dtype=float)
+    return lut[codes].reshape(len(df), len(likert_cols))
+
+
+# ── 응답 분석 계층: 응답 프레임당 1회 수치화, (학년, 학급) 필터별 통계 캐시 ───
+class _Cohort:
+    def __init__(self, df: pd.DataFrame, likert_cols: list[str]):
+        self.df = df
+        n = len(df)
+        self.cols = [c for c in likert_cols if c in df.columns]
+        self.scores = _score_matrix(df, self.cols)
+        self.ids = (df["학번"].astype(str).str.strip().to_numpy()
+                    if "학번" in df.columns else np.full(n, "", dtype=object))
+        grade = df["학년"].astype(str).to_numpy() if "학년" in df.columns else np.full(n, "", dtype=object)
+        klass = df["학급"].astype(str).to_numpy() if "학급" in df.columns else np.full(n, "", dtype=object)
+
+        # (학년, 학급) 그룹별 점수 합·응답 수 → 어떤 필터 조합이든 그룹 합산으로 평균 계산
+        self.group_of_row, groups = pd.factorize(pd.Series(grade) + "\x1f" + pd.Series(klass))
+        pairs = [g.split("\x1f", 1) for g in groups]
+        self.group_grade = np.array([p[0] for p in pairs], dtype=object)
+        self.group_class = np.array([p[1] for p in pairs], dtype=object)
+        valid = ~np.isnan(self.scores)
+        self.group_sum = np.zeros((len(groups), len(self.cols)))
+        self.group_cnt = np.zeros((len(groups), len(self.cols)))
+        np.add.at(self.group_sum, self.group_of_row, np.where(valid, self.scores, 0.0))
+        np.add.at(self.group_cnt, self.group_of_row, valid)
+        self._stats: dict[tuple, tuple[np.ndarray, pd.Series]] = {}
+
+    def select(self, grades: list, classes: list) -> tuple[np.ndarray, pd.Series]:
+        """필터에 해당하는 (행 마스크, 문항별 평균). 빈 선택은 '전체'로 취급."""
+        key = (frozenset(map(str, grades)), frozenset(map(str, classes)))
+        hit = self._stats.get(key)
+        if hit is not None:
+            return hit
+        sel = np.ones(len(self.group_grade), dtype=bool)
+        if grades:
+            sel &= np.isin(self.group_grade, list(key[0]))
+        if classes:
+            sel &= np.isin(self.group_class, list(key[1]))
+        mask = sel[self.group_of_row] if len(self.group_of_row) else np.zeros(0, dtype=bool)
+        cnt = self.group_cnt[sel].sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(cnt > 0, self.group_sum[sel].sum(axis=0) / cnt, np.nan)
+        self._stats[key] = (mask, pd.Series(means, index=self.cols))
+        return self._stats[key]
+
+    def by_id(self, cols: list[str]) -> pd.DataFrame:
+        """학번 인덱스 점수 표(중복 제출은 마지막 응답 사용)."""
+        idx = [self.cols.index(c) for c in cols]
+        out = pd.DataFrame(self.scores[:, idx], index=self.ids, columns=cols)
+        return out[~out.index.duplicated(keep="last")]
+
+
+_COHORT_CACHE_SIZE = 4
+_cohorts: dict[tuple, _Cohort] = {}
+
+
+def _get_cohort(df: pd.DataFrame, likert_cols: list[str]) -> _Cohort:
+    """응답 프레임이 바뀔 때(새 행 추가 → 새 객체)만 다시 수치화."""
+    key = (id(df), tuple(likert_cols))
+    c = _cohorts.get(key)
+    if c is None or c.df is not df:
+        if len(_cohorts) >= _COHORT_CACHE_SIZE:
+            _cohorts.pop(next(iter(_cohorts)))
+        c = _cohorts[key] = _Cohort(df, likert_cols)
+    return c
+
+
+def _paired_deltas(pre: _Cohort, post: _Cohort, cols: list[str]) -> tuple[int, pd.DataFrame]:
+    """사전·사후 모두 응답한 학생의 문항별 평균과 개인별 변화량 평균(벡터 연산)."""
+    cols = [c for c in cols if c in pre.cols and c in post.cols]
+    a, b = pre.by_id(cols), post.by_id(cols)
+    common = a.index.intersection(b.index)
+    common = common[common != ""]
+    a, b = a.loc[common], b.loc[common]
+    out = pd.DataFrame({
+        "문항":              [QUESTION_LABELS.get(c, c) for c in cols],
+        "사전 평균":         a.mean().round(2).to_numpy(),
+        "사후 평균":         b.mean().round(2).to_numpy(),
+        "변화량 (사후-사전)": (b - a).mean().round(2).to_numpy(),
+    })
+    return len(common), out
+
+
+def _render_stats(cohort: _Cohort, means: pd.Series, label: str):
     """카테고리별 평균 점수 표와 막대 차트."""
-    if df.empty:
-        st.info("응답 데이터가 없습니다.")
-        return
-
-    df2 = _add_score_cols(df.copy(), likert_cols)
-    score_cols = [c + "_점수" for c in likert_cols if c in df.columns]
-
-    if not score_cols:
+    if not cohort.cols:
         st.info("집계할 점수 열이 없습니다.")
         return
 
-    means = df2[score_cols].mean()
+    means = means.copy()
     # 키를 전체 질문 텍스트로 변환
-    means.index = [
-        QUESTION_LABELS.get(c.replace("_점수", ""), c.replace("_점수", ""))
-        for c in means.index
-    ]
+    means.index = [QUESTION_LABELS.get(c, c) for c in means.index]
 
     means_df = means.reset_index()
     means_df.columns = ["문항", "평균 점수"]
@@ -118,12 +196,11 @@ def _render_stats(df: pd.DataFrame, likert_cols: list[str], label: str):
 
 
 # ── 학년/학급 필터 ─────────────────────────────────────────────────────────────
-def _filter_df(df: pd.DataFrame, key_prefix: str = "pre") -> pd.DataFrame:
-    if df.empty:
-        return df
-
-    grades  = sorted(df["학년"].dropna().unique().tolist()) if "학년" in df.columns else []
-    classes = sorted(df["학급"].dropna().unique().tolist()) if "학급" in df.columns else []
+def _filter_df(cohort: _Cohort, key_prefix: str = "pre") -> tuple[pd.DataFrame, pd.Series]:
+    """필터 위젯을 그리고 (필터된 응답, 문항별 평균)을 반환."""
+    df = cohort.df
+    grades  = sorted(set(cohort.group_grade)) if "학년" in df.columns else []
+    classes = sorted(set(cohort.group_class)) if "학급" in df.columns else []
 
     col1, col2 = st.columns(2)
     with col1:
@@ -131,13 +208,8 @@ def _filter_df(df: pd.DataFrame, key_prefix: str = "pre") -> pd.DataFrame:
     with col2:
         sel_class = st.multiselect("학급 필터", options=classes, default=classes, key=f"_adm_class_{key_prefix}")
 
-    mask = pd.Series([True] * len(df), index=df.index)
-    if sel_grade and "학년" in df.columns:
-        mask &= df["학년"].astype(str).isin([str(g) for g in sel_grade])
-    if sel_class and "학급" in df.columns:
-        mask &= df["학급"].astype(str).isin([str(c) for c in sel_class])
-
-    return df[mask]
+    mask, means = cohort.select(sel_grade, sel_class)
+    return df[mask], means
 
 
 # ── CSV 다운로드 버튼 ──────────────────────────────────────────────────────────
@@ -230,15 +302,12 @@ def render():
     # ════════════════════════════════════════════════════════════════════════
     # 섹션 2: 데이터 로드
     # ════════════════════════════════════════════════════════════════════════
-    bust = st.session_state.get("_adm_bust", 0)
-    if st.button("🔁 데이터 새로고침"):
-        st.session_state["_adm_bust"] = bust + 1
-        st.cache_data.clear()
-        st.rerun()
+    # 기본은 증분 로드(새 행만), 버튼을 누르면 시트 전체를 다시 읽음
+    reload = st.button("🔁 데이터 새로고침")
 
     with st.spinner("데이터 불러오는 중..."):
-        pre_df  = _load_sheet(SHEET_PRE,  bust)
-        post_df = _load_sheet(SHEET_POST, bust)
+        pre_df  = _load_sheet(SHEET_PRE,  reload)
+        post_df = _load_sheet(SHEET_POST, reload)
 
     _render_response_summary(pre_df, post_df)
     st.markdown("---")
@@ -251,11 +320,11 @@ def render():
             st.info("사전 설문 응답이 없습니다.")
         else:
             st.markdown(f"총 **{len(pre_df)}명** 응답")
-            filtered_pre = _filter_df(pre_df, key_prefix="pre")
+            pre_cohort = _get_cohort(pre_df, _LIKERT_PRE)
+            filtered_pre, pre_means = _filter_df(pre_cohort, key_prefix="pre")
             st.markdown(f"필터 적용 후: **{len(filtered_pre)}명**")
 
-            likert_pre = [c for c in PRE_HEADER[4:] if not c.startswith("[J]")]
-            _render_stats(filtered_pre, likert_pre, "사전 설문")
+            _render_stats(pre_cohort, pre_means, "사전 설문")
 
             with st.expander("원시 데이터 보기"):
                 st.dataframe(filtered_pre, use_container_width=True, hide_index=True)
@@ -271,11 +340,11 @@ def render():
             st.info("사후 설문 응답이 없습니다.")
         else:
             st.markdown(f"총 **{len(post_df)}명** 응답")
-            filtered_post = _filter_df(post_df, key_prefix="post")
+            post_cohort = _get_cohort(post_df, _LIKERT_POST)
+            filtered_post, post_means = _filter_df(post_cohort, key_prefix="post")
             st.markdown(f"필터 적용 후: **{len(filtered_post)}명**")
 
-            likert_post = [c for c in POST_HEADER[4:] if not c.startswith("[J]")]
-            _render_stats(filtered_post, likert_post, "사후 설문")
+            _render_stats(post_cohort, post_means, "사후 설문")
 
             with st.expander("원시 데이터 보기"):
                 st.dataframe(filtered_post, use_container_width=True, hide_index=True)
@@ -290,41 +359,14 @@ def render():
         if pre_df.empty or post_df.empty:
             st.info("사전·사후 설문 응답이 모두 있어야 비교가 가능합니다.")
         else:
-            common_ids = set(pre_df["학번"].astype(str)) & set(post_df["학번"].astype(str))
-            st.markdown(f"사전·사후 **모두 응답한 학생 수: {len(common_ids)}명**")
-
-            if common_ids:
-                # 공통 리커트 문항 (사전·사후에 동일하게 존재하는 열)
-                common_likert = [
-                    "[A]흥미1", "[A]흥미2",
-                    "[B]효능1", "[B]효능2",
-                    "[C]불안1", "[C]불안2",
-                    "[D]ICT1",  "[D]ICT2",
-                    "[E]시각1", "[E]시각2",
-                    "[F]학습1", "[F]학습2",
-                ]
-
-                pre_sub  = pre_df[pre_df["학번"].astype(str).isin(common_ids)]
-                post_sub = post_df[post_df["학번"].astype(str).isin(common_ids)]
-
-                rows = []
-                for col in common_likert:
-                    if col not in pre_sub.columns or col not in post_sub.columns:
-                        continue
-                    pre_mean  = pre_sub[col].apply(_score_col).mean()
-                    post_mean = post_sub[col].apply(_score_col).mean()
-                    diff      = (post_mean - pre_mean) if (pre_mean and post_mean) else None
-                    rows.append({
-                        "문항": QUESTION_LABELS.get(col, col),
-                        "사전 평균": round(pre_mean, 2) if pre_mean else "-",
-                        "사후 평균": round(post_mean, 2) if post_mean else "-",
-                        "변화량 (사후-사전)": round(diff, 2) if diff is not None else "-",
-                    })
-
-                if rows:
-                    cmp_df = pd.DataFrame(rows)
-                    st.dataframe(cmp_df, use_container_width=True, hide_index=True)
-                    _download_btn(cmp_df, "pre_post_comparison.csv")
+            n_common, cmp_df = _paired_deltas(
+                _get_cohort(pre_df, _LIKERT_PRE), _get_cohort(post_df, _LIKERT_POST), _COMMON_LIKERT
+            )
+            st.markdown(f"사전·사후 **모두 응답한 학생 수: {n_common}명**")
+
+            if n_common and not cmp_df.empty:
+                st.dataframe(cmp_df, use_container_width=True, hide_index=True)
+                _download_btn(cmp_df, "pre_post_comparison.csv")
 
     # ════════════════════════════════════════════════════════════════════════
     # 섹션 6: 서술형 응답 (사후)
@@ -342,9 +384,9 @@ def render():
                 if q_col in post_df.columns:
                     st.markdown(f"**{q_label}**")
                     answers_only = post_df[post_df[q_col].astype(str).str.strip() != ""]
-                    for _, row in answers_only.iterrows():
-                        st.markdown(
-                            f"> {row.get('학년', '?')}학년 {row.get('학급', '?')}반 — "
-                            f"{row[q_col]}"
-                        )
+                    if not answers_only.empty:
+                        grade = answers_only["학년"].astype(str) if "학년" in answers_only.columns else "?"
+                        klass = answers_only["학급"].astype(str) if "학급" in answers_only.columns else "?"
+                        lines = "> " + grade + "학년 " + klass + "반 — " + answers_only[q_col].astype(str)
+                        st.markdown("\n\n".join(lines))
                     st.markdown("")
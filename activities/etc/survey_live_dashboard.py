@@ -1,29 +1,30 @@
 # activities/etc/survey_live_dashboard.py
-import time
+import importlib.util
+import io
 import re
 import urllib.parse
+from datetime import datetime, timezone, timedelta
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
+from lazy_utils import lazy_from
 
 from survey_utils import (
-    load_csv_live, make_csv_export_url, parse_mcq_series,
-    basic_tokenize_korean, top_n_tokens
+    load_csv_shared, make_csv_export_url,
+    get_row_counter, cached_wordcloud,
 )
 
+_KST = timezone(timedelta(hours=9))
+
 META = {
     "title": "실시간 설문 대시보드",
     "description": "구글폼→시트 URL만 붙여넣으면 CSV로 자동 변환해 실시간 시각화",
     "order": 10,
 }
 
-# 워드클라우드(선택)
-WC_AVAILABLE = True
-try:
-    import matplotlib.pyplot as plt
-    from wordcloud import WordCloud
-except Exception:
-    WC_AVAILABLE = False
+# 워드클라우드(선택) — matplotlib까지 끌어오므로 실제로 그릴 때만 import
+WC_AVAILABLE = importlib.util.find_spec("wordcloud") is not None
+WordCloud = lazy_from("wordcloud", "WordCloud")
 
 
 def _auto_refresh(seconds: int, key: str = "auto_refresh_survey"):
@@ -153,27 +154,23 @@ def render():
     if final_url and refresh_sec > 0:
         _auto_refresh(refresh_sec, key="auto_refresh_survey")
 
-    # bust 값 계산: 자동 주기 + 수동 버튼
+    # 수동 갱신 횟수(표시용)
     if "_survey_force_bust" not in st.session_state:
         st.session_state["_survey_force_bust"] = 0
     if force:
         st.session_state["_survey_force_bust"] += 1
 
-    # 자동 주기에 따른 bust(초 단위로 구간화해서 매 주기마다 값 변경)
-    auto_bust = int(time.time() // max(1, refresh_sec)) if refresh_sec > 0 else 0
-    bust_val = auto_bust + st.session_state["_survey_force_bust"]
-
-    @st.cache_data(show_spinner=False)
-    def _load(url: str, bust: int) -> pd.DataFrame:
-        # bust가 함수 인자로 들어가므로, 값이 바뀔 때마다 캐시가 무효화됩니다.
-        return load_csv_live(url, cache_bust=bust)
-
     if not final_url:
         st.info("좌측에서 **PC/모바일 URL**을 입력하고, 필요 시 **탭 이름 또는 gid**를 채워주세요.")
         return
 
+    # 모든 접속자가 URL당 공유 사본 1개를 사용(원격 요청은 공유 타이머 주기로 1회)
     try:
-        df = _load(final_url, bust_val)
+        df, feed_meta = load_csv_shared(
+            final_url,
+            max_age=refresh_sec if refresh_sec > 0 else None,
+            force=force,
+        )
     except Exception as e:
         st.error(f"CSV를 불러오는 중 오류: {e}")
         return
@@ -186,6 +183,9 @@ def render():
         f"행 {len(df):,}개, 열 {len(df.columns)}개 로드됨 "
         f"(자동 새로고침: {refresh_sec}s, 강제갱신: {st.session_state['_survey_force_bust']})"
     )
+    if feed_meta.get("changed_at"):
+        changed = datetime.fromtimestamp(feed_meta["changed_at"], _KST).strftime("%H:%M:%S")
+        st.caption(f"마지막 변경 {changed} · 원격 확인 {feed_meta['fetch_count']}회 / 파싱 {feed_meta['parse_count']}회")
     if show_raw:
         st.dataframe(df, use_container_width=True)
 
@@ -198,7 +198,9 @@ def render():
             col_mcq = st.selectbox("질문(객관식/체크박스 열 선택)", options=cols)
             normalize = st.checkbox("백분율(%)로 보기", True)
             if col_mcq:
-                counts = parse_mcq_series(df[col_mcq])
+                mcq_counter = get_row_counter(feed_meta.get("url", final_url), col_mcq, kind="mcq")
+                mcq_counter.update(df[col_mcq])
+                counts = mcq_counter.counts()
                 if counts:
                     s = pd.Series(counts).sort_values(ascending=False)
                     if normalize:
@@ -218,9 +220,10 @@ def render():
             user_stop = st.text_area("제외할 단어(쉼표로 구분)", "입니다, 그리고, 또는, 정말")
             stopwords = [w.strip() for w in user_stop.split(",") if w.strip()]
 
-            texts = df[col_text].dropna().astype(str).tolist()
-            tokens = basic_tokenize_korean(texts)
-            top_tokens = top_n_tokens(tokens, n=50, stopwords=stopwords)
+            # 새로 들어온(바뀐) 행만 토큰화, 불용어는 조회 시점에 제외
+            text_counter = get_row_counter(feed_meta.get("url", final_url), col_text, kind="text")
+            text_counter.update(df[col_text])
+            top_tokens = text_counter.top(50, stopwords=stopwords)
 
             if top_tokens:
                 st.write("상위 단어")
@@ -231,17 +234,26 @@ def render():
             else:
                 st.info("표시할 단어가 없습니다.")
 
-            if WC_AVAILABLE and tokens:
+            if WC_AVAILABLE and top_tokens:
                 FONT_PATH = "assets/NanumGothic.ttf"  # 프로젝트에 폰트 파일을 두고 경로를 맞추세요.
-                try:
+                freqs = dict(text_counter.top(max_words, stopwords=stopwords))
+
+                def _render_wc(f: dict) -> bytes:
                     wc = WordCloud(
                         width=900, height=500, background_color="white",
                         font_path=FONT_PATH, max_words=max_words,
-                    ).generate(" ".join(tokens))
-                    fig = plt.figure(figsize=(9, 5))
-                    plt.imshow(wc, interpolation="bilinear")
-                    plt.axis("off")
-                    st.pyplot(fig, use_container_width=True)
+                    ).generate_from_frequencies(f)
+                    buf = io.BytesIO()
+                    wc.to_image().save(buf, format="PNG")
+                    return buf.getvalue()
+
+                try:
+                    # 빈도 분포가 의미 있게 바뀌었을 때만 다시 그림(접속자 공용 캐시)
+                    png = cached_wordcloud(
+                        (feed_meta.get("url", final_url), col_text, max_words, tuple(sorted(stopwords))),
+                        freqs, _render_wc,
+                    )
+                    st.image(png, use_container_width=True)
                 except Exception as e:
                     st.warning(f"워드클라우드를 표시하려면 한글 폰트(.ttf)가 필요합니다. 오류: {e}")
             elif not WC_AVAILABLE:
@@ -361,18 +361,28 @@ function renderCloud(total) {
   const warmup = 20;
   const counts = { L: 0, T: 0, R: 0 };
 
+  // 점 좌표를 주소별 버퍼에 모은 뒤 색마다 한 번씩 그림(점마다 fillStyle을 바꾸지 않음)
+  const buf = { L: new Float32Array(2 * total), T: new Float32Array(2 * total), R: new Float32Array(2 * total) };
+  let px = p.x, py = p.y;
   for (let i = 0; i < total + warmup; i++) {
     const r = rand();
     let ch = 'L';
     if (r >= 1/3 && r < 2/3) ch = 'T';
     if (r >= 2/3) ch = 'R';
-    p = midpoint(p, V[ch]);
+    const v = V[ch];
+    px = (px + v.x) / 2; py = (py + v.y) / 2;
     if (i >= warmup) {
-      counts[ch] += 1;
-      ctx.fillStyle = ch === 'L' ? 'rgba(245,158,11,0.72)' : ch === 'T' ? 'rgba(56,189,248,0.72)' : 'rgba(244,63,94,0.72)';
-      ctx.fillRect(p.x, p.y, total >= 5000 ? 1.4 : 2.2, total >= 5000 ? 1.4 : 2.2);
+      const k = 2 * counts[ch]++;
+      buf[ch][k] = px; buf[ch][k + 1] = py;
     }
   }
+  const dot = total >= 5000 ? 1.4 : 2.2;
+  const colors = { L: 'rgba(245,158,11,0.72)', T: 'rgba(56,189,248,0.72)', R: 'rgba(244,63,94,0.72)' };
+  for (const ch of ['L', 'T', 'R']) {
+    ctx.fillStyle = colors[ch];
+    const b = buf[ch], n = 2 * counts[ch];
+    for (let k = 0; k < n; k += 2) ctx.fillRect(b[k], b[k + 1], dot, dot);
+  }
 
   ctx.fillStyle = '#f59e0b'; ctx.beginPath(); ctx.arc(L.x, L.y, 6, 0, Math.PI*2); ctx.fill();
   ctx.fillStyle = '#38bdf8'; ctx.beginPath(); ctx.arc(T.x, T.y, 6, 0, Math.PI*2); ctx.fill();
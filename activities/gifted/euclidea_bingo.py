@@ -68,16 +68,18 @@ import streamlit.components.v1 as components
 import json as _json
 import importlib.util as _ilu, os as _os
 
+from template_utils import cached_html
+
+
 # ── 커스텀 작도 캔버스 모듈 로드 ──────────────────────────────
-_canvas_spec = _ilu.spec_from_file_location(
-    "_geo_canvas",
-    _os.path.join(_os.path.dirname(__file__), "_geo_canvas.py"))
-_canvas_mod = _ilu.module_from_spec(_canvas_spec)
-_canvas_spec.loader.exec_module(_canvas_mod)
-_GEO_CSS          = _canvas_mod.GEO_CSS
-_GEO_HTML         = _canvas_mod.GEO_HTML
-_GEO_JS_TEMPLATE  = _canvas_mod.GEO_JS_TEMPLATE
-_CANVAS_PROBLEMS  = _canvas_mod.PROBLEMS_CONFIG
+# 캔버스 모듈(~70KB)은 템플릿 캐시 미스일 때만 읽어 조립합니다.
+def _load_canvas_module():
+    spec = _ilu.spec_from_file_location(
+        "_geo_canvas",
+        _os.path.join(_os.path.dirname(__file__), "_geo_canvas.py"))
+    mod = _ilu.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
 
 _TEMPLATE = r"""<!doctype html>
 <html lang="ko">
@@ -946,6 +948,21 @@ __GEO_JS__
 """
 
 
+def _build_html(is_teacher: bool) -> str:
+    canvas = _load_canvas_module()
+    _geo_js = canvas.GEO_JS_TEMPLATE.replace(
+        "__CANVAS_PROBLEMS__", _json.dumps(canvas.PROBLEMS_CONFIG))
+
+    return (_TEMPLATE
+        .replace("__IS_TEACHER__",    "true" if is_teacher else "false")
+        .replace("__FIREBASE_DB_URL__", FIREBASE_DB_URL)
+        .replace("__GEOGEBRA_CALC_URLS__", _json.dumps(GEOGEBRA_CALC_URLS))
+        .replace("__GEOGEBRA_URLS__", _json.dumps(GEOGEBRA_URLS))
+        .replace("__GEO_CSS__",  canvas.GEO_CSS)
+        .replace("__GEO_HTML__", canvas.GEO_HTML)
+        .replace("__GEO_JS__",   _geo_js))
+
+
 def render():
     import streamlit as st
 
@@ -953,17 +970,7 @@ def render():
     dev_mode  = st.session_state.get("_dev_mode", False)
     is_teacher = (user_type == "admin") or dev_mode
 
-    _geo_js = _GEO_JS_TEMPLATE.replace(
-        "__CANVAS_PROBLEMS__", _json.dumps(_CANVAS_PROBLEMS))
-
-    html = (_TEMPLATE
-        .replace("__IS_TEACHER__",    "true" if is_teacher else "false")
-        .replace("__FIREBASE_DB_URL__", FIREBASE_DB_URL)
-        .replace("__GEOGEBRA_CALC_URLS__", _json.dumps(GEOGEBRA_CALC_URLS))
-        .replace("__GEOGEBRA_URLS__", _json.dumps(GEOGEBRA_URLS))
-        .replace("__GEO_CSS__",  _GEO_CSS)
-        .replace("__GEO_HTML__", _GEO_HTML)
-        .replace("__GEO_JS__",   _geo_js))
+    html = cached_html("euclidea_bingo", _build_html, is_teacher)
 
     st.header("🎯 작도 게임(빙고)")
     if not is_teacher:
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from galton_utils import render_galton_player
 
 META = {
     "title": "미니: 갈톤보드 시뮬레이션",
@@ -544,6 +545,10 @@ def render():
 
     components.html(HTML, height=800, scrolling=False)
 
+    st.subheader("⚡ 대량 재생")
+    st.caption("수만~수십만 개 구슬의 경로를 서버에서 미리 계산해 두고, 원하는 속도로 재생하거나 원하는 시점으로 이동해 봅니다.")
+    render_galton_player("gifted_gb_play", rows=7, max_rows=12)
+
     with st.expander("💡 활동 안내", expanded=False):
         st.markdown(
             """
@@ -5,6 +5,8 @@ import os
 import streamlit as st
 import streamlit.components.v1 as components
 
+from template_utils import cached_html
+
 META = {
     "title": "미니: 등간격 사물 → 화폭에서 조화수열",
     "description": "실제 공간에서 등간격으로 놓인 사물을 화폭에 담으면 화폭에서의 투영 높이가 조화수열을 이루는 원리를 인터랙티브하게 탐구합니다.",
@@ -1860,6 +1862,10 @@ def _make_painting_html(img_b64: str) -> str:
     return _PAINTING_TEMPLATE.replace("__IMAGE_B64__", img_b64)
 
 
+def _build_painting_html(fname: str) -> str:
+    return _make_painting_html(_b64(fname))
+
+
 # ─── render ───────────────────────────────────────────────────────────────────
 
 def render():
@@ -1874,5 +1880,5 @@ def render():
         components.html(_HTML_PROOF, height=1800, scrolling=True)
 
     with tab3:
-        img_b64 = _b64("christ.png")
-        components.html(_make_painting_html(img_b64), height=1400, scrolling=False)
+        html = cached_html("harmonic_painting", _build_painting_html, "christ.png")
+        components.html(html, height=1400, scrolling=False)
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title":       "미니: 파스칼 삼각형에서 찾아보는 프랙털",
@@ -51,7 +52,7 @@ _CANVAS_HTML = """
 <head>
 <meta charset="utf-8"/>
 <meta name="viewport" content="width=device-width,initial-scale=1"/>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.9.0/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <style>
   *{box-sizing:border-box;margin:0;padding:0}
   html,body{background:linear-gradient(135deg,#0a1628 0%,#0f2027 50%,#0a1628 100%);
@@ -374,7 +375,7 @@ def render():
         "아래 시뮬레이터에서 **modulo 값**과 **나머지**를 자유롭게 바꾸며 탐구해보세요!"
     )
 
-    components.html(_CANVAS_HTML, height=1300, scrolling=False)
+    components.html(vendor_html(_CANVAS_HTML), height=1300, scrolling=False)
 
     st.markdown("---")
 
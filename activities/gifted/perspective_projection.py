@@ -4,6 +4,8 @@ import os
 import streamlit as st
 import streamlit.components.v1 as components
 
+from template_utils import cached_html
+
 META = {
     "title": "미니: 실제 사물과 그림 속 사물의 관계식 탐구",
     "description": "눈(E)의 높이 22cm, 화면까지 거리 28cm 조건에서 실제 좌표 A(a,b)와 화면 좌표 A'(a',b') 사이의 관계식을 단계별로 탐구합니다.",
@@ -2333,6 +2335,10 @@ def _b64_arno() -> str:
         return base64.b64encode(f.read()).decode()
 
 
+def _build_html() -> str:
+    return _HTML.replace("PLACEHOLDER_ARNOLFINI", _b64_arno())
+
+
 def render():
     st.header("📐 실제 사물과 그림 속 사물의 관계식 탐구")
     st.caption("눈의 높이 22cm, 화면까지 거리 28cm 조건에서 투영 관계식을 단계별로 탐구합니다.")
@@ -2347,5 +2353,5 @@ def render():
             """
         )
 
-    html = _HTML.replace("PLACEHOLDER_ARNOLFINI", _b64_arno())
+    html = cached_html("perspective_projection", _build_html)
     components.html(html, height=4000, scrolling=True)
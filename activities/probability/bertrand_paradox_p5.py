@@ -1,6 +1,7 @@
 # activities/probability/bertrand_paradox_p5.py
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from utils import page_header
 
 META = {
@@ -24,7 +25,7 @@ def render():
 
     html = r'''
 <div id="bertrand-holder" style="width:100%; position:relative;"></div>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.7.0/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <script>
 let method = 1;                      // 1, 2, 3
 let circleRadius = 200;              // 원 반지름
@@ -287,4 +288,4 @@ function drawEquilateralTriangleWithIncircle(){
 </script>
 '''
     # 높이는 충분히 크게(확률 문구 안 잘리도록)
-    components.html(html, height=820, scrolling=False)
+    components.html(vendor_html(html), height=820, scrolling=False)
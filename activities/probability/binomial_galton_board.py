@@ -1,12 +1,15 @@
 # activities/probability/binomial_galton_board.py
 import time
-from math import comb
 from typing import Optional
 
 import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
 import streamlit.components.v1 as components
+from cache_utils import sim_cache
+from dist_utils import binom_pmf
+from galton_utils import render_galton_player
+from vendor_utils import vendor_html
 
 META = {
     "title": "갈톤보드(이항분포) 시뮬레이터",
@@ -15,6 +18,7 @@ META = {
 }
 
 # ─────────────────────────────────────────────────────────────────────────────
+@sim_cache()
 def _binom_counts(n_rows: int, n_balls: int, p: float, seed: Optional[int] = None) -> np.ndarray:
     rng = np.random.default_rng(seed)
     rights = rng.binomial(n_rows, p, size=n_balls)
@@ -23,9 +27,7 @@ def _binom_counts(n_rows: int, n_balls: int, p: float, seed: Optional[int] = Non
 def _binom_theory(n_rows: int, p: float, total: int) -> np.ndarray:
     if total <= 0:
         return np.zeros(n_rows + 1, dtype=float)
-    k = np.arange(n_rows + 1)
-    pmf = np.array([comb(n_rows, int(i)) * (p ** i) * ((1 - p) ** (n_rows - i)) for i in k], dtype=float)
-    return pmf * total
+    return binom_pmf(n_rows, p) * total
 
 def _plot_hist_with_theory(counts: np.ndarray, theory: np.ndarray) -> go.Figure:
     n_rows = len(counts) - 1
@@ -43,7 +45,8 @@ def _plot_hist_with_theory(counts: np.ndarray, theory: np.ndarray) -> go.Figure:
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
         margin=dict(l=10, r=10, t=10, b=10),
     )
-    fig.update_xaxes(dtick=1)
+    if n_rows <= 40:
+        fig.update_xaxes(dtick=1)
     fig.update_yaxes(range=[0, top])
     return fig
 
@@ -54,7 +57,7 @@ P5_HTML = r"""
 <html>
 <head>
   <meta charset="utf-8" />
-  <script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.7.0/p5.min.js"></script>
+  <script src="vendor:p5/p5.min.js"></script>
   <style>
     body{ margin:0; padding:0; }
     .ui { font: 14px/1.4 system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif; padding: 10px 12px; }
@@ -419,13 +422,14 @@ P5_HTML = r"""
 def render():
     st.header("🎯 갈톤보드(이항분포) 시뮬레이터")
 
-    tab_fast, tab_live = st.tabs(["이항분포", "갈톤보드"])
+    tab_fast, tab_live, tab_play = st.tabs(["이항분포", "갈톤보드", "대량 재생"])
 
     with tab_fast:
-        c1, c2, c3 = st.columns([1.2, 1.2, 1.2])
-        n_rows = c1.slider("핀(충돌) 횟수 n", 3, 20, 12, 1, key="gb_fast_n")
-        n_balls = c2.slider("공의 개수", 50, 50_000, 5_000, step=50, key="gb_fast_b")
+        c1, c2, c3, c4 = st.columns([1.2, 1.2, 1.2, 0.8])
+        n_rows = c1.slider("핀(충돌) 횟수 n", 3, 2000, 12, 1, key="gb_fast_n")
+        n_balls = c2.slider("공의 개수", 50, 10_000_000, 5_000, step=50, key="gb_fast_b")
         p = c3.slider("오른쪽 확률 p", 0.0, 1.0, 0.5, 0.01, key="gb_fast_p")
+        seed = int(c4.number_input("난수 시드(0=랜덤)", min_value=0, value=0, step=1, format="%d", key="gb_fast_seed"))
 
         if "gb_counts" not in st.session_state or st.session_state.get("gb_n_rows") != n_rows:
             st.session_state["gb_counts"] = np.zeros(n_rows + 1, dtype=int)
@@ -434,7 +438,7 @@ def render():
 
         colA, colB = st.columns(2)
         if colA.button("▶ 한 번에 실행"):
-            counts = _binom_counts(n_rows, n_balls, p, None)
+            counts = _binom_counts(n_rows, n_balls, p, None if seed == 0 else seed)
             st.session_state["gb_counts"] = counts
             st.session_state["gb_total"] = int(counts.sum())
 
@@ -449,4 +453,8 @@ def render():
         st.plotly_chart(fig, use_container_width=True)
 
     with tab_live:
-        components.html(P5_HTML, height=720, scrolling=False)
+        components.html(vendor_html(P5_HTML), height=720, scrolling=False)
+
+    with tab_play:
+        st.caption("공의 경로를 서버에서 한 번에 계산해 두고, 브라우저는 원하는 속도로 재생만 합니다(최대 100만 개).")
+        render_galton_player("gb_play", rows=12, max_rows=20)
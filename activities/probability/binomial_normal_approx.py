@@ -2,7 +2,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy.stats import binom, norm
+from dist_utils import binom_interval, binom_pmf, normal_approx_pmf, normal_interval
 
 try:
     from utils import page_header, anchor, scroll_to
@@ -30,12 +30,6 @@ def _ensure_defaults():
 
 def _mark_changed(): st.session_state[JUMP]="graph"
 
-def _normal_pmf_approx(k_vals, mu, sd, cc=True):
-    if cc:
-        lo=(k_vals-0.5-mu)/sd; hi=(k_vals+0.5-mu)/sd
-        return norm.cdf(hi)-norm.cdf(lo)
-    return norm.pdf((k_vals-mu)/sd)*1.0
-
 def render():
     _ensure_defaults()
     page_header("이항분포의 정규 근사","연속성 보정 유무에 따른 비교 및 구간확률 계산",icon="🧮",top_rule=True)
@@ -61,8 +55,8 @@ def render():
 
     anchor("graph")
 
-    pmf = binom.pmf(k,n,p)
-    approx_pmf = _normal_pmf_approx(k,mu,sd,cc=cc)
+    pmf = binom_pmf(n,p)[k_min:k_max+1]
+    approx_pmf = normal_approx_pmf(n,p,cc=cc)[k_min:k_max+1]
 
     # ── 강조 구간 마스크 ──
     if a>b: a,b=b,a
@@ -97,13 +91,8 @@ def render():
     st.plotly_chart(fig, use_container_width=True)
 
     # ---- 구간확률: 정확 vs 근사 ----
-    exact = float(binom.cdf(b_clip,n,p) - (binom.cdf(a_clip-1,n,p) if a_clip>0 else 0.0))
-    if cc:
-        z_hi=(b_clip+0.5-mu)/sd; z_lo=(a_clip-0.5-mu)/sd
-        approx=float(norm.cdf(z_hi)-norm.cdf(z_lo))
-    else:
-        z_hi=(b_clip-mu)/sd; z_lo=(a_clip-mu)/sd
-        approx=float(norm.cdf(z_hi)-norm.cdf(z_lo))
+    exact = binom_interval(n,p,a_clip,b_clip)
+    approx = normal_interval(n,p,a_clip,b_clip,cc=cc)
 
     st.markdown(
         f"**구간확률** P({a_clip} ≤ X ≤ {b_clip})  →  "
@@ -2,7 +2,8 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy.stats import binom
+from cache_utils import sim_cache
+from dist_utils import binom_pmf
 
 try:
     from utils import page_header, anchor, scroll_to
@@ -23,6 +24,7 @@ META = {
 
 # 세션 키
 K_MODE, K_N, K_REPEATS, K_FACE, K_P = "prob_mode", "prob_n", "prob_repeats", "prob_face", "prob_p"
+K_SEED = "prob_seed"
 JUMP_FLAG = "prob_binom_jump"
 
 DEFAULTS = {
@@ -31,6 +33,7 @@ DEFAULTS = {
     K_REPEATS: 3000,
     K_FACE: 6,
     K_P: 0.35,
+    K_SEED: 0,
 }
 
 def _ensure_defaults():
@@ -42,6 +45,12 @@ def _mark_changed():
     # 위젯이 바뀌면 rerun 후 그래프 위치로 점프
     st.session_state[JUMP_FLAG] = "graph"
 
+@sim_cache()
+def _simulate(n: int, p: float, repeats: int, seed):
+    """n회 시행의 성공 횟수를 repeats번. 같은 설정·시드는 세션 간에 한 번만 계산."""
+    rng = np.random.default_rng(seed)
+    return rng.binomial(n=n, p=p, size=repeats)
+
 def render():
     _ensure_defaults()
 
@@ -73,12 +82,16 @@ def render():
                 key=K_P, on_change=_mark_changed
             )
 
+        st.number_input("난수 시드(0=랜덤)", min_value=0, step=1, format="%d",
+                        key=K_SEED, on_change=_mark_changed)
+
     # 현재 설정
     mode    = st.session_state[K_MODE]
     n       = int(st.session_state[K_N])
     repeats = int(st.session_state[K_REPEATS])
     face    = int(st.session_state[K_FACE])
     p_user  = float(st.session_state[K_P])
+    seed    = int(st.session_state[K_SEED])
 
     if mode == "동전 던지기(공정)":
         p_eff, label = 0.5, "앞면(성공)"
@@ -93,15 +106,14 @@ def render():
     st.write(f"**성공 조건:** {label} | **성공확률 p:** {p_eff:.3f}")
 
     # 시뮬레이션
-    rng = np.random.default_rng()
-    sim = rng.binomial(n=n, p=p_eff, size=repeats)
+    sim = _simulate(n, p_eff, repeats, None if seed == 0 else seed)
 
     counts = np.bincount(sim, minlength=n+1)
     k_emp = np.nonzero(counts)[0]
     emp_prob = counts[counts > 0] / repeats
 
     k = np.arange(0, n + 1)
-    theo = binom.pmf(k, n, p_eff)
+    theo = binom_pmf(n, p_eff)
 
     fig = go.Figure()
     fig.add_bar(x=k_emp, y=emp_prob, name="시뮬레이션", opacity=0.7)
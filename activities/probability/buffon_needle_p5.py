@@ -1,6 +1,7 @@
 # activities/probability/buffon_needle_p5.py
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from utils import page_header
 
 META = {
@@ -36,7 +37,7 @@ def render():
     # p5.js 스케치: iframe 내부에서 글로벌 모드로 실행되도록 캡슐화
     html = r'''
     <div id="buffon-holder" style="width:100%;"></div>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.7.0/p5.min.js"></script>
+    <script src="vendor:p5/p5.min.js"></script>
     <script>
     // === 원본 로직을 최대한 유지하면서 반응형/레이아웃만 보완 ===
     let needleInput, spacingInput, lengthInput;
@@ -292,4 +293,4 @@ def render():
     </script>
     '''
 
-    components.html(html, height=580, scrolling=False)
+    components.html(vendor_html(html), height=580, scrolling=False)
@@ -3,7 +3,8 @@ import math
 import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-from scipy.stats import norm
+from lazy_utils import lazy_from
+norm = lazy_from("scipy.stats", "norm")
 
 META = {
     "title": "신뢰구간의 길이",
@@ -8,7 +8,10 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
-from scipy.stats import t, norm  # t-분포, 표준정규 임계값
+from vendor_utils import vendor_html
+from lazy_utils import lazy_from
+t = lazy_from("scipy.stats", "t")  # t-분포, 표준정규 임계값
+norm = lazy_from("scipy.stats", "norm")
 
 META = {
     "title": "신뢰도의 의미",
@@ -202,7 +205,7 @@ def render():
 
     html = """
 <div id="ci_canvas" style="width:100%%;max-width:980px;margin:0 auto;"></div>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.9.0/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <script>
 const DATA = %s;
 new p5((p)=>{
@@ -254,7 +257,7 @@ new p5((p)=>{
 </script>
     """ % (json.dumps(payload), row_h, H)
 
-    components.html(html, height=H)
+    components.html(vendor_html(html), height=H)
 
     col = "#23a559" if contain_cnt >= int(0.01*conf_pct*100) else "#e33c3c"
     st.markdown(
@@ -2,7 +2,10 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy.stats import norm
+from lazy_utils import lazy_from
+from cache_utils import sim_cache
+from sim_utils import sample_means
+norm = lazy_from("scipy.stats", "norm")
 
 # utils
 try:
@@ -33,6 +36,7 @@ K_A      = "clt_unif_a"
 K_B      = "clt_unif_b"
 K_LMBDA  = "clt_exp_lambda"
 K_P      = "clt_bern_p"
+K_SEED   = "clt_seed"
 JUMP     = "clt_jump"
 
 # ---- 기본값 ----
@@ -47,6 +51,7 @@ DEFAULTS = {
     K_B:     1.0,
     K_LMBDA: 1.0,
     K_P:     0.3,
+    K_SEED:  0,
 }
 
 def _ensure_defaults():
@@ -84,6 +89,11 @@ def _on_unif_b_change():
     if st.session_state[K_B] <= st.session_state[K_A]:
         st.session_state[K_B] = float(st.session_state[K_A]) + 0.1
 
+@sim_cache()
+def _sample_means(dist: str, params_items: tuple, n: int, m: int, seed):
+    """같은 분포·모수·n·M·시드의 표본평균은 세션 간에 한 번만 계산."""
+    return sample_means(dist, dict(params_items), n, m, seed)
+
 def _draw_hist_with_normal(x, mu, sigma, bins, title):
     hist_y, hist_x = np.histogram(x, bins=bins, density=True)
     centers = 0.5 * (hist_x[:-1] + hist_x[1:])
@@ -106,9 +116,10 @@ def render():
         # 분포 선택: 바뀌면 모수 기본값으로 리셋
         st.selectbox("모분포", ["정규", "균등", "지수", "베르누이"], key=K_DIST, on_change=_on_dist_change)
 
-        st.slider("표본 크기 n", 1, 200, key=K_N, on_change=_mark_changed)
-        st.slider("표본 개수 M (시행 수)", 200, 20000, step=200, key=K_M, on_change=_mark_changed)
+        st.slider("표본 크기 n", 1, 1000, key=K_N, on_change=_mark_changed)
+        st.slider("표본 개수 M (시행 수)", 200, 200_000, step=200, key=K_M, on_change=_mark_changed)
         st.slider("히스토그램 구간 수", 10, 120, key=K_BINS, on_change=_mark_changed)
+        st.number_input("난수 시드(0=랜덤)", min_value=0, step=1, format="%d", key=K_SEED, on_change=_mark_changed)
 
         # 분포별 모수(모두 value 없이 key만 사용 → 세션이 단일 원본)
         if st.session_state[K_DIST] == "정규":
@@ -133,13 +144,14 @@ def render():
 
     anchor("graph")
 
-    # ---- 표본평균 생성 & 수식 표기 ----
-    rng = np.random.default_rng()
+    # ---- 표본평균 생성 & 수식 표기 (X̄를 분포에서 직접 뽑음, 균등만 행렬) ----
+    seed = int(st.session_state[K_SEED])
+    seed = None if seed == 0 else seed
 
     if dist == "정규":
         mu = float(st.session_state[K_MU]); sigma = float(st.session_state[K_SIGMA])
         theo_mu, theo_sd = mu, sigma / np.sqrt(n)
-        xbar = rng.normal(mu, sigma, size=(M, n)).mean(axis=1)
+        xbar = _sample_means("정규", (("mu", mu), ("sigma", sigma)), n, M, seed)
         desc = f"모분포: N({mu:.2f}, {sigma:.2f}²)"
         st.markdown("**모분포 PDF**")
         st.latex(rf"f_X(x)=\frac{{1}}{{{sigma:.3f}\sqrt{{2\pi}}}}\exp\!\left(-\frac{{(x-{mu:.3f})^2}}{{2\,{sigma:.3f}^2}}\right)")
@@ -151,7 +163,7 @@ def render():
             st.session_state[K_B] = b
         mu_u, var_u = (a + b) / 2.0, (b - a) ** 2 / 12.0
         theo_mu, theo_sd = mu_u, np.sqrt(var_u / n)
-        xbar = rng.uniform(a, b, size=(M, n)).mean(axis=1)
+        xbar = _sample_means("균등", (("a", a), ("b", b)), n, M, seed)
         desc = f"모분포: U({a:.2f}, {b:.2f})"
         st.markdown("**모분포 PDF**")
         st.latex(rf"f_X(x)=\begin{{cases}}\dfrac{{1}}{{{b:.3f}-{a:.3f}}}, & {a:.3f}\le x\le {b:.3f} \\[4pt] 0, & \text{{else}}\end{{cases}}")
@@ -160,7 +172,7 @@ def render():
         l = float(st.session_state[K_LMBDA])
         mu_e, var_e = 1.0 / l, 1.0 / (l * l)
         theo_mu, theo_sd = mu_e, np.sqrt(var_e / n)
-        xbar = rng.exponential(1.0 / l, size=(M, n)).mean(axis=1)
+        xbar = _sample_means("지수", (("lambda", l),), n, M, seed)
         desc = f"모분포: Exp(λ={l:.2f})"
         st.markdown("**모분포 PDF**")
         st.latex(rf"f_X(x)={l:.3f}\,e^{{-{l:.3f}x}},\quad x\ge 0")
@@ -169,7 +181,7 @@ def render():
         p = float(st.session_state[K_P])
         mu_b, var_b = p, p * (1 - p)
         theo_mu, theo_sd = mu_b, np.sqrt(var_b / n)
-        xbar = rng.binomial(n=n, p=p, size=M) / n
+        xbar = _sample_means("베르누이", (("p", p),), n, M, seed)
         desc = f"모분포: Bernoulli(p={p:.2f})"
         st.markdown("**모분포 PMF**")
         st.latex(rf"P(X=k)={p:.3f}^k(1-{p:.3f})^{{1-k}},\quad k\in\{{0,1\}}")
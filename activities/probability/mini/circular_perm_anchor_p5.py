@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title": "원순열: 한 자리(한 사람) 고정하면 (n−1)!",
@@ -23,12 +24,12 @@ def render():
     st.latex(r"\text{서로 다른 원배치 수} \;=\; \frac{n!}{n}\;=\;(n-1)!")
 
     components.html(
-        """
+        vendor_html("""
 <!doctype html>
 <html>
 <head>
   <meta charset="utf-8"/>
-  <script src="https://cdn.jsdelivr.net/npm/p5@1.9.0/lib/p5.min.js"></script>
+  <script src="vendor:p5/p5.min.js"></script>
   <style>
     :root { --fg:#0f172a; --muted:#64748b; --ink:#111827;}
     body{margin:0;font-family:system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial;}
@@ -315,7 +316,7 @@ function byId(id){ return document.getElementById(id); }
 </script>
 </body>
 </html>
-        """,
+        """),
         height=720,
     )
 
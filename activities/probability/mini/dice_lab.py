@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title": "미니: 주사위 실험(애니메이션)",
@@ -112,7 +113,7 @@ HTML = """
 </div>
 
 <!-- p5.js -->
-<script src="https://cdn.jsdelivr.net/npm/p5@1.7.0/lib/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <script>
 (function(){
   const el = (id)=>document.getElementById(id);
@@ -496,7 +497,7 @@ def render():
     st.header("🎲 미니: 주사위 실험(애니메이션)")
     st.caption("주사위를 1개/2개로 굴려 경험확률을 모으고 이론값과 비교합니다. 자동 연속 실행/맞춤 이벤트/히스토그램 제공.")
 
-    components.html(HTML, height=680, scrolling=False)
+    components.html(vendor_html(HTML), height=680, scrolling=False)
 
     with st.expander("수업용 가이드 / 미션", expanded=False):
         st.markdown(
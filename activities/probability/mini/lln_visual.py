@@ -2,7 +2,9 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Tuple
+
+from cache_utils import sim_cache
+from sim_utils import lln_paths
 
 PAGE_META = {
     "title": "큰 수의 법칙 시각화",
@@ -10,20 +12,7 @@ PAGE_META = {
     "icon": "📚",
 }
 
-# --------- 샘플 생성기 ---------
-def sample_generator(dist: str, n: int, params: dict, rng: np.random.Generator) -> np.ndarray:
-    if dist == "베르누이":
-        p = params.get("p", 0.5)
-        return rng.binomial(1, p, size=n).astype(float)
-    elif dist == "정규분포":
-        mu = params.get("mu", 0.0); sigma = max(1e-9, params.get("sigma", 1.0))
-        return rng.normal(mu, sigma, size=n)
-    elif dist == "균등분포[0,1]":
-        return rng.random(n)
-    else:
-        # 안전장치
-        return rng.random(n)
-
+# --------- 이론 평균 ---------
 def true_mean(dist: str, params: dict) -> float:
     if dist == "베르누이":
         return params.get("p", 0.5)
@@ -33,6 +22,11 @@ def true_mean(dist: str, params: dict) -> float:
         return 0.5
     return 0.0
 
+@sim_cache()
+def _simulate(dist: str, params_items: tuple, max_n: int, paths: int, seed: int, eps: float, mu: float):
+    """(분포, 모수, 시드, 크기)별로 한 번만 계산 — 같은 설정의 재실행·다른 학생은 캐시 적중."""
+    return lln_paths(dist, dict(params_items), max_n, paths, seed, eps, mu)
+
 # --------- UI / 메인 렌더 ---------
 def render():
     st.sidebar.subheader("⚙️ 분포 선택 & 파라미터")
@@ -67,20 +61,10 @@ def render():
     )
 
     # --------- 시뮬레이션 ---------
-    rng = np.random.default_rng(int(seed))
-    # 모든 경로에 대해 누적평균 경로를 만든다: shape (paths, max_n)
-    Xbars = np.zeros((paths, max_n), dtype=float)
-    inside = np.zeros((paths, max_n), dtype=bool)
-
-    for k in range(paths):
-        x = sample_generator(dist, max_n, params, rng)
-        csum = np.cumsum(x)
-        xbar = csum / np.arange(1, max_n + 1)
-        Xbars[k, :] = xbar
-        inside[k, :] = np.abs(xbar - mu) < eps
-
-    # n별로 밴드 안에 들어온 경로 비율
-    prop_inside = inside.mean(axis=0)  # length max_n
+    # paths × max_n 행렬을 한 번에(메모리 상한 내 덩어리로) 뽑고,
+    # 비율은 전체 해상도로, 경로 그림은 로그 간격 격자로 줄여서 받는다.
+    res = _simulate(dist, tuple(sorted(params.items())), int(max_n), int(paths), int(seed), float(eps), float(mu))
+    prop_inside = res.prop_inside  # length max_n
 
     # --------- 그림 1: 여러 경로의 표본평균 수렴 모습 ---------
     fig1 = go.Figure()
@@ -90,8 +74,8 @@ def render():
         width = 2 if i < strong else 1
         opacity = 0.9 if i < strong else 0.35
         fig1.add_scatter(
-            x=np.arange(1, max_n + 1),
-            y=Xbars[i],
+            x=res.grid,
+            y=res.xbar[i],
             mode="lines",
             line=dict(width=width),
             opacity=opacity,
@@ -164,7 +148,7 @@ def render():
 
     with st.expander("📎 (선택) 원자료/추가 지표 보기"):
         # 마지막 n에서 경로별 오차 분포
-        err_last = np.abs(Xbars[:, -1] - mu)
+        err_last = np.abs(res.xbar_last - mu)
         st.write(f"마지막 n={max_n}에서 |ȳₙ−μ|의 요약 통계:")
         st.write({
             "평균오차": float(err_last.mean()),
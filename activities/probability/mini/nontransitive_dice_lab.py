@@ -1,8 +1,9 @@
-import json
 import numpy as np
 import pandas as pd
 import streamlit as st
-import streamlit.components.v1 as components
+from cache_utils import sim_cache
+from component_utils import param_component
+from dist_utils import sum_counts
 
 META = {
     "title": "비정규 주사위 대결 실험 (A/B/C 커스텀·6칸 입력)",
@@ -23,10 +24,8 @@ def prob_single_gt(F: list[int], G: list[int]) -> tuple[float, float, float]:
     return gt / tot, lt / tot, eq / tot
 
 def sum_distribution(F: list[int]) -> dict[int, int]:
-    A = np.array(F)
-    sums = (A[:, None] + A[None, :]).ravel()
-    u, c = np.unique(sums, return_counts=True)
-    return dict(zip(u.tolist(), c.tolist()))
+    sums, counts = sum_counts(F, 2)
+    return dict(zip(sums.tolist(), counts.tolist()))
 
 def prob_double_sum_gt(F: list[int], G: list[int]) -> tuple[float, float, float]:
     import bisect
@@ -51,6 +50,7 @@ def prob_double_sum_gt(F: list[int], G: list[int]) -> tuple[float, float, float]
     lt = total - gt - eq
     return gt / total, lt / total, eq / total
 
+@sim_cache()
 def simulate_vs(F: list[int], G: list[int], trials: int, mode: str = "single", seed: int | None = None) -> tuple[float, float, float]:
     rng = np.random.default_rng(seed)
     m, n = len(F), len(G)
@@ -108,6 +108,138 @@ def six_face_inputs(label: str, defaults: list[int]) -> list[int]:
         return vals
 
 # ─────────────────────────────────────────────────────────────────────────────
+_DICE_HTML = """<div id="wrap" style="width:100%;max-width:900px;margin:0 auto;">
+  <div style="margin:.25rem 0 .5rem 0;">
+    <button id="rollBtn" style="padding:.5rem 1rem;">🎲 ROLL</button>
+    <span id="resultLabel" style="margin-left:12px;font-weight:600;"></span>
+  </div>
+</div>
+<script src="vendor:p5/p5.min.js"></script>
+<script>
+// 면값·대결·모드는 MathLab.onParams로 전달됨 — 바뀌어도 iframe/캔버스는 유지
+let DICE = null;
+function choice(arr) { return arr[Math.floor(Math.random()*arr.length)]; }
+let W=900,H=330, rolling=0, targetL=[], targetR=[], shownL=[], shownR=[];
+MathLab.onParams(function (p) {
+  DICE = p;
+  rolling = 0;
+  resetShown();
+  document.getElementById('resultLabel').textContent = '';
+});
+function setup(){
+  const cnv = createCanvas(W,H);
+  cnv.parent(document.getElementById('wrap'));
+  textFont('Helvetica'); textAlign(CENTER,CENTER);
+  if (DICE) resetShown();
+  document.getElementById('rollBtn').onclick = triggerRoll;
+}
+function resetShown(){
+  shownL = [choice(DICE[DICE.left])];
+  shownR = [choice(DICE[DICE.right])];
+}
+function triggerRoll(){
+  if (!DICE) return;
+  const left = DICE.left, right = DICE.right;
+  if (DICE.mode==='single') {
+    targetL = [choice(DICE[left])];
+    targetR = [choice(DICE[right])];
+  } else {
+    targetL = [choice(DICE[left]), choice(DICE[left])];
+    targetR = [choice(DICE[right]), choice(DICE[right])];
+  }
+  rolling = 22;
+  document.getElementById('resultLabel').textContent = '';
+}
+function draw(){
+  background(255);
+  if (!DICE) return;
+  noStroke();
+  fill(0); textSize(16);
+  text(DICE.left + "  vs  " + DICE.right + "   ("+(DICE.mode==='single'?'1회':'2회합')+")", width/2, 18);
+
+  drawDiePanel(width*0.25-90, 50, shownL, '#1976D2');
+  drawDiePanel(width*0.75-90, 50, shownR, '#C62828');
+
+  if(rolling>0){
+    if (DICE.mode==='single') {
+      shownL = [choice(DICE[DICE.left])];
+      shownR = [choice(DICE[DICE.right])];
+    } else {
+      shownL = [choice(DICE[DICE.left]), choice(DICE[DICE.left])];
+      shownR = [choice(DICE[DICE.right]), choice(DICE[DICE.right])];
+    }
+    rolling--;
+    if(rolling===0){
+      shownL = targetL.slice();
+      shownR = targetR.slice();
+      const sumL = shownL.reduce((a,b)=>a+b,0);
+      const sumR = shownR.reduce((a,b)=>a+b,0);
+      let msg = '';
+      if (sumL>sumR) msg = DICE.left + " 승 ("+sumL+" > "+sumR+")";
+      else if (sumL<sumR) msg = DICE.right + " 승 ("+sumL+" < "+sumR+")";
+      else msg = "무승부 ("+sumL+" = "+sumR+")";
+      document.getElementById('resultLabel').textContent = msg;
+    }
+  }
+}
+function drawDiePanel(x,y,vals, baseColor){
+  const isDouble = (DICE.mode!=='single');
+  const boxW=180, boxH=isDouble?200:170;
+  push();
+  stroke('#999'); fill('#FAFAFA'); strokeWeight(1.2);
+  rect(x,y, boxW, boxH, 12);
+  const dy = isDouble? 68 : 52;
+  for(let i=0;i<vals.length;i++){
+    drawDieWithPips(x+boxW/2 - 55 + (isDouble? i*110:0), y+62, 80, vals[i], baseColor);
+  }
+  const s = vals.reduce((a,b)=>a+b,0);
+  noStroke(); fill('#333'); textSize(18);
+  text("합: "+s, x+boxW/2, y+boxH-20);
+  pop();
+}
+function drawDieWithPips(cx, cy, size, val, colorHex){
+  push();
+  rectMode(CENTER);
+  stroke('#333'); strokeWeight(2); fill(colorHex);
+  rect(cx, cy, size, size, 14);
+  if (val>=1 && val<=6){
+    drawPips(cx, cy, size, val);
+  } else {
+    fill('#fff'); textSize(28); text(val, cx, cy);
+  }
+  pop();
+}
+function drawPips(cx, cy, size, n){
+  const r = size*0.09;
+  fill('#fff'); noStroke();
+  const d = size*0.28;
+  const pos = [
+    [0,0],
+    [-d,-d],[d,d],
+    [-d,-d],[0,0],[d,d],
+    [-d,-d],[d,-d],[-d,d],[d,d],
+    [-d,-d],[d,-d],[0,0],[-d,d],[d,d],
+    [-d,-d],[d,-d],[-d,d],[d,d],[-d,0],[d,0]
+  ];
+  let start = 0, count = 0;
+  if (n===1){ start=0; count=1; }
+  else if (n===2){ start=1; count=2; }
+  else if (n===3){ start=3; count=3; }
+  else if (n===4){ start=6; count=4; }
+  else if (n===5){ start=10; count=5; }
+  else if (n===6){ start=15; count=6; }
+  for(let i=0;i<count;i++){
+    const [dx,dy]=pos[start+i];
+    circle(cx+dx, cy+dy, r*2);
+  }
+}
+</script>
+"""
+
+# 첫 렌더링 때 선언(번들이 바뀌면 다시) — 이후 rerun에는 면값·모드만 JSON으로 전송
+_DICE_CANVAS = param_component("nontransitive_dice", _DICE_HTML)
+
+
 def render():
     st.header("🎲 비정규 주사위 실험실 (6칸 입력 + 이론/시뮬 + 눈금 애니메이션)")
 
@@ -144,127 +276,7 @@ def render():
         "mode": ("single" if vis_mode.startswith("한 번") else "double")
     }
 
-    html = f"""
-    <div id="wrap" style="width:100%;max-width:900px;margin:0 auto;">
-      <div style="margin:.25rem 0 .5rem 0;">
-        <button id="rollBtn" style="padding:.5rem 1rem;">🎲 ROLL</button>
-        <span id="resultLabel" style="margin-left:12px;font-weight:600;"></span>
-      </div>
-    </div>
-    <script src="https://cdn.jsdelivr.net/npm/p5@1.9.0/lib/p5.min.js"></script>
-    <script>
-    const DICE = {json.dumps(faces_payload)};
-    function choice(arr) {{ return arr[Math.floor(Math.random()*arr.length)]; }}
-
-    let W=900,H=330, rolling=0, targetL=[], targetR=[], shownL=[], shownR=[];
-    function setup(){{
-      const cnv = createCanvas(W,H);
-      cnv.parent(document.getElementById('wrap'));
-      textFont('Helvetica'); textAlign(CENTER,CENTER);
-      resetShown();
-      document.getElementById('rollBtn').onclick = triggerRoll;
-    }}
-    function resetShown(){{
-      shownL = [choice(DICE[DICE.left])];
-      shownR = [choice(DICE[DICE.right])];
-    }}
-    function triggerRoll(){{
-      const left = DICE.left, right = DICE.right;
-      if (DICE.mode==='single') {{
-        targetL = [choice(DICE[left])];
-        targetR = [choice(DICE[right])];
-      }} else {{
-        targetL = [choice(DICE[left]), choice(DICE[left])];
-        targetR = [choice(DICE[right]), choice(DICE[right])];
-      }}
-      rolling = 22;
-      document.getElementById('resultLabel').textContent = '';
-    }}
-    function draw(){{
-      background(255);
-      noStroke();
-      fill(0); textSize(16);
-      text(DICE.left + "  vs  " + DICE.right + "   ("+(DICE.mode==='single'?'1회':'2회합')+")", width/2, 18);
-
-      drawDiePanel(width*0.25-90, 50, shownL, '#1976D2');
-      drawDiePanel(width*0.75-90, 50, shownR, '#C62828');
-
-      if(rolling>0){{
-        if (DICE.mode==='single') {{
-          shownL = [choice(DICE[DICE.left])];
-          shownR = [choice(DICE[DICE.right])];
-        }} else {{
-          shownL = [choice(DICE[DICE.left]), choice(DICE[DICE.left])];
-          shownR = [choice(DICE[DICE.right]), choice(DICE[DICE.right])];
-        }}
-        rolling--;
-        if(rolling===0){{
-          shownL = targetL.slice();
-          shownR = targetR.slice();
-          const sumL = shownL.reduce((a,b)=>a+b,0);
-          const sumR = shownR.reduce((a,b)=>a+b,0);
-          let msg = '';
-          if (sumL>sumR) msg = DICE.left + " 승 ("+sumL+" > "+sumR+")";
-          else if (sumL<sumR) msg = DICE.right + " 승 ("+sumL+" < "+sumR+")";
-          else msg = "무승부 ("+sumL+" = "+sumR+")";
-          document.getElementById('resultLabel').textContent = msg;
-        }}
-      }}
-    }}
-    function drawDiePanel(x,y,vals, baseColor){{
-      const isDouble = (DICE.mode!=='single');
-      const boxW=180, boxH=isDouble?200:170;
-      push();
-      stroke('#999'); fill('#FAFAFA'); strokeWeight(1.2);
-      rect(x,y, boxW, boxH, 12);
-      const dy = isDouble? 68 : 52;
-      for(let i=0;i<vals.length;i++){{
-        drawDieWithPips(x+boxW/2 - 55 + (isDouble? i*110:0), y+62, 80, vals[i], baseColor);
-      }}
-      const s = vals.reduce((a,b)=>a+b,0);
-      noStroke(); fill('#333'); textSize(18);
-      text("합: "+s, x+boxW/2, y+boxH-20);
-      pop();
-    }}
-    function drawDieWithPips(cx, cy, size, val, colorHex){{
-      push();
-      rectMode(CENTER);
-      stroke('#333'); strokeWeight(2); fill(colorHex);
-      rect(cx, cy, size, size, 14);
-      if (val>=1 && val<=6){{
-        drawPips(cx, cy, size, val);
-      }} else {{
-        fill('#fff'); textSize(28); text(val, cx, cy);
-      }}
-      pop();
-    }}
-    function drawPips(cx, cy, size, n){{
-      const r = size*0.09;
-      fill('#fff'); noStroke();
-      const d = size*0.28;
-      const pos = [
-        [0,0],
-        [-d,-d],[d,d],
-        [-d,-d],[0,0],[d,d],
-        [-d,-d],[d,-d],[-d,d],[d,d],
-        [-d,-d],[d,-d],[0,0],[-d,d],[d,d],
-        [-d,-d],[d,-d],[-d,d],[d,d],[-d,0],[d,0]
-      ];
-      let start = 0, count = 0;
-      if (n===1){{ start=0; count=1; }}
-      else if (n===2){{ start=1; count=2; }}
-      else if (n===3){{ start=3; count=3; }}
-      else if (n===4){{ start=6; count=4; }}
-      else if (n===5){{ start=10; count=5; }}
-      else if (n===6){{ start=15; count=6; }}
-      for(let i=0;i<count;i++){{
-        const [dx,dy]=pos[start+i];
-        circle(cx+dx, cy+dy, r*2);
-      }}
-    }}
-    </script>
-    """
-    components.html(html, height=370)
+    _DICE_CANVAS(faces_payload, height=370, key="nd_dice_canvas")
 
     st.divider()
 
@@ -1,6 +1,7 @@
 # activities/probability/mini/normal_compare_p5.py
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title": "정규분포 비교",
@@ -14,12 +15,12 @@ def render():
     st.caption("슬라이더로 μ, σ를 조절해 두 정규분포의 모양을 비교해 보세요.")
 
     components.html(
-        """
+        vendor_html("""
 <!doctype html>
 <html>
   <head>
     <meta charset="utf-8">
-    <script src="https://cdn.jsdelivr.net/npm/p5@1.9.0/lib/p5.min.js"></script>
+    <script src="vendor:p5/p5.min.js"></script>
     <style>
       body{ margin:0; }
       #wrap{ max-width: 980px; margin: 0 auto; padding: 8px 12px 16px; }
@@ -252,6 +253,6 @@ def render():
     </script>
   </body>
 </html>
-        """,
+        """),
         height=660,
     )
@@ -1,9 +1,9 @@
 # activities/probability/mini/odd_prime_convergence.py
-import random
-import math
 import streamlit as st
 import pandas as pd
 
+from sim_utils import nested_multinomial
+
 META = {
     "title": "미니: P(소수 | 홀수) 수렴 관찰",
     "description": "n=10, 100, …처럼 시행수를 키우며 q/p가 2/3로 수렴하는 모습을 봅니다.",
@@ -11,18 +11,21 @@ META = {
     "order": 9999999,
 }
 
-def _estimate(n: int, seed: int | None = None) -> tuple[int,int,float]:
-    if seed is not None:
-        random.seed(seed)
-    p = q = 0
-    for _ in range(n):
-        a = random.randint(1, 6)
-        if a % 2 == 1:
-            p += 1
-            if a in (3, 5):
-                q += 1
-    est = (q / p) if p > 0 else float("nan")
-    return p, q, est
+# 주사위 눈 1~6 중 홀수(1,3,5)와 그중 소수(3,5)
+_ODD = [0, 2, 4]
+_ODD_PRIME = [2, 4]
+
+def _estimate_nested(max_exp: int, seed: int | None = None) -> list[tuple[int, int, int, float]]:
+    """n = 10, 100, …, 10^max_exp 각각의 (n, p, q, q/p). 눈별 도수를 다항분포로 바로 뽑고,
+    큰 n은 작은 n의 결과에 증분만 더해 만든다(10^9회도 즉시)."""
+    sizes = [10 ** i for i in range(1, max_exp + 1)]
+    counts = nested_multinomial(sizes, [1 / 6] * 6, seed=seed)
+    rows = []
+    for n, c in zip(sizes, counts):
+        p = int(c[_ODD].sum())
+        q = int(c[_ODD_PRIME].sum())
+        rows.append((n, p, q, (q / p) if p > 0 else float("nan")))
+    return rows
 
 def render():
     st.subheader("📈 시행수를 키우며 수렴 관찰")
@@ -30,8 +33,8 @@ def render():
 
     c1, c2, c3 = st.columns([2,1,1])
     with c1:
-        max_exp = st.slider("최대 지수 k (10^k 까지)", min_value=2, max_value=6, value=5,
-                            help="k=6이면 최대 1,000,000회까지 실행합니다(시간 소요).")
+        max_exp = st.slider("최대 지수 k (10^k 까지)", min_value=2, max_value=9, value=5,
+                            help="k=9이면 최대 1,000,000,000회까지 실행합니다(도수를 직접 뽑아 즉시 계산).")
     with c2:
         seed_on = st.toggle("시드 고정", value=False)
     with c3:
@@ -42,11 +45,10 @@ def render():
     if not go:
         return
 
-    rows = []
-    for i in range(1, max_exp + 1):
-        n = 10 ** i
-        p, q, est = _estimate(n, seed=int(seed_val) if seed_on else None)
-        rows.append({"n": n, "홀수(p)": p, "소수(3,5)=q": q, "추정 q/p": est})
+    rows = [
+        {"n": n, "홀수(p)": p, "소수(3,5)=q": q, "추정 q/p": est}
+        for n, p, q, est in _estimate_nested(max_exp, seed=int(seed_val) if seed_on else None)
+    ]
 
     df = pd.DataFrame(rows)
     st.dataframe(df, use_container_width=True)
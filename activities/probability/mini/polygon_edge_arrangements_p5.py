@@ -4,6 +4,7 @@ import json
 import numpy as np
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from math import gcd
 
 META = {
@@ -170,7 +171,7 @@ def render():
 <html>
 <head>
   <meta charset="utf-8"/>
-  <script src="https://cdn.jsdelivr.net/npm/p5@1.9.0/lib/p5.min.js"></script>
+  <script src="vendor:p5/p5.min.js"></script>
   <style>
     body{{margin:0}}
     .wrap{{max-width:1000px;margin:0 auto}}
@@ -280,7 +281,7 @@ function drawEdgeCircles(){{
 </body>
 </html>
     """
-    components.html(html, height=620)
+    components.html(vendor_html(html), height=620)
 
     st.info(
         "비정다각형이라도 변별 원 개수 배열이 **주기**를 가지거나 **대칭**이면 회전/반사 안정자 |H|가 1보다 커집니다. "
@@ -2,8 +2,9 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
-from math import sqrt
-from typing import List, Dict
+from math import erf, sqrt
+from typing import List, Tuple
+from dist_utils import sum_pmf
 
 # 이 페이지를 식별하는 고유 ID (처음 진입 시 세션 리셋용)
 PAGE_ID = "probability/mini/sample_mean_dist"
@@ -14,6 +15,10 @@ PAGE_META = {
     "icon": "🧮",
 }
 
+VALUE_MIN, VALUE_MAX = -1000, 1000   # 원소 입력 범위(합의 격자 길이 ≤ n·2000 + 1)
+TABLE_MAX_COLS = 40                  # 분포표 열이 이보다 많으면 구간으로 묶어 표시
+PLOT_MAX_BARS = 400                  # 히스토그램 막대 상한(넘으면 구간으로 묶음)
+
 # ---------- 바구니 시각화 ----------
 def draw_basket(values: List[int]):
     N = len(values)
@@ -75,53 +80,18 @@ def draw_basket(values: List[int]):
     )
     return fig
 
-# ---------- 합 분포(정확/근사) ----------
-def pmf_sum_via_power(values: List[int], n: int) -> Dict[int, float]:
-    """단일 추출 pmf를 다항식으로 보고 n제곱(분할정복) → S_n의 정확 분포."""
-    vals = np.array(values, dtype=int)
-    m = len(vals)
-    minv, maxv = vals.min(), vals.max()
-    base_len = maxv - minv + 1
-    base = np.zeros(base_len)
-    for v in vals:
-        base[v - minv] += 1.0 / m
-
-    def poly_conv(a, b):
-        c = np.convolve(a, b)
-        c[c < 1e-14] = 0.0
-        nz = np.nonzero(c)[0]
-        if len(nz) == 0:
-            return np.zeros(1)
-        return c[nz.min(): nz.max() + 1]
-
-    res = np.array([1.0]); shift = 0
-    base_poly = base.copy(); base_shift = minv
-    k = n
-    while k > 0:
-        if k & 1:
-            res = poly_conv(res, base_poly)
-            shift += base_shift
-        base_poly = poly_conv(base_poly, base_poly)
-        base_shift *= 2
-        k >>= 1
-
-    sums = np.arange(shift, shift + len(res))
-    pmf = {int(s): float(p) for s, p in zip(sums, res / res.sum())}
-    return pmf
-
-def pmf_sum(values: List[int], n: int) -> Dict[int, float]:
-    """가능하면 항상 '정확' 방법을 사용(극단만 근사)."""
-    spread = max(values) - min(values) if len(values) > 0 else 0
-    if spread * n <= 4000:
-        return pmf_sum_via_power(values, n)
-
-    rng = np.random.default_rng(0)
-    trials = min(300_000, 6000 * max(1, n))
-    vals = np.array(values)
-    sums = rng.choice(vals, size=(trials, n), replace=True).sum(axis=1)
-    unique, counts = np.unique(sums, return_counts=True)
-    probs = counts / counts.sum()
-    return {int(s): float(p) for s, p in zip(unique, probs)}
+# ---------- 분포표 구간 묶기 ----------
+def bin_pmf(x: np.ndarray, p: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """값 x(오름차순)의 확률 p를 같은 폭 구간 bins개로 합침 → (구간 경계 bins+1개, 구간 확률)."""
+    edges = np.linspace(x[0], x[-1], bins + 1)
+    which = np.minimum(np.searchsorted(edges, x, side="right") - 1, bins - 1)
+    return edges, np.bincount(which, weights=p, minlength=bins)
+
+def normal_mean_table(mu: float, sd: float, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """정규근사 N(μ, sd²)로 본 표본평균의 구간 확률(μ ± 4sd를 bins개 구간으로)."""
+    edges = np.linspace(mu - 4 * sd, mu + 4 * sd, bins + 1)
+    cdf = np.array([0.5 * (1 + erf((e - mu) / (sd * sqrt(2)))) for e in edges])
+    return edges, np.diff(cdf)
 
 # ---------- 예시 표본 ----------
 def make_examples(values: List[int], n: int, k: int = 5, seed: int = 0):
@@ -205,7 +175,8 @@ def render():
     cols = st.sidebar.columns(col_num)
     for i in range(m):
         with cols[i % col_num]:
-            v = st.number_input(f"원소 {i+1}", value=int(defaults[i]), step=1, format="%d")
+            v = st.number_input(f"원소 {i+1}", min_value=VALUE_MIN, max_value=VALUE_MAX,
+                                value=int(defaults[i]), step=1, format="%d")
             values.append(int(v))
 
     # n: 슬라이더 아래 −/＋, 초기값 1
@@ -243,21 +214,42 @@ def render():
 
     # ===== 표본평균의 분포(가능한 값만, 가로형 표) =====
     st.subheader("표본평균의 분포표")
-    pmfS = pmf_sum(values, n)
-    pmfS = {s: p for s, p in pmfS.items() if p > 1e-15}
-    sums_sorted = sorted(pmfS.keys())
-    probs_sorted = [pmfS[s] for s in sums_sorted]
-
-    means_decimal = [s / n for s in sums_sorted]
-    labels = [f"{s}/{n} ({s / n:.4f})" for s in sums_sorted]
-
     import pandas as pd
-    df_row = pd.DataFrame([np.round(probs_sorted, 6)], columns=labels)
-    st.dataframe(df_row, use_container_width=True, hide_index=True)
+    try:
+        sums, probs = sum_pmf(values, n)
+    except ValueError:
+        # 합의 범위가 정확 계산 한도를 넘음 → 정규근사 구간표
+        sums = None
+    if sums is None:
+        st.warning("가능한 합의 범위가 너무 넓어, 중심극한정리에 따른 정규근사로 구간별 확률을 보여 줍니다.")
+        edges, bin_p = normal_mean_table(pop_mean, pop_std / sqrt(n), TABLE_MAX_COLS)
+        labels = [f"[{a:.3f}, {b:.3f})" for a, b in zip(edges[:-1], edges[1:])]
+        st.dataframe(pd.DataFrame([np.round(bin_p, 6)], columns=labels),
+                     use_container_width=True, hide_index=True)
+        plot_x, plot_p = (edges[:-1] + edges[1:]) / 2, bin_p
+    else:
+        keep = probs > 1e-15
+        sums_sorted, probs_sorted = sums[keep], probs[keep]
+        means_decimal = sums_sorted / n
+        if sums_sorted.size <= TABLE_MAX_COLS:
+            labels = [f"{s}/{n} ({s / n:.4f})" for s in sums_sorted]
+            row = np.round(probs_sorted, 6)
+        else:
+            edges, row = bin_pmf(means_decimal, probs_sorted, TABLE_MAX_COLS)
+            labels = [f"[{a:.3f}, {b:.3f}{']' if i == TABLE_MAX_COLS - 1 else ')'}"
+                      for i, (a, b) in enumerate(zip(edges[:-1], edges[1:]))]
+            row = np.round(row, 6)
+            st.caption(f"가능한 표본평균이 {sums_sorted.size:,}개라 같은 폭 {TABLE_MAX_COLS}개 구간으로 묶어 표시합니다(정확한 확률의 구간 합).")
+        st.dataframe(pd.DataFrame([row], columns=labels), use_container_width=True, hide_index=True)
+        if sums_sorted.size <= PLOT_MAX_BARS:
+            plot_x, plot_p = means_decimal, probs_sorted
+        else:
+            edges, plot_p = bin_pmf(means_decimal, probs_sorted, PLOT_MAX_BARS)
+            plot_x = (edges[:-1] + edges[1:]) / 2
 
     # 히스토그램
     st.subheader("표본평균 분포 히스토그램")
-    df_hist = pd.DataFrame({"mean": means_decimal, "prob": probs_sorted})
+    df_hist = pd.DataFrame({"mean": plot_x, "prob": plot_p})
     fig = px.bar(df_hist, x="mean", y="prob")
     fig.update_layout(xaxis_title="표본평균", yaxis_title="확률", bargap=0.05)
     st.plotly_chart(fig, use_container_width=True)
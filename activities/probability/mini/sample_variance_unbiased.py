@@ -3,6 +3,9 @@ import numpy as np
 import plotly.graph_objects as go
 from typing import List
 
+from cache_utils import sim_cache
+from sim_utils import variance_trials
+
 PAGE_META = {
     "title": "표본분산: 왜 n-1로 나눌까?",
     "group": "확률과통계",
@@ -69,6 +72,11 @@ def draw_concept_diagram() -> go.Figure:
                        showarrow=False, font=dict(size=11, color="rgb(230,170,0)"))
     return fig
 
+@sim_cache()
+def _simulate(values: tuple, n: int, trials: int, seed: int):
+    """(모집단, n, 시행 수, 시드)별로 한 번만 계산(세션 간 공유)."""
+    return variance_trials(values, n, trials, seed)
+
 def render():
     # -------- 사이드바 --------
     st.sidebar.subheader("⚙️ 설정")
@@ -85,7 +93,7 @@ def render():
             values.append(float(v))
 
     n = st.sidebar.slider("표본 크기 n", 2, 50, 5, step=1)
-    trials = st.sidebar.slider("시행(표본) 수", 100, 20000, 3000, step=100)
+    trials = st.sidebar.slider("시행(표본) 수", 100, 1_000_000, 3000, step=100)
     seed = st.sidebar.number_input("난수 시드", value=0, step=1)
 
     values_np = np.array(values, dtype=float)
@@ -118,32 +126,25 @@ def render():
     )
 
     # -------- 시뮬레이션: (1/n) vs (1/(n-1)) --------
-    rng = np.random.default_rng(int(seed))
-    s2_n_vals  = np.zeros(trials)   # (1/n) * sum (Xi - Xbar)^2  -> biased
-    s2_n1_vals = np.zeros(trials)   # (1/(n-1)) * sum (Xi - Xbar)^2 -> unbiased
-
-    for t in range(trials):
-        sample = rng.choice(values_np, size=n, replace=True)
-        xbar = sample.mean()
-        s2_n_vals[t]  = np.mean((sample - xbar) ** 2)
-        s2_n1_vals[t] = np.var(sample, ddof=1)
+    # (trials × n) 행렬을 덩어리로 흘려보내며 히스토그램·누적 평균만 누적(메모리 일정)
+    res = _simulate(tuple(values), int(n), int(trials), int(seed))
 
-    # 히스토그램(겹침)
+    # 히스토그램(겹침) — 구간 빈도를 막대로
+    centers = (res.edges[:-1] + res.edges[1:]) / 2
+    width = float(res.edges[1] - res.edges[0])
     fig_hist = go.Figure()
-    fig_hist.add_histogram(x=s2_n_vals,  name="(1/n)·Σ(Xᵢ−X̄)²",  opacity=0.55)
-    fig_hist.add_histogram(x=s2_n1_vals, name="(1/(n−1))·Σ(Xᵢ−X̄)²", opacity=0.55)
+    fig_hist.add_bar(x=centers, y=res.hist_biased, width=width, name="(1/n)·Σ(Xᵢ−X̄)²", opacity=0.55)
+    fig_hist.add_bar(x=centers, y=res.hist_unbiased, width=width, name="(1/(n−1))·Σ(Xᵢ−X̄)²", opacity=0.55)
     fig_hist.add_vline(y0=0, y1=1, x=sigma2, line_dash="dash", line_width=2,
                        annotation_text=f"모분산 σ²={sigma2:.4f}")
-    fig_hist.update_layout(barmode="overlay", xaxis_title="추정값", yaxis_title="빈도", height=380)
+    fig_hist.update_layout(barmode="overlay", bargap=0, xaxis_title="추정값", yaxis_title="빈도", height=380)
     st.markdown("### 분산 추정량 분포 비교")
     st.plotly_chart(fig_hist, use_container_width=True)
 
-    # 누적 평균(수렴)
-    cum_mean_n  = np.cumsum(s2_n_vals)  / np.arange(1, trials + 1)
-    cum_mean_n1 = np.cumsum(s2_n1_vals) / np.arange(1, trials + 1)
+    # 누적 평균(수렴) — 로그 간격 시행 수에서 기록한 값
     fig_cum = go.Figure()
-    fig_cum.add_scatter(y=cum_mean_n,  mode="lines", name="(1/n) 평균")
-    fig_cum.add_scatter(y=cum_mean_n1, mode="lines", name="(1/(n−1)) 평균")
+    fig_cum.add_scatter(x=res.grid, y=res.cum_biased,   mode="lines", name="(1/n) 평균")
+    fig_cum.add_scatter(x=res.grid, y=res.cum_unbiased, mode="lines", name="(1/(n−1)) 평균")
     fig_cum.add_hline(y=sigma2, line_dash="dash", line_width=2,
                       annotation_text=f"모분산 σ²={sigma2:.4f}")
     fig_cum.update_layout(xaxis_title="시행 수(누적)", yaxis_title="누적 평균", height=380)
@@ -153,8 +154,8 @@ def render():
     st.markdown("### 요약")
     c1, c2, c3 = st.columns(3)
     c1.metric("모분산 σ²", f"{sigma2:.6f}")
-    c2.metric("평균[(1/n)·Σ(Xᵢ−X̄)²]",  f"{s2_n_vals.mean():.6f}")
-    c3.metric("평균[(1/(n−1))·Σ(Xᵢ−X̄)²]", f"{s2_n1_vals.mean():.6f}")
+    c2.metric("평균[(1/n)·Σ(Xᵢ−X̄)²]",  f"{res.mean_biased:.6f}")
+    c3.metric("평균[(1/(n−1))·Σ(Xᵢ−X̄)²]", f"{res.mean_unbiased:.6f}")
 
     st.markdown(
         "- **(1/n)** 으로 나누면 평균이 보통 **σ²보다 작게** 나옵니다(편향).  \n"
@@ -3,6 +3,7 @@ import numpy as np
 import math
 import plotly.graph_objects as go
 import pandas as pd
+from cache_utils import sim_cache
 
 PAGE_META = {
     "title": "숫자카드 표본 추출",
@@ -138,7 +139,8 @@ def sample_once(mode: str, N: int, n: int, rng: np.random.Generator):
         sample.sort()  # 조합: 순서 무시 → 보기 좋게 정렬
         return sample
 
-# 여러 번 샘플
+# 여러 번 샘플(같은 설정·시드는 세션 간 공유 캐시)
+@sim_cache()
 def sample_many(mode: str, N: int, n: int, k: int, seed: int):
     rng = np.random.default_rng(seed)
     rows = []
@@ -3,6 +3,7 @@ from pathlib import Path
 import base64
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title": "몬티홀 문제(확장)",
@@ -34,7 +35,7 @@ def render():
 <html>
 <head>
   <meta charset="utf-8" />
-  <script src="https://cdn.jsdelivr.net/npm/p5@1.9.0/lib/p5.min.js"></script>
+  <script src="vendor:p5/p5.min.js"></script>
   <style>
     html,body { margin:0; padding:0; overflow:hidden; font-family:sans-serif; }
   </style>
@@ -424,4 +425,4 @@ function playOneAutoGame(switchMode) {
     """
 
     html = html_template.replace("__GOAT__", goat_uri).replace("__CAR__", car_uri)
-    components.html(html, height=880, scrolling=False)
+    components.html(vendor_html(html), height=880, scrolling=False)
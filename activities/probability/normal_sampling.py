@@ -2,7 +2,9 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy.stats import norm
+from lazy_utils import lazy_from
+norm = lazy_from("scipy.stats", "norm")
+from cache_utils import sim_cache
 
 # utils: 제목/라인(간격 최소), 앵커/점프
 try:
@@ -31,6 +33,7 @@ K_MU    = "norm_mu"
 K_SIGMA = "norm_sigma"
 K_N     = "norm_n"
 K_BINS  = "norm_bins"
+K_SEED  = "norm_seed"
 JUMP    = "norm_jump_flag"
 
 DEFAULTS = {
@@ -38,6 +41,7 @@ DEFAULTS = {
     K_SIGMA: 1.0,
     K_N: 1000,
     K_BINS: 40,
+    K_SEED: 0,
 }
 
 def _ensure_defaults():
@@ -49,6 +53,12 @@ def _mark_changed():
     # 사이드바 값이 바뀌면 렌더 후 그래프 위치로 되돌아오도록 플래그
     st.session_state[JUMP] = "graph"
 
+@sim_cache()
+def _sample(mu: float, sigma: float, n: int, seed):
+    """정규 표본 n개. 같은 설정·시드는 세션 간에 한 번만 계산."""
+    rng = np.random.default_rng(seed)
+    return rng.normal(mu, sigma, size=n)
+
 def render():
     _ensure_defaults()
 
@@ -82,19 +92,23 @@ def render():
             value=int(st.session_state[K_BINS]),
             key=K_BINS, on_change=_mark_changed
         )
+        st.number_input(
+            "난수 시드(0=랜덤)", min_value=0, step=1, format="%d",
+            key=K_SEED, on_change=_mark_changed
+        )
 
     # ----- 현재 설정 읽기 -----
     mu    = float(st.session_state[K_MU])
     sigma = float(st.session_state[K_SIGMA])
     n     = int(st.session_state[K_N])
     bins  = int(st.session_state[K_BINS])
+    seed  = int(st.session_state[K_SEED])
 
     # 그래프 위치 앵커
     anchor("graph")
 
     # ----- 표본 생성 -----
-    rng = np.random.default_rng()
-    x = rng.normal(mu, sigma, size=n)
+    x = _sample(mu, sigma, n, None if seed == 0 else seed)
 
     # 히스토그램(밀도 정규화) 및 이론 밀도
     hist_y, hist_x = np.histogram(x, bins=bins, density=True)
@@ -1,6 +1,6 @@
 # activities/probability/pascal_modulo_view.py
 import streamlit as st
-import streamlit.components.v1 as components
+from component_utils import param_component
 
 # utils: 제목/라인(여백 최소), 앵커/점프
 try:
@@ -44,82 +44,57 @@ def _mark_changed():
     # 위젯 변경 시, rerun 후 캔버스 위치로 점프
     st.session_state[JUMP] = "canvas"
 
-def render():
-    _ensure_defaults()
-
-    page_header("파스칼 삼각형 모듈로 시각화", "이항계수를 mod m로 색칠하여 패턴을 탐구합니다.", icon="🔺", top_rule=True)
-
-    # ---- 사이드바 컨트롤 (즉시 반영) ----
-    with st.sidebar:
-        st.subheader("⚙️ 설정")
-
-        st.slider("🔍 확대 (View Scale)", 1.0, 20.0, step=0.1, key=K_ZOOM, on_change=_mark_changed)
-        st.slider("🎯 modulo m", 2, 12, step=1, key=K_MOD, on_change=_mark_changed)
-
-        # modulo 변경에 따라 remainder 상한 조정
-        mod_val = int(st.session_state[K_MOD])
-        # 슬라이더는 value 없이 key만 쓰므로, 상한만 동적으로 바뀌어도 세션값 표시가 자동 동기화됨
-        st.slider("🎯 remainder (0 ≤ r ≤ m−1)", 0, mod_val - 1, step=1, key=K_REM, on_change=_mark_changed)
-
-    # ---- 현재 설정 ----
-    zoom = float(st.session_state[K_ZOOM])
-    mod  = int(st.session_state[K_MOD])
-    rem  = int(st.session_state[K_REM])
-
-    # 안전장치: remainder가 범위를 벗어나면 0으로 보정
-    if rem > mod - 1:
-        st.session_state[K_REM] = 0
-        rem = 0
-
-    # ---- 앵커(캔버스 위치) ----
-    anchor("canvas")
-
-    # ---- p5.js 캔버스 임베드 ----
-    # - Streamlit iframe 내부에서 CDN을 로드해도 브라우저가 처리하므로 OK
-    # - windowWidth/Height는 iframe 크기를 사용
-    html = f"""
-<!DOCTYPE html>
+_PASCAL_HTML = """<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8"/>
 <meta name="viewport" content="width=device-width, initial-scale=1"/>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.9.0/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <style>
-  html, body {{ margin:0; padding:0; overflow:hidden; background:#ffffff; }}
-  #label-wrap {{
+  html, body { margin:0; padding:0; overflow:hidden; background:#ffffff; }
+  #label-wrap {
     position: fixed; left: 12px; top: 12px; font-family: system-ui, -apple-system, Segoe UI, Roboto, sans-serif;
     background: rgba(255,255,255,0.85); padding: 8px 10px; border-radius: 8px; box-shadow: 0 1px 4px rgba(0,0,0,0.08);
     user-select: none; font-size: 13px; line-height: 1.25;
-  }}
-  .pill {{ display:inline-block; margin-right:8px; padding:2px 8px; border-radius:999px; background:#f2f4f7; }}
-  canvas {{ display:block; }}
+  }
+  .pill { display:inline-block; margin-right:8px; padding:2px 8px; border-radius:999px; background:#f2f4f7; }
+  canvas { display:block; }
 </style>
 </head>
 <body>
 <div id="label-wrap">
-  <span class="pill">🔍 Scale: {zoom:.1f}</span>
-  <span class="pill">m = {mod}</span>
-  <span class="pill">r = {rem}</span>
+  <span class="pill" id="lbl-scale"></span>
+  <span class="pill" id="lbl-mod"></span>
+  <span class="pill" id="lbl-rem"></span>
 </div>
 <script>
-  // Python에서 전달된 현재 설정
-  const PY_SCALE = {zoom};
-  const PY_MOD   = {mod};
-  const PY_REM   = {rem};
+  // Python에서 전달된 현재 설정 — 슬라이더가 바뀌면 메시지로만 갱신(캔버스 유지)
+  let PY_SCALE = 5.0;
+  let PY_MOD   = 2;
+  let PY_REM   = 0;
+
+  MathLab.onParams(function (p) {
+    PY_SCALE = p.zoom;
+    PY_MOD   = p.mod;
+    PY_REM   = p.rem;
+    document.getElementById("lbl-scale").textContent = "🔍 Scale: " + PY_SCALE.toFixed(1);
+    document.getElementById("lbl-mod").textContent = "m = " + PY_MOD;
+    document.getElementById("lbl-rem").textContent = "r = " + PY_REM;
+  });
 
   let pascalTriangle = [];
   const baseSpacing = 60;
 
-  function setup() {{
+  function setup() {
     createCanvas(windowWidth, windowHeight);
     noStroke();
-  }}
+  }
 
-  function windowResized() {{
+  function windowResized() {
     resizeCanvas(windowWidth, windowHeight);
-  }}
+  }
 
-  function draw() {{
+  function draw() {
     background(255);
 
     const scaleFactor = PY_SCALE;
@@ -129,53 +104,91 @@ def render():
 
     generatePascalTriangle(visibleRows);
     drawPascalTriangle(spacing, visibleRows, marginTop);
-  }}
+  }
 
-  function generatePascalTriangle(rowCount) {{
+  function generatePascalTriangle(rowCount) {
     pascalTriangle = [];
-    for (let n = 0; n < rowCount; n++) {{
+    for (let n = 0; n < rowCount; n++) {
       pascalTriangle[n] = [];
-      for (let k = 0; k <= n; k++) {{
-        if (k === 0 || k === n) {{
+      for (let k = 0; k <= n; k++) {
+        if (k === 0 || k === n) {
           pascalTriangle[n][k] = 1n;
-        }} else {{
+        } else {
           pascalTriangle[n][k] = pascalTriangle[n - 1][k - 1] + pascalTriangle[n - 1][k];
-        }}
-      }}
-    }}
-  }}
+        }
+      }
+    }
+  }
 
-  function drawPascalTriangle(spacing, rowCount, offsetY) {{
+  function drawPascalTriangle(spacing, rowCount, offsetY) {
     textAlign(CENTER, CENTER);
-    for (let i = 0; i < rowCount; i++) {{
-      for (let j = 0; j < pascalTriangle[i].length; j++) {{
+    for (let i = 0; i < rowCount; i++) {
+      for (let j = 0; j < pascalTriangle[i].length; j++) {
         const val = pascalTriangle[i][j];
         const x = width / 2 + (j - i / 2) * spacing;
         const y = i * spacing + offsetY;
 
-        if (val % BigInt(PY_MOD) === BigInt(PY_REM)) {{
+        if (val % BigInt(PY_MOD) === BigInt(PY_REM)) {
           fill(0, 102, 204);
-        }} else {{
+        } else {
           fill(230);
-        }}
+        }
 
         ellipse(x, y, spacing * 0.6);
 
-        if (spacing >= 20) {{
+        if (spacing >= 20) {
           fill(0);
           textSize(spacing * 0.25);
           text(val.toString(), x, y);
-        }}
-      }}
-    }}
-  }}
+        }
+      }
+    }
+  }
 </script>
 </body>
 </html>
-    """
+"""
+
+# 첫 렌더링 때 선언(번들이 바뀌면 다시) — 이후 rerun에는 파라미터만 전송
+_PASCAL_CANVAS = param_component("pascal_modulo", _PASCAL_HTML)
+
+
+def render():
+    _ensure_defaults()
+
+    page_header("파스칼 삼각형 모듈로 시각화", "이항계수를 mod m로 색칠하여 패턴을 탐구합니다.", icon="🔺", top_rule=True)
+
+    # ---- 사이드바 컨트롤 (즉시 반영) ----
+    with st.sidebar:
+        st.subheader("⚙️ 설정")
+
+        st.slider("🔍 확대 (View Scale)", 1.0, 20.0, step=0.1, key=K_ZOOM, on_change=_mark_changed)
+        st.slider("🎯 modulo m", 2, 12, step=1, key=K_MOD, on_change=_mark_changed)
+
+        # modulo 변경에 따라 remainder 상한 조정
+        mod_val = int(st.session_state[K_MOD])
+        # 슬라이더는 value 없이 key만 쓰므로, 상한만 동적으로 바뀌어도 세션값 표시가 자동 동기화됨
+        st.slider("🎯 remainder (0 ≤ r ≤ m−1)", 0, mod_val - 1, step=1, key=K_REM, on_change=_mark_changed)
+
+    # ---- 현재 설정 ----
+    zoom = float(st.session_state[K_ZOOM])
+    mod  = int(st.session_state[K_MOD])
+    rem  = int(st.session_state[K_REM])
+
+    # 안전장치: remainder가 범위를 벗어나면 0으로 보정
+    if rem > mod - 1:
+        st.session_state[K_REM] = 0
+        rem = 0
+
+    # ---- 앵커(캔버스 위치) ----
+    anchor("canvas")
 
-    # 캔버스 높이(px). 필요하면 사이드바에서 높이 slider 추가 가능
-    components.html(html, height=720, scrolling=False)
+    # ---- p5.js 캔버스 (템플릿은 한 번만 로드, 설정값은 JSON 메시지로 전달) ----
+    _PASCAL_CANVAS(
+        {"zoom": zoom, "mod": mod, "rem": rem},
+        height=720,
+        key="pascal_modulo_canvas",
+    )
 
     # 변경 직후 캔버스 위치로 점프(스크롤 복귀)
     if st.session_state.get(JUMP) == "canvas":
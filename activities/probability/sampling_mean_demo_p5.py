@@ -11,6 +11,7 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 
 META = {
     "title": "모평균과 표본평균의 관계",
@@ -205,7 +206,7 @@ def render():
     # 빨간 점 + 짧은 수직막대(캔버스 높이의 1/4 길이)
     html1 = """
 <div id="popline" style="width:100%;max-width:980px;margin:0 auto;"></div>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.9.0/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <script>
 const DATA1 = """ + json.dumps(payload1) + """;
 new p5((p)=>{
@@ -262,7 +263,7 @@ new p5((p)=>{
 });
 </script>
 """
-    components.html(html1, height=280)
+    components.html(vendor_html(html1), height=280)
 
     # 6) 정규곡선(모집단 vs 표본평균) + 표본평균 점 (p5.js)
     st.subheader("📈 정규곡선: 모집단 N(μ, σ²) vs 표본평균 N(μ, σ²/n)")
@@ -279,7 +280,7 @@ new p5((p)=>{
     }
     html2 = """
 <div id="gauss" style="width:100%;max-width:980px;margin:0 auto;"></div>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/p5.js/1.9.0/p5.min.js"></script>
+<script src="vendor:p5/p5.min.js"></script>
 <script>
 const D2 = """ + json.dumps(payload2) + """;
 new p5((p)=>{
@@ -329,7 +330,7 @@ new p5((p)=>{
 });
 </script>
 """
-    components.html(html2, height=360)
+    components.html(vendor_html(html2), height=360)
 
     # 7) 모수 vs 표본평균(경험) 비교
     st.subheader("📊 모수 vs 표본평균(경험적) 비교")
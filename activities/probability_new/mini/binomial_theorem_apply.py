@@ -1,6 +1,7 @@
 # activities/probability_new/mini/binomial_theorem_apply.py
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from reflection_utils import render_reflection_form
 
 _GAS_URL    = st.secrets["gas_url_probability_new"]
@@ -36,9 +37,9 @@ _HTML = r"""<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="initApp()"></script>
 <style>
 * { box-sizing: border-box; margin: 0; padding: 0; }
@@ -699,6 +700,6 @@ def render():
         "이항계수의 다양한 성질 **8가지**를 도출할 수 있습니다. "
         "세 탭을 순서대로 탐구하고 퀴즈로 실력을 확인해보세요!"
     )
-    components.html(_HTML, height=1600, scrolling=True)
+    components.html(vendor_html(_HTML), height=1600, scrolling=True)
     st.markdown("---")
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 import datetime
@@ -34,7 +35,7 @@ META = {
 def render():
     st.header("🎲 정육면체 최단경로 탐구")
     st.caption("같은 것이 있는 순열 — 정육면체의 모서리를 따라 이동하는 최단경로의 수를 구해봅니다.")
-    components.html(_build_html(), height=1100, scrolling=True)
+    components.html(vendor_html(_build_html()), height=1100, scrolling=True)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
 
 
@@ -44,9 +45,9 @@ def _build_html() -> str:
 <html lang="ko">
 <head>
 <meta charset="UTF-8">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[
     {left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}
   ]})"></script>
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from reflection_utils import render_reflection_form
 
 _GAS_URL = st.secrets["gas_url_probability_new"]
@@ -31,7 +32,7 @@ def render():
         "집합 A = {a₁, …, aₘ}, B = {b₁, …, bₙ}에서 함수 f : A → B의 종류별 개수를 "
         "중복순열·순열·조합·중복조합으로 탐구합니다."
     )
-    components.html(_build_html(), height=1850, scrolling=True)
+    components.html(vendor_html(_build_html()), height=1850, scrolling=True)
 
     # ── 성찰 기록 폼 ────────────────────────────────────────────────────────
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
@@ -43,9 +44,9 @@ def _build_html() -> str:
 <html lang="ko">
 <head>
 <meta charset="UTF-8">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[
     {left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}
   ]})"></script>
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from reflection_utils import render_reflection_form
 
 _GAS_URL = st.secrets["gas_url_probability_new"]
@@ -32,7 +33,7 @@ def render():
         "$(1+x+x^2)^n$ 처럼 한 문자의 이차 이상 다항식은 **이항정리** — "
         "두 경우를 확실히 구분해 봅시다!"
     )
-    components.html(_build_html(), height=1600, scrolling=True)
+    components.html(vendor_html(_build_html()), height=1600, scrolling=True)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
 
 
@@ -42,9 +43,9 @@ def _build_html() -> str:
 <html lang="ko">
 <head>
 <meta charset="UTF-8">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[
     {left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}
   ]})"></script>
@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from reflection_utils import render_reflection_form
 
 _GAS_URL    = st.secrets["gas_url_probability_new"]
@@ -31,7 +32,7 @@ _HTML = r"""
 <html>
 <head>
 <meta charset="utf-8">
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+<script src="vendor:chart.js/chart.umd.min.js"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
 body{font-family:'Segoe UI',system-ui,sans-serif;background:linear-gradient(135deg,#0a1628 0%,#0f2027 50%,#0a1628 100%);padding:14px 12px;color:#e2e8f0;font-size:18px}
@@ -501,7 +502,7 @@ window.addEventListener('load', update);
 
 def render():
     st.header("📊 이산확률변수의 기댓값 · 분산 · 표준편차")
-    components.html(_HTML, height=2900, scrolling=False)
+    components.html(vendor_html(_HTML), height=2900, scrolling=False)
 
     # ── 성찰 기록 폼 ────────────────────────────────────────────────────────
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
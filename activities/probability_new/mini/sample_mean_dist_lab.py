@@ -9,6 +9,7 @@
 import json
 import streamlit as st
 import streamlit.components.v1 as components
+from dist_utils import sum_counts
 from reflection_utils import render_reflection_form
 
 META = {
@@ -469,6 +470,7 @@ table.alltab .more{
 <script>
 const POP = __POP__;
 const MAX_N = __MAX_N__;
+const SUM_TABLE = __SUM_TABLE__;   // {n: [합 목록, 경우의 수 목록]}
 const BALL_BG = "__BALL_BG__";
 const BALL_BORDER = "__BALL_BORDER__";
 const BALL_TXT = "__BALL_TXT__";
@@ -537,16 +539,12 @@ function sampleOnce(nn){
 }
 
 function enumerateAll(nn){
-  // N^n 경우 전체 열거
-  const total = Math.pow(N_POP, nn);
-  const arr = new Array(total);
-  for(let i=0;i<total;i++){
-    let k = i, s = 0;
-    for(let j=0;j<nn;j++){
-      s += POP[k % N_POP];
-      k = Math.floor(k/N_POP);
-    }
-    arr[i] = s/nn;
+  // N^n 경우 전체: 서버에서 계산한 "합별 경우의 수" 표를 펼침(합 오름차순)
+  const [sums, cnts] = SUM_TABLE[nn];
+  const arr = [];
+  for(let i=0;i<sums.length;i++){
+    const xb = sums[i]/nn;
+    for(let c=0;c<cnts[i];c++) arr.push(xb);
   }
   return arr;
 }
@@ -856,6 +854,15 @@ init();
 """
 
 
+def _sum_table(pop, max_n):
+    """n=1..max_n 별 표본합의 정확한 경우의 수 {n: [합 목록, 경우의 수 목록]}."""
+    table = {}
+    for n in range(1, max_n + 1):
+        sums, counts = sum_counts(pop, n)
+        table[n] = [sums.tolist(), counts.tolist()]
+    return table
+
+
 def _make_html(*, title, pop, max_n, pop_icon, pop_label,
                ball_bg, ball_border, ball_txt,
                bg_mid, hdr_a, hdr_b, hdr_border, hdr_txt, acc, acc_dim):
@@ -864,6 +871,7 @@ def _make_html(*, title, pop, max_n, pop_icon, pop_label,
         .replace("__TITLE__", title)
         .replace("__POP__", json.dumps(pop))
         .replace("__MAX_N__", str(max_n))
+        .replace("__SUM_TABLE__", json.dumps(_sum_table(pop, max_n)))
         .replace("__POP_ICON__", pop_icon)
         .replace("__POP_LABEL__", pop_label)
         .replace("__BALL_BG__", ball_bg)
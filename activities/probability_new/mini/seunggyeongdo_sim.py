@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 from reflection_utils import render_reflection_form
 
 _GAS_URL    = st.secrets["gas_url_probability_new"]
@@ -27,7 +28,7 @@ META = {
 
 _HTML = (
     '<!doctype html><html><head><meta charset="utf-8">'
-    '<script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>'
+    '<script src="vendor:chart.js/chart.umd.min.js"></script>'
     '<style>'
     '*{box-sizing:border-box;margin:0;padding:0}'
     'body{font-family:\'Segoe UI\',system-ui,sans-serif;background:linear-gradient(135deg,#0a1628 0%,#0f2027 50%,#0a1628 100%);padding:8px 10px;color:#e2e8f0}'
@@ -396,5 +397,5 @@ def render():
     board_uri  = _load_img_b64("probability_new/seunggyeongdo_board.png")
     yunmok_uri = _load_img_b64("probability_new/yunmok.png")
     html = _HTML.replace("##BOARD_IMG##", board_uri).replace("##YUNMOK_IMG##", yunmok_uri)
-    components.html(html, height=1600, scrolling=True)
+    components.html(vendor_html(html), height=1600, scrolling=True)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
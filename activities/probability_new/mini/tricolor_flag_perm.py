@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 import datetime
@@ -33,16 +34,16 @@ def render():
 - 아래 활동에서 삼색기를 직접 만들고 가능한 경우의 수를 탐구해 보세요.
 """)
 
-    components.html(r"""
+    components.html(vendor_html(r"""
 <!doctype html>
 <html>
 <head>
 <meta charset="utf-8"/>
 <script src="https://d3js.org/d3.v7.min.js"></script>
 <script src="https://cdn.jsdelivr.net/npm/topojson-client@3/dist/topojson-client.min.js"></script>
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[{left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}],throwOnError:false})"></script>
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
@@ -672,7 +673,7 @@ buildBuilderStripes();
 </script>
 </body>
 </html>
-""", height=1950, scrolling=True)
+"""), height=1950, scrolling=True)
 
     _render_quiz(_SHEET_NAME)
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
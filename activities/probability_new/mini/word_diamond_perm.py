@@ -1,5 +1,6 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from vendor_utils import vendor_html
 import requests
 from reflection_utils import render_reflection_form
 import datetime
@@ -31,7 +32,7 @@ def render():
     st.header("💎 단어 다이아몬드와 같은 것이 있는 순열")
     st.caption("홀수 글자 단어를 다이아몬드 격자 두 변에 배치하고, 위 꼭짓점에서 아래로 이웃한 칸을 하나씩 선택하여 원래 단어를 만드는 경우의 수를 탐구합니다.")
 
-    components.html(_build_html(), height=1500, scrolling=True)
+    components.html(vendor_html(_build_html()), height=1500, scrolling=True)
     _render_quiz()
     render_reflection_form(_SHEET_NAME, _GAS_URL, _QUESTIONS)
 
@@ -44,9 +45,9 @@ def _build_html() -> str:
 <meta charset="UTF-8">
 <link rel="preconnect" href="https://fonts.googleapis.com">
 <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;600;700;900&family=JetBrains+Mono:wght@400;700&display=swap" rel="stylesheet">
-<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.css">
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/katex.min.js"></script>
-<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.10/dist/contrib/auto-render.min.js"
+<link rel="stylesheet" href="vendor:katex/katex.min.css">
+<script defer src="vendor:katex/katex.min.js"></script>
+<script defer src="vendor:katex/contrib/auto-render.min.js"
   onload="renderMathInElement(document.body,{delimiters:[
     {left:'$$',right:'$$',display:true},{left:'$',right:'$',display:false}
   ],throwOnError:false})"></script>
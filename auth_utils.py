@@ -260,6 +260,8 @@ def _clear_auth_caches(*, clear_users: bool = False,
         if clear_teacher_settings:
             _cached_teacher_settings.clear()
             _cached_teacher_roster.clear()
+        if clear_users or clear_grade_perms or clear_group_perms or clear_group_lesson_perms:
+            bump_permission_version()
     except Exception:
         pass
 
@@ -976,68 +978,122 @@ def _authenticate_inner(user_id: str, password: str) -> Optional[dict]:
     return None
 
 
-def get_user_permission_snapshot(user_type: str, user_id: str) -> Optional[dict]:
-    """현재 시트 기준으로 사용자의 최신 권한 스냅샷을 반환합니다.
-    서버 혼잡(SheetsUnavailableError) 시 None을 반환하며 호출자는 기존 세션 값을 유지해야 합니다.
-    """
-    if not user_type or not user_id:
-        return None
-    try:
-        return _get_user_permission_snapshot_inner(user_type, user_id)
-    except SheetsUnavailableError:
-        return None
+# ── 권한 스냅샷 서비스 (프로세스 공용) ─────────────────────────────────────
+# 권한 버전 1개당 모든 사용자의 유효 권한표를 한 번만 계산합니다.
+# 세션은 버전 정수만 비교하고, 버전이 바뀐 경우에만 자기 스냅샷을 다시 읽습니다.
+# 버전은 권한/사용자 캐시를 비울 때(_clear_auth_caches — 회원관리 저장 포함)와
+# 시트를 직접 고친 경우를 위해 _PERM_TABLE_TTL 초가 지났을 때 올라갑니다.
+_PERM_TABLE_TTL = 300
 
 
-def _get_user_permission_snapshot_inner(user_type: str, user_id: str) -> Optional[dict]:
-    """실제 구현 — SheetsUnavailableError를 그대로 전파합니다."""
-    if user_type == "admin":
-        return {
-            "type": "admin",
-            "id": ADMIN_ID,
-            "name": "관리자",
-            "grade": None,
-            "group": None,
-            "allowed_subjects": None,
-            "allowed_lessons": None,
-        }
+class _PermissionService:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = 1
+        self.version_at = time.monotonic()
+        self.built_version = 0
+        self.table: dict[tuple[str, str], dict] = {}
 
-    sheet_id = _get_users_spreadsheet_id()
+    def current_version(self) -> int:
+        if time.monotonic() - self.version_at >= _PERM_TABLE_TTL:
+            self.bump()
+        return self.version
+
+    def bump(self) -> None:
+        with self.lock:
+            self.version += 1
+            self.version_at = time.monotonic()
 
-    if user_type == "student":
+    def _build(self) -> dict[tuple[str, str], dict]:
+        """학생·일반인 전체의 유효 권한표 생성. SheetsUnavailableError는 그대로 전파."""
+        sheet_id = _get_users_spreadsheet_id()
+        table: dict[tuple[str, str], dict] = {}
+        grade_perms = _cached_grade_perms(sheet_id)
         for row in _cached_students(sheet_id):
-            if str(row.get("아이디", "")).strip() != user_id:
+            uid = str(row.get("아이디", "")).strip()
+            if not uid or ("student", uid) in table:
                 continue
             grade = str(row.get("학년", "")).strip()
-            grade_perms = _cached_grade_perms(sheet_id)
-            return {
+            table[("student", uid)] = {
                 "type": "student",
-                "id": user_id,
+                "id": uid,
                 "name": str(row.get("이름", "")),
                 "grade": grade,
                 "group": None,
                 "allowed_subjects": grade_perms.get(grade, set()),
                 "allowed_lessons": None,
             }
-        return None
-
-    if user_type == "general":
+        group_perms = _cached_group_perms(sheet_id)
+        lesson_perms = _cached_group_lesson_perms(sheet_id)
         for row in _cached_general(sheet_id):
-            if str(row.get("아이디", "")).strip() != user_id:
+            uid = str(row.get("아이디", "")).strip()
+            if not uid or ("general", uid) in table:
                 continue
             group = _normalize_group_name(row.get("그룹", ""))
-            group_perms = _cached_group_perms(sheet_id)
-            lesson_perms = _cached_group_lesson_perms(sheet_id)
-            return {
+            table[("general", uid)] = {
                 "type": "general",
-                "id": user_id,
+                "id": uid,
                 "name": str(row.get("이름", "")),
                 "grade": None,
                 "group": group,
                 "allowed_subjects": group_perms.get(group, set()) if group else set(),
                 "allowed_lessons": lesson_perms.get(group, {}) if group else {},
             }
+        return table
+
+    def snapshot(self, user_type: str, user_id: str) -> Optional[dict]:
+        version = self.current_version()
+        if self.built_version != version:
+            with self.lock:
+                if self.built_version != self.version:
+                    target = self.version
+                    self.table = self._build()
+                    self.built_version = target
+        snap = self.table.get((user_type, user_id))
+        return dict(snap) if snap else None
+
+
+@st.cache_resource(show_spinner=False)
+def _get_permission_service() -> _PermissionService:
+    return _PermissionService()
+
+
+def get_permission_version() -> int:
+    """현재 권한 버전. 세션은 이 값이 바뀌었을 때만 권한을 다시 읽으면 됩니다."""
+    return _get_permission_service().current_version()
+
+
+def bump_permission_version() -> None:
+    """권한 관련 데이터가 바뀌었음을 모든 세션에 알립니다."""
+    _get_permission_service().bump()
+
+
+def get_user_permission_snapshot(user_type: str, user_id: str) -> Optional[dict]:
+    """현재 시트 기준으로 사용자의 최신 권한 스냅샷을 반환합니다.
+    서버 혼잡(SheetsUnavailableError) 시 None을 반환하며 호출자는 기존 세션 값을 유지해야 합니다.
+    """
+    if not user_type or not user_id:
+        return None
+    try:
+        return _get_user_permission_snapshot_inner(user_type, user_id)
+    except SheetsUnavailableError:
         return None
 
+
+def _get_user_permission_snapshot_inner(user_type: str, user_id: str) -> Optional[dict]:
+    """실제 구현 — SheetsUnavailableError를 그대로 전파합니다."""
+    if user_type == "admin":
+        return {
+            "type": "admin",
+            "id": ADMIN_ID,
+            "name": "관리자",
+            "grade": None,
+            "group": None,
+            "allowed_subjects": None,
+            "allowed_lessons": None,
+        }
+    if user_type in ("student", "general"):
+        return _get_permission_service().snapshot(user_type, user_id)
     return None
 
 
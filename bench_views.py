@@ -0,0 +1,366 @@
+# bench_views.py — home.py 뷰·활동 헤드리스 벤치마크 (Streamlit AppTest)
+"""
+가짜 secrets와 메모리 기반 가짜 gspread 백엔드로 home.py를 띄우고, 뷰(홈·교과·수업·
+관리자 화면)와 등록된 모든 활동 slug를 차례로 렌더링하며 다음을 기록합니다.
+
+    cold_ms   st.cache_data/cache_resource를 비운 뒤 새 세션의 첫 렌더 시간
+    warm_ms   같은 세션에서 다시 렌더한 시간(중앙값)
+    peak_kb   렌더 중 tracemalloc 최대 메모리
+    payload_kb / sheets   브라우저로 보낸 ForwardMsg 크기, Sheets API 호출 수(profiler_utils)
+
+사용 예:
+    python bench_views.py                              # 전체 실행, 표 출력
+    python bench_views.py --only subject,activity --subjects probability --limit 10
+    python bench_views.py --save base.json             # 기준 결과 저장
+    python bench_views.py --compare base.json --threshold 0.25
+        → warm_ms·payload_kb가 기준 대비 25% 넘게 늘어난 항목이 있으면 종료 코드 1
+
+외부 네트워크·실제 시트에 접근하지 않습니다(gspread·서비스 계정 인증을 가짜로 대체).
+"""
+import argparse
+import ast
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).parent
+HOME = ROOT / "home.py"
+ACTIVITIES_ROOT = ROOT / "activities"
+
+# 회귀 판정 시 이보다 작은 절대 증가는 무시(측정 잡음)
+_MIN_DELTA_MS = 5.0
+_MIN_DELTA_KB = 2.0
+
+_FAKE_SECRETS: Dict[str, Any] = {
+    "gcp_service_account": {
+        "type": "service_account",
+        "project_id": "bench",
+        "private_key_id": "bench",
+        "private_key": "bench",
+        "client_email": "bench@bench.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    },
+    "spreadsheet_id": "bench-main",
+    "users_spreadsheet_id": "bench-users",
+    "survey_spreadsheet_id": "bench-survey",
+    "reflection_spreadsheet_common": "bench-refl-common",
+    "reflection_spreadsheet_probability_new": "bench-refl-prob",
+    "gas_url_common": "http://127.0.0.1:9/bench",
+    "gas_url_probability_new": "http://127.0.0.1:9/bench",
+    "local_debug_mode": False,
+}
+
+_ADMIN_SESSION = {
+    "_authenticated": True, "_user_type": "admin",
+    "_user_id": "admin", "_user_name": "관리자",
+    "_dev_mode": True, "_login_allowed_subjects": None,
+    "_login_allowed_lessons": None, "_visit_logged": True,
+    "_profiler_on": True,
+}
+
+
+# ── 가짜 gspread 백엔드 ─────────────────────────────────────────────────────────
+def _api() -> None:
+    """실제 백엔드였다면 Sheets API 요청이 나갔을 호출을 프로파일러에 기록합니다."""
+    import profiler_utils
+    profiler_utils.record_sheets_call()
+
+
+class _FakeWorksheet:
+    """메모리 행 목록으로 동작하는 최소 Worksheet. 모르는 메서드는 빈 결과를 돌려줍니다."""
+
+    def __init__(self, title: str, rows: int = 1000, cols: int = 26):
+        self.title = title
+        self.id = abs(hash(title)) % 10_000_000
+        self.row_count = rows
+        self.col_count = cols
+        self._rows: List[List[str]] = []
+
+    def get_all_values(self, *args, **kwargs) -> List[List[str]]:
+        _api()
+        return [list(r) for r in self._rows]
+
+    def get_all_records(self, *args, **kwargs) -> List[Dict[str, str]]:
+        _api()
+        if not self._rows:
+            return []
+        header = self._rows[0]
+        return [dict(zip(header, r + [""] * (len(header) - len(r)))) for r in self._rows[1:]]
+
+    def get(self, *args, **kwargs) -> List[List[str]]:
+        _api()
+        return [list(r) for r in self._rows]
+
+    def row_values(self, row: int, *args, **kwargs) -> List[str]:
+        _api()
+        return list(self._rows[row - 1]) if 0 < row <= len(self._rows) else []
+
+    def col_values(self, col: int, *args, **kwargs) -> List[str]:
+        _api()
+        return [r[col - 1] if len(r) >= col else "" for r in self._rows]
+
+    def append_row(self, values, *args, **kwargs) -> None:
+        _api()
+        self._rows.append([str(v) for v in values])
+
+    def append_rows(self, values, *args, **kwargs) -> None:
+        _api()
+        self._rows.extend([str(v) for v in row] for row in values)
+
+    def update_cell(self, row: int, col: int, value) -> None:
+        _api()
+        while len(self._rows) < row:
+            self._rows.append([])
+        r = self._rows[row - 1]
+        while len(r) < col:
+            r.append("")
+        r[col - 1] = str(value)
+
+    def find(self, *args, **kwargs):
+        _api()
+        return None
+
+    def findall(self, *args, **kwargs) -> list:
+        _api()
+        return []
+
+    def __getattr__(self, name: str):
+        def _noop(*args, **kwargs):
+            return []
+        return _noop
+
+
+class _FakeSpreadsheet:
+    def __init__(self, key: str):
+        self.id = key
+        self.title = key
+        self._sheets: Dict[str, _FakeWorksheet] = {}
+
+    def worksheet(self, title: str) -> _FakeWorksheet:
+        _api()
+        import gspread.exceptions as gex
+        if title not in self._sheets:
+            raise gex.WorksheetNotFound(title)
+        return self._sheets[title]
+
+    def worksheets(self, *args, **kwargs) -> List[_FakeWorksheet]:
+        _api()
+        return list(self._sheets.values())
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, **kwargs) -> _FakeWorksheet:
+        _api()
+        return self._sheets.setdefault(title, _FakeWorksheet(title, rows, cols))
+
+    @property
+    def sheet1(self) -> _FakeWorksheet:
+        return self._sheets.setdefault("Sheet1", _FakeWorksheet("Sheet1"))
+
+    def __getattr__(self, name: str):
+        def _noop(*args, **kwargs):
+            return None
+        return _noop
+
+
+class _FakeClient:
+    def __init__(self):
+        self._books: Dict[str, _FakeSpreadsheet] = {}
+
+    def open_by_key(self, key: str) -> _FakeSpreadsheet:
+        _api()
+        return self._books.setdefault(key, _FakeSpreadsheet(key))
+
+    def open(self, title: str, *args, **kwargs) -> _FakeSpreadsheet:
+        return self.open_by_key(title)
+
+    def open_by_url(self, url: str) -> _FakeSpreadsheet:
+        return self.open_by_key(url)
+
+
+def _install_fakes() -> None:
+    """gspread 인증 진입점과 서비스 계정 자격 증명 생성을 가짜로 바꿉니다."""
+    import gspread
+    from google.oauth2 import service_account
+
+    client = _FakeClient()
+    gspread.authorize = lambda *args, **kwargs: client
+    gspread.service_account_from_dict = lambda *args, **kwargs: client
+    service_account.Credentials.from_service_account_info = staticmethod(lambda *a, **k: object())
+
+
+# ── 뷰 목록 ─────────────────────────────────────────────────────────────────────
+def _subjects() -> List[str]:
+    """home.py의 SUBJECTS 리터럴을 실행 없이 읽습니다."""
+    tree = ast.parse(HOME.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "SUBJECTS" for t in node.targets
+        ):
+            return list(ast.literal_eval(node.value).keys())
+    return []
+
+
+def _activity_slugs(subject: str) -> List[str]:
+    """home.discover_activities와 같은 규칙으로 slug를 나열합니다."""
+    base = ACTIVITIES_ROOT / subject
+    if not base.is_dir():
+        return []
+    slugs = [p.stem for p in sorted(base.glob("*.py")) if not p.name.startswith("_")]
+    for sub in sorted(base.iterdir()):
+        if not sub.is_dir() or sub.name in {"lessons", "__pycache__"} or sub.name.startswith("_"):
+            continue
+        slugs += [f"{sub.name}/{p.stem}" for p in sorted(sub.glob("*.py")) if not p.name.startswith("_")]
+    return slugs
+
+
+def _targets(only: Optional[set], subjects: List[str], limit: Optional[int]) -> List[Tuple[str, str, Dict[str, str]]]:
+    """(종류, 이름, 쿼리 파라미터) 목록."""
+    out: List[Tuple[str, str, Dict[str, str]]] = [("home", "home", {"view": "home"})]
+    for view in ("visit_stats", "feedback_board", "my_reflection"):
+        out.append(("admin", view, {"view": view}))
+    for s in subjects:
+        out.append(("subject", s, {"view": "subject", "subject": s}))
+        if (ACTIVITIES_ROOT / s / "lessons").is_dir():
+            out.append(("lessons", s, {"view": "lessons", "subject": s}))
+        slugs = _activity_slugs(s)
+        if limit is not None:
+            slugs = slugs[:limit]
+        for slug in slugs:
+            out.append(("activity", f"{s}/{slug}", {"view": "activity", "subject": s, "activity": slug}))
+    if only:
+        out = [t for t in out if t[0] in only]
+    return out
+
+
+# ── 측정 ────────────────────────────────────────────────────────────────────────
+def _new_app(params: Dict[str, str], timeout: float):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(HOME), default_timeout=timeout)
+    for k, v in _FAKE_SECRETS.items():
+        at.secrets[k] = v
+    for k, v in _ADMIN_SESSION.items():
+        at.session_state[k] = v
+    for k, v in params.items():
+        at.query_params[k] = v
+    return at
+
+
+def _run_once(at) -> Tuple[float, int, float, int, Optional[str]]:
+    """한 번 렌더하고 (ms, 최대 메모리 바이트, 전송 KB, Sheets 호출, 예외 요약)."""
+    import profiler_utils
+
+    profiler_utils.reset_profile_stats()
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    at.run()
+    ms = (time.perf_counter() - t0) * 1000.0
+    _, peak = tracemalloc.get_traced_memory()
+    rerun = next((r for r in profiler_utils.profile_stats() if r["key"] == "rerun"), None)
+    kb = rerun["kb_avg"] if rerun else 0.0
+    sheets = int(round(rerun["sheets_avg"])) if rerun else 0
+    err = None
+    if at.exception:
+        err = str(at.exception[0].message).splitlines()[0][:120]
+    return ms, peak, kb, sheets, err
+
+
+def bench(targets, warm_runs: int, timeout: float) -> List[Dict[str, Any]]:
+    import streamlit as st
+
+    results = []
+    tracemalloc.start()
+    for kind, name, params in targets:
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        at = _new_app(params, timeout)
+        try:
+            cold_ms, cold_peak, kb, sheets, err = _run_once(at)
+            warm = [_run_once(at) for _ in range(warm_runs)]
+        except Exception as e:   # 타임아웃 등
+            results.append({"kind": kind, "name": name, "error": f"{type(e).__name__}: {e}"[:120]})
+            print(f"  ✗ {kind:<8} {name}  {type(e).__name__}", file=sys.stderr)
+            continue
+        row = {
+            "kind": kind,
+            "name": name,
+            "cold_ms": round(cold_ms, 1),
+            "warm_ms": round(statistics.median(w[0] for w in warm), 1) if warm else None,
+            "peak_kb": round(max([cold_peak] + [w[1] for w in warm]) / 1024.0, 1),
+            "payload_kb": round(statistics.median(w[2] for w in warm) if warm else kb, 1),
+            "sheets": max([sheets] + [w[3] for w in warm]),
+            "error": err or next((w[4] for w in warm if w[4]), None),
+        }
+        results.append(row)
+        flag = "✗" if row["error"] else "·"
+        print(f"  {flag} {kind:<8} {name:<55} cold {row['cold_ms']:>8.1f}ms  "
+              f"warm {row['warm_ms'] or 0:>8.1f}ms  {row['payload_kb']:>7.1f}KB", file=sys.stderr)
+    tracemalloc.stop()
+    return results
+
+
+def compare(results, baseline, threshold: float) -> List[str]:
+    """기준 대비 회귀 항목 설명 목록."""
+    base = {(r["kind"], r["name"]): r for r in baseline}
+    problems = []
+    for r in results:
+        b = base.get((r["kind"], r["name"]))
+        if not b or r.get("error") or b.get("error"):
+            continue
+        for field, floor in (("warm_ms", _MIN_DELTA_MS), ("payload_kb", _MIN_DELTA_KB)):
+            old, new = b.get(field), r.get(field)
+            if old is None or new is None:
+                continue
+            if new - old > floor and new > old * (1.0 + threshold):
+                problems.append(f"{r['kind']} {r['name']}: {field} {old} → {new}")
+    return problems
+
+
+def _print_table(results) -> None:
+    cols = ["kind", "name", "cold_ms", "warm_ms", "peak_kb", "payload_kb", "sheets", "error"]
+    print("\t".join(cols))
+    for r in results:
+        print("\t".join("" if r.get(c) is None else str(r.get(c)) for c in cols))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="home.py 뷰·활동 헤드리스 벤치마크")
+    ap.add_argument("--only", help="측정할 종류(home,admin,subject,lessons,activity) 쉼표 구분")
+    ap.add_argument("--subjects", help="교과 키 쉼표 구분(기본: 전체)")
+    ap.add_argument("--limit", type=int, help="교과별 활동 수 상한")
+    ap.add_argument("--warm", type=int, default=3, help="warm 렌더 반복 횟수(기본 3)")
+    ap.add_argument("--timeout", type=float, default=60.0, help="렌더 1회 제한 시간(초)")
+    ap.add_argument("--save", help="결과를 JSON으로 저장")
+    ap.add_argument("--compare", help="기준 JSON과 비교(회귀 시 종료 코드 1)")
+    ap.add_argument("--threshold", type=float, default=0.25, help="허용 증가율(기본 0.25)")
+    args = ap.parse_args(argv)
+
+    sys.path.insert(0, str(ROOT))
+    _install_fakes()
+
+    subjects = _subjects()
+    if args.subjects:
+        wanted = set(args.subjects.split(","))
+        subjects = [s for s in subjects if s in wanted]
+    only = set(args.only.split(",")) if args.only else None
+
+    results = bench(_targets(only, subjects, args.limit), args.warm, args.timeout)
+    _print_table(results)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, ensure_ascii=False, indent=1), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        problems = compare(results, baseline, args.threshold)
+        for p in problems:
+            print(f"REGRESSION  {p}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
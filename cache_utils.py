@@ -0,0 +1,205 @@
+# cache_utils.py — 세션 사이에서 공유하는 시뮬레이션 결과 캐시
+"""
+수업에서는 반 전체가 교사가 알려 준 같은 시드·같은 설정으로 같은 시뮬레이션을 돌립니다.
+순수 시뮬레이션 함수(같은 인자 + 같은 시드 → 같은 결과)에 붙이면, 30명이 같은 요청을
+보내도 계산은 프로세스에서 한 번만 일어납니다.
+
+    from cache_utils import sim_cache
+
+    @sim_cache()
+    def _simulate(n, p, repeats, seed):
+        rng = np.random.default_rng(seed)
+        ...
+
+- 키: (함수 파일·이름, 인자, 시드). 시드 인자(seed_arg)가 None이면 매번 새 난수이므로
+  캐시하지 않고 그대로 호출합니다.
+- 저장: 결과를 pickle(프로토콜 5)로 직렬화하고, 큰 결과는 zlib로 압축합니다. 꺼낼 때마다
+  새로 역직렬화하므로 호출한 쪽이 결과를 고쳐도 캐시는 그대로입니다.
+- 크기: 모든 함수가 하나의 바이트 예산(_MAX_BYTES)을 나눠 쓰는 LRU. 예산의 1/4을 넘는
+  결과는 저장하지 않습니다.
+- 같은 키를 여러 세션이 동시에 요청하면 첫 세션만 계산하고 나머지는 그 결과를 기다립니다.
+- sim_cache_stats()로 함수별 적중률·용량을 볼 수 있습니다(home.py 디버그 패널).
+
+시뮬레이션 결과 캐시는 이 데코레이터 하나로 통일합니다. st.cache_data는 시트·파일 읽기처럼
+시드가 없는 데이터 로딩에만 씁니다.
+"""
+import functools
+import hashlib
+import inspect
+import pickle
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+_MAX_BYTES = 128 << 20          # 프로세스 전체 캐시 예산(압축 후)
+_COMPRESS_MIN_BYTES = 64 << 10  # 이보다 작은 결과는 압축하지 않음
+_ZLIB_LEVEL = 1                 # 속도 우선
+_WAIT_TIMEOUT_S = 120.0         # 다른 세션의 계산을 기다리는 최대 시간
+
+_lock = threading.Lock()
+_entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+_inflight: Dict[bytes, threading.Event] = {}
+_stats: Dict[str, Dict[str, float]] = {}
+_total_bytes = 0
+
+
+class _Entry:
+    __slots__ = ("name", "blob", "compressed", "raw_bytes")
+
+    def __init__(self, name: str, blob: bytes, compressed: bool, raw_bytes: int):
+        self.name = name
+        self.blob = blob
+        self.compressed = compressed
+        self.raw_bytes = raw_bytes
+
+    def load(self) -> Any:
+        data = zlib.decompress(self.blob) if self.compressed else self.blob
+        return pickle.loads(data)
+
+
+def _stat(name: str) -> Dict[str, float]:
+    s = _stats.get(name)
+    if s is None:
+        s = _stats[name] = {"hits": 0, "misses": 0, "bypass": 0, "compute_s": 0.0}
+    return s
+
+
+def _make_key(ident: str, bound: inspect.BoundArguments) -> Optional[bytes]:
+    try:
+        payload = pickle.dumps((ident, sorted(bound.arguments.items())), protocol=5)
+    except Exception:
+        return None                                   # 피클할 수 없는 인자는 캐시하지 않음
+    return hashlib.blake2b(payload, digest_size=20).digest()
+
+
+def _store(key: bytes, name: str, value: Any) -> None:
+    global _total_bytes
+    try:
+        raw = pickle.dumps(value, protocol=5)
+    except Exception:
+        return
+    compressed = len(raw) >= _COMPRESS_MIN_BYTES
+    blob = zlib.compress(raw, _ZLIB_LEVEL) if compressed else raw
+    if compressed and len(blob) >= len(raw):
+        blob, compressed = raw, False                 # 난수 float처럼 잘 안 줄면 원본으로
+    if len(blob) > _MAX_BYTES // 4:
+        return
+    with _lock:
+        old = _entries.pop(key, None)
+        if old is not None:
+            _total_bytes -= len(old.blob)
+        _entries[key] = _Entry(name, blob, compressed, len(raw))
+        _total_bytes += len(blob)
+        while _total_bytes > _MAX_BYTES and _entries:
+            _, ev = _entries.popitem(last=False)
+            _total_bytes -= len(ev.blob)
+
+
+def sim_cache(seed_arg: str = "seed") -> Callable:
+    """
+    순수 시뮬레이션 함수용 데코레이터. seed_arg는 시드 인자 이름이며, 그 값이 None이면
+    캐시하지 않습니다(시드 인자가 없는 함수는 항상 캐시).
+    """
+    def deco(fn: Callable) -> Callable:
+        # 활동 모듈은 파일 이름(stem)으로 로드되어 겹칠 수 있으므로 키에는 파일 경로를 씀
+        ident = f"{fn.__code__.co_filename}:{fn.__qualname__}"
+        name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+        sig = inspect.signature(fn)
+        has_seed = seed_arg in sig.parameters
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = None
+            if not has_seed or bound.arguments[seed_arg] is not None:
+                key = _make_key(ident, bound)
+            if key is None:
+                with _lock:
+                    _stat(name)["bypass"] += 1
+                return fn(*args, **kwargs)
+
+            while True:
+                with _lock:
+                    entry = _entries.get(key)
+                    if entry is not None:
+                        _entries.move_to_end(key)
+                        _stat(name)["hits"] += 1
+                        break
+                    event = _inflight.get(key)
+                    if event is None:
+                        event = _inflight[key] = threading.Event()
+                        _stat(name)["misses"] += 1
+                        owner = True
+                    else:
+                        owner = False
+                if owner:
+                    t0 = time.perf_counter()
+                    try:
+                        value = fn(*args, **kwargs)
+                        _store(key, name, value)
+                    finally:
+                        with _lock:
+                            _stat(name)["compute_s"] += time.perf_counter() - t0
+                            _inflight.pop(key, None)
+                        event.set()
+                    return value
+                # 다른 세션이 계산 중: 끝나면 캐시에서 꺼냄(저장 안 됐으면 직접 계산)
+                if not event.wait(_WAIT_TIMEOUT_S):
+                    return fn(*args, **kwargs)
+                with _lock:
+                    if key not in _entries:
+                        _stat(name)["misses"] += 1
+                        miss = True
+                    else:
+                        miss = False
+                if miss:
+                    return fn(*args, **kwargs)
+            return entry.load()
+
+        wrapper.sim_cache_name = name
+        return wrapper
+    return deco
+
+
+# ── 통계 ──────────────────────────────────────────────────────────────────────
+def sim_cache_stats() -> List[Dict[str, Any]]:
+    """함수별 적중/실패/우회 횟수, 적중률, 보관 항목 수·KB(적중 많은 순)."""
+    with _lock:
+        stats = {k: dict(v) for k, v in _stats.items()}
+        held: Dict[str, List[int]] = {}
+        for e in _entries.values():
+            h = held.setdefault(e.name, [0, 0, 0])
+            h[0] += 1; h[1] += len(e.blob); h[2] += e.raw_bytes
+    rows = []
+    for name, s in stats.items():
+        looked = s["hits"] + s["misses"]
+        n_entries, nbytes, raw = held.get(name, [0, 0, 0])
+        rows.append({
+            "function": name,
+            "hits": int(s["hits"]), "misses": int(s["misses"]), "bypass": int(s["bypass"]),
+            "hit_rate": round(s["hits"] / looked, 3) if looked else 0.0,
+            "entries": n_entries,
+            "kb": round(nbytes / 1024.0, 1),
+            "ratio": round(raw / nbytes, 2) if nbytes else 0.0,
+            "compute_s": round(s["compute_s"], 2),
+        })
+    rows.sort(key=lambda r: r["hits"], reverse=True)
+    return rows
+
+
+def sim_cache_usage() -> Dict[str, Any]:
+    """캐시 전체 사용량(항목 수, KB, 예산 KB)."""
+    with _lock:
+        return {"entries": len(_entries), "kb": round(_total_bytes / 1024.0, 1),
+                "budget_kb": _MAX_BYTES // 1024}
+
+
+def clear_sim_cache() -> None:
+    global _total_bytes
+    with _lock:
+        _entries.clear()
+        _stats.clear()
+        _total_bytes = 0
@@ -0,0 +1,142 @@
+# component_utils.py — 정적 템플릿 + JSON 파라미터 양방향 컴포넌트
+"""
+활동 HTML에 파이썬 값을 f-string으로 박아 components.html을 다시 호출하면, 슬라이더를
+움직일 때마다 iframe이 새로 만들어지고 p5 등 라이브러리와 캔버스 상태가 모두 초기화됩니다.
+
+param_component()는 템플릿 HTML을 파일로 기록해 선언형 컴포넌트로 등록하고,
+이후 rerun에서는 작은 JSON 파라미터만 iframe에 메시지로 보냅니다. iframe은 그대로 남아
+캔버스 상태를 유지합니다. 기록·선언은 모듈을 불러올 때가 아니라 첫 렌더링 때 하며,
+라이브러리 번들을 새로 받으면(vendor_utils의 번들 세대가 바뀌면) CDN 주소 대신 로컬 주소를
+담은 새 <이름>_<해시> 컴포넌트로 한 번 다시 선언합니다.
+
+템플릿 쪽 JS API (브리지 스크립트가 <head> 맨 앞에 자동 삽입됨):
+    MathLab.onParams(fn)   파라미터가 바뀔 때마다 fn(params) 호출(최초 1회 포함)
+    MathLab.params()       마지막으로 받은 파라미터
+    MathLab.send(value)    값을 파이썬으로 돌려보냄(컴포넌트 반환값)
+    MathLab.setHeight(h)   iframe 높이 조정
+
+템플릿 파일을 쓸 수 없으면 파라미터를 박은 components.html로 폴백합니다.
+"""
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import streamlit.components.v1 as components
+
+from vendor_utils import bundle_generation, vendor_html
+
+_COMPONENT_DIR = Path(__file__).parent / "static" / "components"
+
+# 선언형 컴포넌트 iframe은 <base>/component/<이름>/index.html 에서 열리므로
+# 앱 정적 경로(app/static/...)는 두 단계 위입니다.
+_COMPONENT_BASE = "../../"
+
+_BRIDGE_JS = """<script>
+(function () {
+  var listeners = [], last = null, lastJson = null, height = null;
+  function post(type, extra) {
+    var msg = Object.assign({ isStreamlitMessage: true, type: type }, extra || {});
+    window.parent.postMessage(msg, "*");
+  }
+  function deliver(p) {
+    var s = JSON.stringify(p);
+    if (s === lastJson) return;
+    lastJson = s; last = p;
+    listeners.forEach(function (fn) { fn(p); });
+  }
+  window.MathLab = {
+    onParams: function (fn) { listeners.push(fn); if (last !== null) fn(last); },
+    params: function () { return last; },
+    send: function (value) { post("streamlit:setComponentValue", { value: value, dataType: "json" }); },
+    setHeight: function (h) { height = h; post("streamlit:setFrameHeight", { height: h }); }
+  };
+  window.addEventListener("message", function (ev) {
+    var d = ev.data;
+    if (!d || d.type !== "streamlit:render") return;
+    var args = d.args || {};
+    if (args.height && args.height !== height) window.MathLab.setHeight(args.height);
+    deliver(args.params || {});
+  });
+  if (window.__MATHLAB_PARAMS__) deliver(window.__MATHLAB_PARAMS__);
+  post("streamlit:componentReady", { apiVersion: 1 });
+})();
+</script>
+"""
+
+_declared: dict[str, Callable[..., Any]] = {}   # "<이름>_<해시>" → 선언된 컴포넌트
+_declared_lock = threading.Lock()
+
+
+def _with_bridge(html: str) -> str:
+    """브리지 스크립트를 <head> 바로 뒤(없으면 맨 앞)에 넣습니다."""
+    lower = html.lower()
+    idx = lower.find("<head>")
+    if idx >= 0:
+        idx += len("<head>")
+        return html[:idx] + "\n" + _BRIDGE_JS + html[idx:]
+    return _BRIDGE_JS + html
+
+
+def _declare(name: str, page: str) -> Optional[Callable[..., Any]]:
+    """index.html을 기록하고 컴포넌트를 선언합니다. 기록 실패 시 None."""
+    digest = hashlib.sha1(page.encode("utf-8")).hexdigest()[:10]
+    comp_name = f"{name}_{digest}"
+    with _declared_lock:
+        if comp_name in _declared:
+            return _declared[comp_name]
+        comp_dir = _COMPONENT_DIR / comp_name
+        index = comp_dir / "index.html"
+        try:
+            if not index.exists():
+                comp_dir.mkdir(parents=True, exist_ok=True)
+                tmp = index.with_suffix(".tmp")
+                tmp.write_text(page, encoding="utf-8")
+                tmp.replace(index)
+                # 같은 이름의 이전 해시 디렉터리 정리
+                for old in _COMPONENT_DIR.glob(f"{name}_" + "?" * 10):
+                    if old != comp_dir and old.is_dir():
+                        for f in old.iterdir():
+                            f.unlink(missing_ok=True)
+                        old.rmdir()
+        except OSError:
+            return None
+        func = components.declare_component(comp_name, path=str(comp_dir))
+        _declared[comp_name] = func
+        return func
+
+
+def param_component(name: str, html: str) -> Callable[..., Any]:
+    """정적 템플릿 HTML로 양방향 컴포넌트를 만들고 호출 함수를 돌려줍니다.
+
+    반환 함수: render(params, *, height, key, default=None) → MathLab.send() 로 받은 값
+    같은 key로 호출하는 동안 iframe은 유지되고 params만 JSON 메시지로 전달됩니다.
+    모듈 최상위에서 한 번 호출해 두는 것을 권장합니다(파일 기록은 첫 render 때).
+    """
+    declared: dict[str, Any] = {"gen": None, "func": None}
+
+    def _resolve() -> Optional[Callable[..., Any]]:
+        # 세대를 먼저 읽음: 변환 도중 번들이 완성되면 다음 호출에서 다시 선언됨
+        gen = bundle_generation()
+        if declared["gen"] != gen:
+            page = _with_bridge(vendor_html(html, base=_COMPONENT_BASE))
+            declared["func"] = _declare(name, page)
+            declared["gen"] = gen
+        return declared["func"]
+
+    def render(params: dict, *, height: int, key: str, default: Any = None) -> Any:
+        func = _resolve()
+        if func is not None:
+            return func(params=params, height=height, key=key, default=default)
+        # 폴백: 파라미터를 박아 넣은 일반 iframe(매번 다시 로드됨)
+        inline = _with_bridge(vendor_html(html))
+        inline = inline.replace(
+            _BRIDGE_JS,
+            f"<script>window.__MATHLAB_PARAMS__ = {json.dumps(params)};</script>\n" + _BRIDGE_JS,
+            1,
+        )
+        components.html(inline, height=height, scrolling=False)
+        return default
+
+    return render
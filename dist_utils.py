@@ -0,0 +1,237 @@
+# dist_utils.py — 이산 확률분포의 정확 계산 엔진
+"""
+시뮬레이션 대신 "정확한" 분포표가 필요한 활동에서 함께 씁니다.
+
+    from dist_utils import sum_pmf, sum_counts, binom_pmf, normal_approx_pmf
+    sums, probs = sum_pmf([1, 2, 3, 4, 5, 6], n=100)     # 주사위 100개 눈의 합
+    sums, counts = sum_counts([1, 3, 4, 4, 6, 6], n=2)   # 경우의 수(정수)
+    pmf = binom_pmf(2000, 0.5)                           # k = 0..n 전체, 로그 공간 계산
+
+- 모집단 값들에서 복원추출한 n개의 합 S = X₁+…+Xₙ 의 분포를 단일 추출 pmf의
+  n중 합성곱으로 구합니다. 합성곱은 FFT(rfft/irfft)로, n제곱은 분할정복(제곱을 반복)으로
+  하며, 매 단계 1e-14 미만 항을 0으로 자르고 합을 1로 다시 맞춘 뒤 양 끝 0을 잘라 냅니다.
+  그래서 n이 커져도 표본 추출 근사로 바꾸지 않고, 배열 길이는 실제 퍼진 폭(∝√n)만 큽니다.
+- 값들의 최대공약수 간격(예: {2,4,6,8} → 2)으로 격자를 줄여 길이를 아낍니다.
+- 결과는 (정렬한 값 튜플, n)으로 메모이즈하며, 공유되므로 읽기 전용 배열입니다.
+- 이항분포 이론 곡선은 log C(n,k) = lgamma(n+1) − lgamma(k+1) − lgamma(n−k+1)로 로그 공간에서
+  한 번에 계산하므로 n이 수천~수백만이어도 넘침·언더플로 없이 밀리초 단위입니다.
+  정규근사(연속성 보정 유무)와 함께 (n, p)로 메모이즈합니다. 정규근사의 Φ는 벡터화된
+  scipy.special.erf를 쓰며, scipy는 처음 정규근사를 계산할 때 지연 import합니다.
+"""
+import math
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from lazy_utils import lazy_from
+
+_FLOOR = 1e-14              # 이보다 작은 확률은 0으로(반올림 잡음 제거)
+_DIRECT_MAX = 64            # 두 배열 길이의 곱이 이 제곱 이하면 np.convolve가 더 빠름
+_MAX_SUPPORT = 1 << 24      # 합 격자 길이 상한(메모리 보호)
+_EXACT_COUNT_MAX = 10 ** 12 # sum_counts 상한: 1/전체 경우의 수가 _FLOOR보다 충분히 커야 함
+_TAIL_SD = 10.0            # 정규근사 막대: ±8.3σ 밖은 erf가 ±1로 반올림되어 이미 정확히 0
+
+
+# ── 합성곱 ────────────────────────────────────────────────────────────────────
+def _fft_convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    size = a.shape[0] + b.shape[0] - 1
+    if a.shape[0] * b.shape[0] <= _DIRECT_MAX * _DIRECT_MAX:
+        return np.convolve(a, b)
+    nfft = 1 << (size - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, nfft) * np.fft.rfft(b, nfft), nfft)[:size]
+
+
+def _clean(c: np.ndarray) -> Tuple[np.ndarray, int]:
+    """잡음 항을 0으로 자르고 합을 1로 맞춘 뒤, 양 끝 0을 잘라 (배열, 앞에서 자른 칸 수)."""
+    c[c < _FLOOR] = 0.0
+    nz = np.flatnonzero(c)
+    if nz.size == 0:
+        raise ValueError("distribution vanished below the probability floor")
+    c = c[nz[0]: nz[-1] + 1]
+    c /= c.sum()
+    return c, int(nz[0])
+
+
+# ── 합의 정확 분포 ────────────────────────────────────────────────────────────
+@lru_cache(maxsize=128)
+def _sum_pmf_cached(values: Tuple[int, ...], n: int) -> Tuple[np.ndarray, np.ndarray]:
+    vals = np.asarray(values, dtype=np.int64)
+    lo = int(vals[0])
+    step = int(np.gcd.reduce(vals - lo)) or 1
+    base = np.bincount((vals - lo) // step).astype(np.float64) / vals.size
+
+    res = np.ones(1); shift = 0            # shift: 격자(step 단위)에서 res[0]의 위치
+    power = base; power_shift = 0
+    k = n
+    while k:
+        if k & 1:
+            res, cut = _clean(_fft_convolve(res, power))
+            shift += power_shift + cut
+        k >>= 1
+        if k:
+            power, cut = _clean(_fft_convolve(power, power))
+            power_shift = 2 * power_shift + cut
+        if res.shape[0] > _MAX_SUPPORT or power.shape[0] > _MAX_SUPPORT:
+            raise ValueError("sum support too large")
+
+    sums = n * lo + step * (shift + np.arange(res.shape[0], dtype=np.int64))
+    sums.flags.writeable = False
+    res.flags.writeable = False
+    return sums, res
+
+
+def sum_pmf(values: Sequence[int], n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정수 values에서 복원추출한 n개의 합의 분포 (합 배열, 확률 배열).
+    합은 오름차순이며 간격은 values의 최대공약수 간격입니다(중간에 확률 0인 칸이 있을 수 있음).
+    """
+    n = int(n)
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    if len(values) == 0:
+        raise ValueError("values must not be empty")
+    if any(float(v) != int(v) for v in values):
+        raise ValueError("values must be integers")
+    return _sum_pmf_cached(tuple(sorted(int(v) for v in values)), n)
+
+
+def sum_counts(values: Sequence[int], n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    sum_pmf와 같은 합에 대해 경우의 수(len(values)^n 중 몇 가지인지, int64).
+    정수로 정확히 되돌릴 수 있도록 전체 경우의 수가 10¹² 이하일 때만 지원합니다.
+    """
+    total = len(values) ** int(n)
+    if total > _EXACT_COUNT_MAX:
+        raise ValueError("too many outcomes for exact integer counts")
+    sums, probs = sum_pmf(values, n)
+    counts = np.rint(probs * total).astype(np.int64)
+    keep = counts > 0
+    return sums[keep], counts[keep]
+
+
+def mean_pmf(values: Sequence[int], n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """표본평균 X̄ = S/n 의 분포 (평균값 배열, 확률 배열)."""
+    sums, probs = sum_pmf(values, n)
+    return sums / float(n), probs
+
+
+def sum_pmf_cache_info():
+    """메모이즈 통계(functools.lru_cache의 hits/misses/currsize)."""
+    return _sum_pmf_cached.cache_info()
+
+
+# ── 이항분포 이론 곡선(로그 공간) ─────────────────────────────────────────────
+_LGAMMA_SMALL = np.array([math.lgamma(x) for x in range(1, 17)])   # lgamma(1..16)
+
+
+def _lgamma_int(x: np.ndarray) -> np.ndarray:
+    """정수 x ≥ 1 에 대한 lgamma(x). 작은 값은 표, 나머지는 스털링 급수(상대오차 ~1e-16)."""
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    small = x <= 16
+    out[small] = _LGAMMA_SMALL[x[small].astype(np.int64) - 1]
+    z = x[~small]
+    inv = 1.0 / z
+    inv2 = inv * inv
+    series = inv * (1.0 / 12 - inv2 * (1.0 / 360 - inv2 * (1.0 / 1260 - inv2 / 1680)))
+    out[~small] = (z - 0.5) * np.log(z) - z + 0.5 * math.log(2.0 * math.pi) + series
+    return out
+
+
+def _check_np(n: int, p: float) -> Tuple[int, float]:
+    n = int(n); p = float(p)
+    if n < 0 or not (0.0 <= p <= 1.0):
+        raise ValueError("need n >= 0 and 0 <= p <= 1")
+    return n, p
+
+
+@lru_cache(maxsize=64)
+def _binom_pmf_cached(n: int, p: float) -> np.ndarray:
+    k = np.arange(n + 1, dtype=np.float64)
+    if p == 0.0 or p == 1.0:
+        pmf = np.zeros(n + 1)
+        pmf[0 if p == 0.0 else n] = 1.0
+    else:
+        log_c = _lgamma_int(np.array([n + 1.0]))[0] - _lgamma_int(k + 1) - _lgamma_int(n - k + 1)
+        pmf = np.exp(log_c + k * math.log(p) + (n - k) * math.log1p(-p))
+    pmf.flags.writeable = False
+    return pmf
+
+
+def binom_pmf(n: int, p: float) -> np.ndarray:
+    """B(n, p)의 P(X=k), k = 0..n (n+1,). 읽기 전용(공유 캐시)."""
+    return _binom_pmf_cached(*_check_np(n, p))
+
+
+@lru_cache(maxsize=64)
+def _binom_cdf_cached(n: int, p: float) -> np.ndarray:
+    cdf = np.minimum(np.cumsum(_binom_pmf_cached(n, p)), 1.0)
+    cdf.flags.writeable = False
+    return cdf
+
+
+def binom_cdf(n: int, p: float) -> np.ndarray:
+    """B(n, p)의 P(X≤k), k = 0..n."""
+    return _binom_cdf_cached(*_check_np(n, p))
+
+
+def binom_interval(n: int, p: float, a: int, b: int) -> float:
+    """정확한 P(a ≤ X ≤ b). 범위 밖 끝점은 0..n으로 자릅니다."""
+    n, p = _check_np(n, p)
+    a = max(0, int(a)); b = min(n, int(b))
+    if a > b:
+        return 0.0
+    cdf = _binom_cdf_cached(n, p)
+    return float(cdf[b] - (cdf[a - 1] if a > 0 else 0.0))
+
+
+_erf = lazy_from("scipy.special", "erf")   # 벡터화된 ufunc, 첫 호출 때 import
+
+
+def _phi_cdf(z: np.ndarray) -> np.ndarray:
+    """표준정규 누적분포 Φ(z)."""
+    return 0.5 * (1.0 + _erf(np.asarray(z, dtype=np.float64) / math.sqrt(2.0)))
+
+
+@lru_cache(maxsize=64)
+def _normal_approx_cached(n: int, p: float, cc: bool) -> np.ndarray:
+    mu = n * p
+    sd = math.sqrt(n * p * (1.0 - p))
+    k = np.arange(n + 1, dtype=np.float64)
+    if sd == 0.0:
+        out = np.array(_binom_pmf_cached(n, p))          # 퇴화(p=0,1): 근사와 정확값이 같음
+    elif cc:
+        # Φ((k+½−μ)/σ) − Φ((k−½−μ)/σ) — 값이 0이 아닌 μ ± _TAIL_SD·σ 구간만 계산
+        lo = max(0, math.floor(mu - _TAIL_SD * sd))
+        hi = min(n, math.ceil(mu + _TAIL_SD * sd))
+        out = np.zeros(n + 1)
+        edges = _phi_cdf((np.arange(lo, hi + 2, dtype=np.float64) - 0.5 - mu) / sd)
+        out[lo:hi + 1] = np.diff(edges)
+    else:
+        z = (k - mu) / sd
+        out = np.exp(-0.5 * z * z) / (sd * math.sqrt(2.0 * math.pi))
+    out.flags.writeable = False
+    return out
+
+
+def normal_approx_pmf(n: int, p: float, cc: bool = True) -> np.ndarray:
+    """
+    B(n, p)의 정규근사 N(np, np(1−p))로 본 k = 0..n 의 확률.
+    cc=True면 연속성 보정 막대 넓이, False면 밀도 f(k)(폭 1 막대의 높이)입니다.
+    """
+    n, p = _check_np(n, p)
+    return _normal_approx_cached(n, p, bool(cc))
+
+
+def normal_interval(n: int, p: float, a: float, b: float, cc: bool = True) -> float:
+    """정규근사 P(a ≤ X ≤ b): cc면 Φ((b+½−μ)/σ) − Φ((a−½−μ)/σ)."""
+    n, p = _check_np(n, p)
+    mu = n * p
+    sd = math.sqrt(n * p * (1.0 - p))
+    lo, hi = (a - 0.5, b + 0.5) if cc else (a, b)
+    if sd == 0.0:
+        return float(lo <= mu <= hi)
+    z = np.array([(lo - mu) / sd, (hi - mu) / sd])
+    cdf = _phi_cdf(z)
+    return float(cdf[1] - cdf[0])
@@ -0,0 +1,434 @@
+# galton_utils.py — 갈톤보드 애니메이션용 서버 측 프레임 스트림
+"""
+공 하나하나를 브라우저에서 시뮬레이션하고 매 단계 히스토그램을 처음부터 다시 그리는 대신,
+서버에서 모든 공의 경로를 numpy로 한 번에(덩어리 단위로) 만들고 브라우저는 재생만 합니다.
+
+    from galton_utils import render_galton_player
+    render_galton_player("gb_play")          # 줄 수·p·공 개수·시드 위젯 + 재생기
+
+스트림 구성(GaltonStream):
+    - slots : 공마다 도착한 칸(오른쪽으로 간 횟수) uint8 (balls,)
+    - snaps : step개마다의 누적 도수 uint32 (balls//step + 1, rows+1), snaps[f] = f·step개 뒤 도수
+두 배열은 static/galton/<해시>.bin 파일(slots, 4바이트 정렬, snaps little-endian)로 한 번 기록하고
+재생기가 fetch로 받아 Uint8Array/Uint32Array로 씁니다. 매 rerun(같은 페이지의 다른 탭 포함)에는
+작은 HTML만 다시 보내고, 같은 설정의 파일은 브라우저·서버가 재사용합니다. 정적 서빙을 쓸 수 없으면
+base64로 HTML에 넣되 공 개수를 _INLINE_MAX_BALLS 이하로 제한합니다(파일을 쓰지 못하면 앞부분만 재생).
+브라우저는 어느 속도로든 재생하고, 임의 위치로 이동할 때는 스냅샷 + 최대 step−1개만 더합니다.
+날아가는 공의 경로는 도착 칸 k가 정해진 상태에서 R k개의 배치를 균등하게 고르면 원래 경로와
+분포가 같으므로 경로 자체는 보내지 않습니다.
+"""
+import base64
+import hashlib
+import json
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+
+from cache_utils import sim_cache
+from dist_utils import binom_pmf
+from sim_utils import rows_per_chunk
+from static_utils import static_serving_enabled
+
+MAX_ROWS = 30             # 보드에 그릴 수 있는 줄 수 상한(칸 번호는 uint8)
+_SNAP_STEP = 1024         # 스냅샷 간격(공 개수)
+_BALL_OPTIONS = (1_000, 10_000, 100_000, 1_000_000)
+_INLINE_MAX_BALLS = 100_000   # 정적 서빙 없이 HTML에 넣는 상한(base64 ≈ 140KB)
+_STREAM_DIR = Path(__file__).parent / "static" / "galton"
+_STREAM_URL = "app/static/galton"
+_STREAM_FILES_MAX = 48        # 보관할 스트림 파일 수(넘으면 오래된 것부터 삭제)
+_STREAM_KEEP_S = 15 * 60      # 이보다 최근에 쓰인 파일은 개수를 넘어도 지우지 않음(재생기가 받는 중일 수 있음)
+
+
+@dataclass(frozen=True)
+class GaltonStream:
+    rows: int
+    p: float
+    balls: int
+    step: int
+    slots: np.ndarray     # (balls,) uint8
+    snaps: np.ndarray     # (balls//step + 1, rows+1) uint32
+
+
+@sim_cache()
+def galton_stream(rows: int, p: float, balls: int, seed, step: int = _SNAP_STEP) -> GaltonStream:
+    """balls개 공이 rows줄 못을 지나는 경로를 덩어리 단위로 만들고, 도착 칸과 누적 스냅샷을 돌려줍니다."""
+    rows = int(rows); balls = int(balls); p = float(p); step = int(step)
+    if not (1 <= rows <= MAX_ROWS) or not (0.0 <= p <= 1.0) or balls < 0 or step < 1:
+        raise ValueError("need 1 <= rows <= MAX_ROWS, 0 <= p <= 1, balls >= 0, step >= 1")
+    rng = np.random.default_rng(seed)
+    slots = np.empty(balls, dtype=np.uint8)
+    chunk = rows_per_chunk(rows, bytes_per_value=4)
+    for b0 in range(0, balls, chunk):
+        b1 = min(balls, b0 + chunk)
+        # 못마다 오른쪽(R)으로 갈지: (공, 줄) 행렬 → 행 합이 도착 칸
+        right = rng.random((b1 - b0, rows), dtype=np.float32) < p
+        slots[b0:b1] = right.sum(axis=1, dtype=np.uint8)
+
+    n_snap = balls // step
+    width = rows + 1
+    block = np.repeat(np.arange(n_snap, dtype=np.int64), step)
+    per_block = np.bincount(block * width + slots[:n_snap * step],
+                            minlength=n_snap * width).reshape(n_snap, width)
+    snaps = np.zeros((n_snap + 1, width), dtype=np.uint32)
+    np.cumsum(per_block, axis=0, out=snaps[1:], dtype=np.uint32)
+    return GaltonStream(rows=rows, p=p, balls=balls, step=step, slots=slots, snaps=snaps)
+
+
+def _stream_bytes(stream: GaltonStream) -> bytes:
+    """slots(uint8) + 0 채움(4바이트 정렬) + snaps(little-endian uint32)."""
+    pad = -stream.balls % 4
+    return stream.slots.tobytes() + b"\0" * pad + stream.snaps.astype("<u4").tobytes()
+
+
+def _prune_stream_files() -> None:
+    """_STREAM_FILES_MAX개를 넘는 오래된 파일을 지웁니다. 최근 _STREAM_KEEP_S초 안에 쓰거나
+    다시 쓴 파일과 다른 세션이 쓰는 중인 임시 파일은 남깁니다."""
+    cutoff = time.time() - _STREAM_KEEP_S
+    files = []
+    for f in _STREAM_DIR.glob("*.bin"):
+        try:
+            files.append((f.stat().st_mtime, f))
+        except OSError:
+            continue                                   # 다른 세션이 방금 지움
+    files.sort()
+    for mtime, f in files[:max(0, len(files) - _STREAM_FILES_MAX)]:
+        if mtime < cutoff:
+            f.unlink(missing_ok=True)
+    for f in _STREAM_DIR.glob("*.tmp"):
+        try:
+            if f.stat().st_mtime < cutoff:
+                f.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def _write_stream_file(stream: GaltonStream) -> Optional[str]:
+    """스트림을 정적 파일로 기록(이미 있으면 수정 시각만 갱신)하고 파일 이름을 돌려줍니다.
+    쓸 수 없으면(읽기 전용 디렉터리 등) None."""
+    data = _stream_bytes(stream)
+    meta = f"{stream.rows}:{stream.p!r}:{stream.balls}:{stream.step}:".encode("ascii")
+    filename = hashlib.sha1(meta + data).hexdigest()[:16] + ".bin"
+    path = _STREAM_DIR / filename
+    try:
+        if path.exists():
+            os.utime(path)                             # 다시 쓰인 파일은 정리 대상에서 미룸
+            return filename
+        _STREAM_DIR.mkdir(parents=True, exist_ok=True)
+        # 같은 스트림을 여러 세션이 동시에 쓸 수 있으므로 임시 파일 이름은 세션마다 다르게
+        tmp = _STREAM_DIR / f"{filename}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    except OSError:
+        return None
+    try:
+        _prune_stream_files()
+    except OSError:
+        pass
+    return filename
+
+
+def _truncated(stream: GaltonStream, balls: int) -> GaltonStream:
+    """앞의 balls개 공만 남긴 스트림(같은 시뮬레이션의 앞부분이므로 그대로 유효)."""
+    return GaltonStream(rows=stream.rows, p=stream.p, balls=balls, step=stream.step,
+                        slots=stream.slots[:balls], snaps=stream.snaps[:balls // stream.step + 1])
+
+
+def stream_payload(stream: GaltonStream, url: Optional[str] = None) -> dict:
+    """브라우저로 보낼 JSON 객체. url이 있으면 배열은 그 파일에서 받고, 없으면
+    little-endian 바이트의 base64로 함께 넣습니다."""
+    payload = {
+        "rows": stream.rows,
+        "p": stream.p,
+        "balls": stream.balls,
+        "step": stream.step,
+        "theory": [round(float(v), 10) for v in binom_pmf(stream.rows, stream.p)],
+    }
+    if url is not None:
+        payload["url"] = url
+    else:
+        payload["slots"] = base64.b64encode(stream.slots.tobytes()).decode("ascii")
+        payload["snaps"] = base64.b64encode(stream.snaps.astype("<u4").tobytes()).decode("ascii")
+    return payload
+
+
+# ── 재생기(HTML/JS) ──────────────────────────────────────────────────────────
+_PLAYER_HTML = r"""
+<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+* { box-sizing: border-box; margin: 0; padding: 0; }
+body { background: __BG__; color: #f1f5f9; font-family: 'Segoe UI', system-ui, sans-serif; }
+.bar { display: flex; flex-wrap: wrap; gap: 8px; align-items: center; padding: 8px 10px;
+       background: rgba(30,41,59,.9); border-radius: 10px; margin: 6px 6px 8px; }
+.bar button { padding: 5px 12px; border: none; border-radius: 8px; font-weight: 700; cursor: pointer;
+              background: __ACCENT__; color: #1c1917; }
+.bar button.ghost { background: #334155; color: #f1f5f9; }
+.bar select { background: #334155; color: #f1f5f9; border: 1px solid #475569; border-radius: 6px; padding: 3px 6px; }
+.bar input[type=range] { flex: 1 1 160px; accent-color: __ACCENT__; }
+.bar .lbl { font-size: .8rem; color: #94a3b8; white-space: nowrap; }
+.bar .val { font-size: .85rem; font-weight: 800; color: __ACCENT__; min-width: 120px; text-align: right; }
+canvas { display: block; width: 100%; }
+</style>
+</head>
+<body>
+<div class="bar">
+  <button id="play">▶ 재생</button>
+  <button id="restart" class="ghost">⏮ 처음</button>
+  <span class="lbl">속도</span>
+  <select id="speed">
+    <option value="2">2개/초</option>
+    <option value="10" selected>10개/초</option>
+    <option value="50">50개/초</option>
+    <option value="500">500개/초</option>
+    <option value="5000">5,000개/초</option>
+    <option value="50000">50,000개/초</option>
+  </select>
+  <input type="range" id="seek" min="0" value="0" step="1">
+  <span class="val" id="count">0</span>
+</div>
+<canvas id="cv"></canvas>
+<script>
+(function(){
+"use strict";
+const S = __STREAM__;
+const R = S.rows, W1 = R + 1, B = S.balls, STEP = S.step;
+function b64bytes(s){ const bin = atob(s); const u = new Uint8Array(bin.length); for (let i=0;i<bin.length;i++) u[i] = bin.charCodeAt(i); return u; }
+let slots = null, snaps = null;
+const theory = S.theory;
+const thMax = Math.max(...theory);
+
+const cv = document.getElementById('cv'), ctx = cv.getContext('2d');
+const seekEl = document.getElementById('seek'), countEl = document.getElementById('count');
+const playBtn = document.getElementById('play'), speedEl = document.getElementById('speed');
+seekEl.max = B;
+
+const counts = new Uint32Array(W1);
+let landed = 0;        // 도수에 반영된 공 수
+let released = 0;      // 보드에 떨어뜨린 공 수(날아가는 공 포함)
+let cursor = 0;        // 재생 위치(실수)
+let playing = false, last = 0;
+let flying = [];       // {path:Uint8Array, t, real, slot}
+const FLIGHT_S = 1.1, MAX_FLYING = 60, ANIM_MAX_SPEED = 60;
+
+// ── 레이아웃 / 보드(정적 부분은 한 번만 그려 둠) ──
+let L = null, boardImg = null;
+function layout(){
+  const dpr = window.devicePixelRatio || 1;
+  const w = cv.clientWidth || 600, h = __CANVAS_H__;
+  cv.width = Math.round(w * dpr); cv.height = Math.round(h * dpr); cv.style.height = h + 'px';
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  const top = 24, boardH = h * 0.46, histTop = top + boardH + 18, histH = h - histTop - 22;
+  const gap = Math.min(36, (w - 40) / (R + 1));
+  L = {w, h, dpr, top, boardH, rowH: boardH / (R + 1), gap, cx: w / 2, histTop, histH,
+       binW: Math.min(60, (w - 40) / W1)};
+  L.histX0 = L.cx - L.binW * W1 / 2;
+  boardImg = document.createElement('canvas');
+  boardImg.width = cv.width; boardImg.height = cv.height;
+  const b = boardImg.getContext('2d');
+  b.setTransform(dpr, 0, 0, dpr, 0, 0);
+  const nailR = Math.max(1.5, Math.min(4, L.gap * 0.12));
+  b.fillStyle = '#cbd5e1';
+  for (let r = 0; r < R; r++) {
+    for (let c = 0; c <= r; c++) {
+      b.beginPath(); b.arc(nailX(r, c), nailY(r), nailR, 0, Math.PI * 2); b.fill();
+    }
+  }
+  b.fillStyle = '#64748b'; b.font = '11px sans-serif'; b.textAlign = 'center';
+  const every = Math.ceil(W1 / 21);
+  for (let k = 0; k < W1; k += every) b.fillText(String(k), L.histX0 + (k + .5) * L.binW, L.histTop + L.histH + 14);
+}
+function nailX(r, c){ return L.cx + (c - r / 2) * L.gap; }
+function nailY(r){ return L.top + (r + 0.5) * L.rowH; }
+
+// ── 이동 / 되감기 ──
+function seek(i){
+  if (!snaps) return;                  // 정적 파일을 아직 받는 중
+  i = Math.max(0, Math.min(B, Math.floor(i)));
+  const f = Math.floor(i / STEP);
+  counts.set(snaps.subarray(f * W1, (f + 1) * W1));
+  for (let j = f * STEP; j < i; j++) counts[slots[j]]++;
+  landed = released = i; cursor = i; flying = [];
+}
+function randomPath(k){
+  // 도착 칸 k(R의 개수)가 주어졌을 때 R 위치를 균등하게 고름 → 원래 경로와 같은 분포
+  const path = new Uint8Array(R);
+  for (let i = 0; i < k; i++) path[i] = 1;
+  for (let i = R - 1; i > 0; i--) { const j = Math.floor(Math.random() * (i + 1)); const t = path[i]; path[i] = path[j]; path[j] = t; }
+  return path;
+}
+
+// ── 진행 ──
+function advance(dt){
+  const speed = +speedEl.value;
+  if (playing) cursor = Math.min(B, cursor + speed * dt);
+  const target = Math.floor(cursor);
+  if (speed <= ANIM_MAX_SPEED) {
+    // 느린 속도: 공마다 날아가고 도착할 때 도수에 반영
+    while (released < target && flying.length < MAX_FLYING) {
+      flying.push({path: randomPath(slots[released]), t: 0, real: true, slot: slots[released]});
+      released++;
+    }
+  } else {
+    // 빠른 속도: 도수는 바로 반영, 날아가는 공은 일부만 보여 주는 장식
+    const from = released;
+    for (let j = from; j < target; j++) counts[slots[j]]++;
+    landed += target - from; released = target;
+    if (target > from && flying.length < MAX_FLYING / 2) {
+      const j = from + Math.floor(Math.random() * (target - from));
+      flying.push({path: randomPath(slots[j]), t: 0, real: false, slot: slots[j]});
+    }
+  }
+  const rate = (R + 1) / FLIGHT_S;
+  for (const f of flying) f.t += rate * dt;
+  const still = [];
+  for (const f of flying) {
+    if (f.t >= R + 1) { if (f.real) { counts[f.slot]++; landed++; } }
+    else still.push(f);
+  }
+  flying = still;
+  if (playing && cursor >= B && flying.length === 0) setPlaying(false);
+}
+
+// ── 그리기 ──
+function ballPos(f){
+  const r = Math.floor(f.t), u = f.t - r;
+  let c = 0; for (let i = 0; i < Math.min(r, R); i++) c += f.path[i];
+  const x0 = r === 0 ? L.cx : nailX(r - 1, c - (r > 0 ? f.path[r - 1] : 0));
+  const y0 = r === 0 ? L.top - 12 : nailY(r - 1);
+  let x1, y1;
+  if (r >= R) { x1 = L.histX0 + (c + .5) * L.binW; y1 = L.histTop; }
+  else { x1 = nailX(r, c); y1 = nailY(r); }
+  return [x0 + (x1 - x0) * u, y0 + (y1 - y0) * u - Math.sin(Math.PI * u) * 4];
+}
+function draw(){
+  ctx.setTransform(1, 0, 0, 1, 0, 0);
+  ctx.clearRect(0, 0, cv.width, cv.height);
+  ctx.drawImage(boardImg, 0, 0);
+  ctx.setTransform(L.dpr, 0, 0, L.dpr, 0, 0);
+
+  ctx.fillStyle = '__ACCENT__';
+  for (const f of flying) { const [x, y] = ballPos(f); ctx.beginPath(); ctx.arc(x, y, 4, 0, Math.PI * 2); ctx.fill(); }
+
+  let cMax = 1; for (let k = 0; k < W1; k++) if (counts[k] > cMax) cMax = counts[k];
+  const scale = L.histH / Math.max(cMax, thMax * Math.max(1, landed)) * 0.95;
+  ctx.fillStyle = '__ACCENT__';
+  for (let k = 0; k < W1; k++) {
+    const hgt = counts[k] * scale;
+    if (hgt > 0) ctx.fillRect(L.histX0 + k * L.binW + 1, L.histTop + L.histH - hgt, L.binW - 2, hgt);
+  }
+  if (landed > 0) {
+    ctx.strokeStyle = '#60a5fa'; ctx.lineWidth = 2; ctx.beginPath();
+    for (let k = 0; k < W1; k++) {
+      const x = L.histX0 + (k + .5) * L.binW, y = L.histTop + L.histH - theory[k] * landed * scale;
+      if (k === 0) ctx.moveTo(x, y); else ctx.lineTo(x, y);
+    }
+    ctx.stroke();
+  }
+  ctx.strokeStyle = '#334155'; ctx.lineWidth = 1; ctx.beginPath();
+  ctx.moveTo(L.histX0, L.histTop + L.histH + .5); ctx.lineTo(L.histX0 + W1 * L.binW, L.histTop + L.histH + .5); ctx.stroke();
+
+  countEl.textContent = landed.toLocaleString() + ' / ' + B.toLocaleString();
+  seekEl.value = landed;
+}
+
+function setPlaying(on){
+  playing = on;
+  playBtn.textContent = on ? '⏸ 멈춤' : '▶ 재생';
+}
+function frame(ts){
+  const dt = last ? Math.min(0.1, (ts - last) / 1000) : 0;
+  last = ts;
+  advance(dt);
+  draw();
+  requestAnimationFrame(frame);
+}
+
+playBtn.addEventListener('click', () => {
+  if (!playing && landed >= B) seek(0);
+  setPlaying(!playing);
+});
+document.getElementById('restart').addEventListener('click', () => { seek(0); setPlaying(false); });
+seekEl.addEventListener('input', e => { seek(+e.target.value); });
+window.addEventListener('resize', layout);
+function boot(){
+  layout();
+  seek(0);
+  requestAnimationFrame(frame);
+}
+if (S.url) {
+  // 정적 파일: slots(B바이트) + 4바이트 정렬 + snaps(uint32)
+  countEl.textContent = '불러오는 중…';
+  playBtn.disabled = seekEl.disabled = true;
+  fetch(S.url).then(r => { if (!r.ok) throw new Error(r.status); return r.arrayBuffer(); }).then(buf => {
+    slots = new Uint8Array(buf, 0, B);
+    const off = Math.ceil(B / 4) * 4;
+    snaps = new Uint32Array(buf, off, (buf.byteLength - off) / 4);
+    playBtn.disabled = seekEl.disabled = false;
+    boot();
+  }).catch(() => { countEl.textContent = '데이터를 불러오지 못했습니다'; });
+} else {
+  slots = b64bytes(S.slots);
+  snaps = new Uint32Array(b64bytes(S.snaps).buffer);
+  boot();
+}
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def galton_player_html(stream: GaltonStream, height: int = 520,
+                       accent: str = "#f59e0b", background: str = "#0f172a") -> str:
+    """재생기 HTML(components.html에 그대로 전달). 정적 서빙이 되면 배열은 파일 주소로만 넣습니다.
+    파일을 쓸 수 없어 HTML에 넣어야 하는데 공이 _INLINE_MAX_BALLS개보다 많으면, 앞부분만 재생하고
+    경고를 띄웁니다."""
+    url = None
+    if static_serving_enabled():
+        filename = _write_stream_file(stream)
+        if filename is not None:
+            url = f"{_STREAM_URL}/{filename}"
+    if url is None and stream.balls > _INLINE_MAX_BALLS:
+        st.warning(f"재생 데이터를 파일로 저장하지 못해 처음 {_INLINE_MAX_BALLS:,}개 공만 재생합니다.")
+        stream = _truncated(stream, _INLINE_MAX_BALLS)
+    return (_PLAYER_HTML
+            .replace("__STREAM__", json.dumps(stream_payload(stream, url), separators=(",", ":")))
+            .replace("__CANVAS_H__", str(int(height)))
+            .replace("__ACCENT__", accent)
+            .replace("__BG__", background))
+
+
+def render_galton_player(key: str, rows: int = 10, balls: int = 10_000, max_rows: int = 20,
+                         height: int = 520, accent: str = "#f59e0b", background: str = "#0f172a") -> None:
+    """
+    줄 수·p·공 개수·시드 위젯과 재생기를 그립니다. key는 위젯 키 접두어입니다.
+    시드는 처음 한 번 무작위로 정해 세션에 두므로(교사 시드로 바꿀 수 있음), 다른 위젯을
+    건드려 rerun이 일어나도 재생기가 다시 시작되지 않고 같은 설정은 세션 간 캐시를 씁니다.
+    """
+    seed_key = f"{key}_seed"
+    if seed_key not in st.session_state:
+        st.session_state[seed_key] = random.randint(1, 99_999)
+    c1, c2, c3, c4 = st.columns([1.2, 1.2, 1.4, 0.9])
+    n_rows = c1.slider("줄 수 n", 2, min(MAX_ROWS, int(max_rows)), int(rows), key=f"{key}_rows")
+    p = c2.slider("오른쪽 확률 p", 0.0, 1.0, 0.5, 0.01, key=f"{key}_p")
+    # 정적 파일로 보낼 수 없으면 HTML에 넣을 수 있는 개수까지만
+    options = [b for b in _BALL_OPTIONS if static_serving_enabled() or b <= _INLINE_MAX_BALLS]
+    n_balls = c3.select_slider("공의 개수", options=options,
+                               value=min(int(balls), options[-1]), key=f"{key}_balls")
+    seed = int(c4.number_input("시드", min_value=1, step=1, format="%d", key=seed_key))
+    stream = galton_stream(n_rows, p, n_balls, seed)
+    components.html(galton_player_html(stream, height=height, accent=accent, background=background),
+                    height=height + 60, scrolling=False)
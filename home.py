@@ -9,6 +9,7 @@ import urllib.parse
 from functools import lru_cache
 import smtplib
 import html as _html
+import json
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone, timedelta
@@ -19,6 +20,15 @@ _KST = timezone(timedelta(hours=9))  # 한국 표준시 (UTC+9)
 
 # 인증 모듈
 import auth_utils as _auth_utils
+from theme_utils import register_css, inject_css
+from profiler_utils import (
+    start_rerun_profile, end_rerun_profile, profile_phase,
+    profile_stats, profile_stats_csv, reset_profile_stats,
+)
+from state_utils import end_rerun_state, session_footprints
+from cache_utils import clear_sim_cache, sim_cache_stats, sim_cache_usage
+from template_utils import template_cache_stats
+from vendor_utils import vendor_bundle_status
 
 from auth_utils import (
     authenticate, register_student, register_general,
@@ -32,30 +42,12 @@ def _load_module_cached(path_str: str, mtime: float):
     return load_module_from_path(Path(path_str))
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Fallback: utils.keep_scroll이 없을 때 최소 구현
+# 스크롤 유지: 부모 문서에 한 번 설치되어 rerun 사이에도 살아 있는 스크립트
 try:
-    from utils import keep_scroll
+    from utils import install_scroll_keeper
 except Exception:
-    def keep_scroll(key: str = "default"):
-        components.html(f"""
-        <script>
-        (function(){{
-          const KEY = 'st_scroll::' + '{'{'}key{'}'}' + '::' + location.pathname + location.search;
-          function restore() {{
-            const y = sessionStorage.getItem(KEY);
-            if (y !== null) {{
-              window.scrollTo(0, parseFloat(y));
-            }}
-          }}
-          restore(); setTimeout(restore, 50); setTimeout(restore, 250);
-          let t=false;
-          window.addEventListener('scroll', function(){{
-            if(!t){{ requestAnimationFrame(function(){{ sessionStorage.setItem(KEY, window.scrollY); t=false; }}); t=true; }}
-          }});
-          setInterval(function(){{ sessionStorage.setItem(KEY, window.scrollY); }}, 500);
-        }})();
-        </script>
-        """, height=0)
+    def install_scroll_keeper():
+        return
 
 # 외부 문서 임베드 헬퍼
 def embed_iframe(src: str, height: int = 600, scrolling: bool = True):
@@ -71,16 +63,108 @@ def embed_pdf(src: str, height: int = 800):
       - drive.google.com/file/.../preview
     그 외 .pdf URL이면 gview로 감싸서 iframe 임베드
     """
-    url = src
-    s = src.lower()
-    if not (s.startswith("data:") or "gview?embedded=true" in s or "drive.google.com/file" in s):
-        if s.endswith(".pdf"):
-            url = "https://docs.google.com/gview?embedded=true&url=" + urllib.parse.quote(src, safe="")
+    url = _pdf_embed_url(src)
     components.html(
         f'<iframe src="{url}" style="width:100%; height:{height}px; border:0;" allowfullscreen></iframe>',
         height=height
     )
 
+
+def _pdf_embed_url(src: str) -> str:
+    s = src.lower()
+    if not (s.startswith("data:") or "gview?embedded=true" in s or "drive.google.com/file" in s):
+        if s.endswith(".pdf"):
+            return "https://docs.google.com/gview?embedded=true&url=" + urllib.parse.quote(src, safe="")
+    return src
+
+
+# 지연 임베드: 자리표시자만 먼저 그리고, 화면 근처로 스크롤되거나(visible) 버튼을 누르면(click)
+# 그때 실제 iframe을 붙인다. 한 소단원에 Canva·슬라이드가 여러 개여도 보이는 것만 로드된다.
+_LAZY_EMBED_HTML = """
+<div id="ph" style="box-sizing:border-box;height:__H__px;border:1px dashed #c9cfd8;border-radius:10px;
+     display:flex;flex-direction:column;align-items:center;justify-content:center;gap:10px;
+     font-family:sans-serif;color:#6b7280;background:#f8fafc;">
+  <div style="font-size:14px;">__LABEL__</div>
+  <button id="go" style="padding:8px 16px;border-radius:8px;border:1px solid #94a3b8;background:#fff;cursor:pointer;">
+    자료 불러오기</button>
+</div>
+<script>
+(function(){
+  const SRC = __SRC__, H = __H__, MODE = __MODE__, SCROLLING = __SCROLLING__;
+  const ph = document.getElementById('ph');
+  let mounted = false;
+  function mount(){
+    if (mounted) return; mounted = true;
+    const f = document.createElement('iframe');
+    f.src = SRC; f.loading = 'lazy'; f.allowFullscreen = true;
+    f.setAttribute('allow', 'autoplay; encrypted-media; fullscreen; picture-in-picture');
+    f.setAttribute('scrolling', SCROLLING ? 'auto' : 'no');
+    f.style.cssText = 'border:0;width:100%;height:' + H + 'px;display:block;';
+    ph.replaceWith(f);
+  }
+  document.getElementById('go').addEventListener('click', mount);
+  if (MODE !== 'visible') return;
+  if (!('IntersectionObserver' in window)) { mount(); return; }
+  // 컴포넌트 iframe 안에서도 암시적 root는 최상위 뷰포트이므로 페이지 스크롤 기준으로 동작
+  const io = new IntersectionObserver(function(entries){
+    if (entries.some(function(e){ return e.isIntersecting; })) { io.disconnect(); mount(); }
+  }, { rootMargin: '300px 0px' });
+  io.observe(ph);
+})();
+</script>
+"""
+
+
+def embed_lazy(src: str, height: int = 600, scrolling: bool = True,
+               mount: str = "visible", label: str = ""):
+    """
+    지연 로드 iframe 임베드.
+      - mount="visible": 화면 근처(300px)로 스크롤되면 자동으로 붙임
+      - mount="click"  : '자료 불러오기'를 눌러야 붙임
+    붙는 iframe에는 loading="lazy"가 지정된다.
+    """
+    html = (
+        _LAZY_EMBED_HTML
+        .replace("__SRC__", json.dumps(src))
+        .replace("__MODE__", json.dumps("click" if mount == "click" else "visible"))
+        .replace("__SCROLLING__", "true" if scrolling else "false")
+        .replace("__LABEL__", _html.escape(label or "자료를 불러오는 중…"))
+        .replace("__H__", str(int(height)))
+    )
+    components.html(html, height=int(height))
+
+
+# 수업 항목 타입별 (기본 높이, 스크롤 허용)
+_LESSON_EMBED_DEFAULTS = {
+    "gslides": (480, True),
+    "gsheet": (700, True),
+    "iframe": (800, True),
+    "canva": (600, True),
+    "pdf": (800, True),
+    "youtube": (400, False),
+}
+
+
+def render_lesson_embed(item: dict) -> bool:
+    """
+    수업 항목이 iframe형(gslides/gsheet/iframe/canva/pdf/youtube)이면 지연 임베드로 그리고 True.
+    항목에 "mount": "click"을 주면 스크롤로는 붙지 않고 버튼으로만 연다.
+    """
+    typ = item.get("type")
+    if typ not in _LESSON_EMBED_DEFAULTS:
+        return False
+    default_h, scrolling = _LESSON_EMBED_DEFAULTS[typ]
+    src = item["src"]
+    if typ == "pdf":
+        src = _pdf_embed_url(src)
+    elif typ == "youtube":
+        src = to_youtube_embed(src)
+    embed_lazy(
+        src, height=item.get("height", default_h), scrolling=scrolling,
+        mount=item.get("mount", "visible"), label=item.get("title", ""),
+    )
+    return True
+
 def to_youtube_embed(src: str) -> str:
     """YouTube watch/shorts/youtu.be/playlist 링크를 embed용으로 정규화"""
     try:
@@ -145,6 +229,397 @@ HIDDEN_SUBJECTS: set = set()
 # home.py와 같은 디렉터리 기준
 ACTIVITIES_ROOT = Path(__file__).parent / "activities"
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 정적 CSS 묶음 (theme_utils.register_css → static/css/<이름>.<해시>.css 로 빌드,
+# 매 rerun에는 <link> 한 줄만 전송)
+_CSS_SUBJECT = register_css("subject", """
+.lesson-card {
+  background: rgba(99,102,241,0.08);
+  border: 1px solid rgba(99,102,241,0.28);
+  border-radius: 12px;
+  padding: 14px 16px;
+  margin: 0.25rem 0 1rem 0;
+  backdrop-filter: blur(8px);
+  -webkit-backdrop-filter: blur(8px);
+}
+.lesson-card h4 { margin: 0 0 .35rem 0; font-weight: 700; color: rgba(255,255,255,0.93); }
+.lesson-card p  { margin: .15rem 0 .5rem 0; color: rgba(255,255,255,0.52); }
+""")
+
+_CSS_LOGIN = register_css("login", """
+.stApp {
+    background-color: #0f172a !important;
+    background-image:
+        linear-gradient(rgba(99, 102, 241, 0.08) 1px, transparent 1px),
+        linear-gradient(90deg, rgba(99, 102, 241, 0.08) 1px, transparent 1px) !important;
+    background-size: 50px 50px !important;
+}
+.stApp > .main { background: transparent !important; }
+header[data-testid="stHeader"], .stDeployButton, footer { display: none !important; }
+
+/* 세로 중앙 정렬 */
+[data-testid="stMain"] {
+    display: flex !important;
+    align-items: center !important;
+    min-height: 100vh !important;
+}
+/* Streamlit 기본 상하 패딩 축소 → 한 화면에 들어오게 */
+.block-container, [data-testid="stMainBlockContainer"] {
+    padding-top: 1rem !important;
+    padding-bottom: 1rem !important;
+    width: 100% !important;
+}
+
+div[data-testid="stForm"] {
+    background: rgba(255, 255, 255, 0.04) !important;
+    backdrop-filter: blur(20px) !important;
+    -webkit-backdrop-filter: blur(20px) !important;
+    border: 1px solid rgba(255, 255, 255, 0.08) !important;
+    border-radius: 16px !important;
+    padding: 20px 24px 16px !important;
+    box-shadow:
+        0 4px 6px rgba(0, 0, 0, 0.3),
+        0 20px 60px rgba(0, 0, 0, 0.5),
+        inset 0 1px 0 rgba(255, 255, 255, 0.06),
+        0 0 0 1px rgba(139, 92, 246, 0.08) !important;
+}
+
+.stApp p, .stApp label, .stApp span, .stApp div, .stApp li {
+    color: rgba(255, 255, 255, 0.75) !important;
+}
+/* 사이드바(로컬 디버그 패널)는 라이트 테마 색상 유지 */
+section[data-testid="stSidebar"] p,
+section[data-testid="stSidebar"] label,
+section[data-testid="stSidebar"] span:not(.st-emotion-cache-hidden),
+section[data-testid="stSidebar"] div,
+section[data-testid="stSidebar"] li,
+section[data-testid="stSidebar"] caption,
+section[data-testid="stSidebar"] small {
+    color: unset !important;
+}
+
+.stTextInput > div > div > input,
+.stTextInput > div > div {
+    background: rgba(255, 255, 255, 0.06) !important;
+    border: 1px solid rgba(255, 255, 255, 0.1) !important;
+    border-radius: 10px !important;
+    color: rgba(255, 255, 255, 0.85) !important;
+    caret-color: #a78bfa !important;
+}
+.stTextInput > div > div > input::placeholder { color: rgba(255, 255, 255, 0.25) !important; }
+.stTextInput > div > div > input:focus {
+    border-color: rgba(139, 92, 246, 0.5) !important;
+    box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.12) !important;
+    background: rgba(255, 255, 255, 0.08) !important;
+}
+.stTextInput label {
+    color: rgba(255, 255, 255, 0.55) !important;
+    font-size: 0.82rem !important;
+    font-weight: 500 !important;
+    letter-spacing: 0.5px !important;
+}
+
+.stFormSubmitButton > button, .stButton > button {
+    background: linear-gradient(135deg, #7c3aed 0%, #6366f1 100%) !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 10px !important;
+    font-weight: 600 !important;
+    letter-spacing: 2px !important;
+    padding: 12px 24px !important;
+    width: 100% !important;
+    box-shadow: 0 4px 20px rgba(124, 58, 237, 0.35), 0 0 0 1px rgba(139, 92, 246, 0.2) !important;
+    transition: all 0.2s ease !important;
+}
+.stFormSubmitButton > button:hover, .stButton > button:hover {
+    transform: translateY(-1px) !important;
+    box-shadow: 0 8px 28px rgba(124, 58, 237, 0.45), 0 0 0 1px rgba(139, 92, 246, 0.3) !important;
+}
+
+/* 입력 필드 간 세로 여백 축소 */
+.stTextInput { margin-bottom: 0 !important; }
+[data-testid="stVerticalBlock"] > [data-testid="stVerticalBlock"] { gap: 0.3rem !important; }
+
+.stTabs [data-baseweb="tab-list"] {
+    background: transparent !important;
+    border-bottom: 1px solid rgba(255, 255, 255, 0.08) !important;
+    gap: 0 !important;
+}
+.stTabs [data-baseweb="tab"] {
+    background: transparent !important;
+    color: rgba(255, 255, 255, 0.35) !important;
+    border: none !important;
+    font-weight: 500 !important;
+    font-size: 0.9rem !important;
+    padding: 8px 20px !important;
+}
+.stTabs [aria-selected="true"] {
+    color: #a78bfa !important;
+    border-bottom: 2px solid #a78bfa !important;
+}
+.stTabs [data-baseweb="tab-panel"] { background: transparent !important; }
+
+.stAlert {
+    background: rgba(239, 68, 68, 0.12) !important;
+    border: 1px solid rgba(239, 68, 68, 0.25) !important;
+    border-radius: 10px !important;
+}
+
+::-webkit-scrollbar { width: 6px; }
+::-webkit-scrollbar-track { background: rgba(255, 255, 255, 0.03); }
+::-webkit-scrollbar-thumb { background: rgba(139, 92, 246, 0.3); border-radius: 3px; }
+
+/* 로컬 디버그 패널 — container 전체를 하나의 박스로 */
+[data-testid="stVerticalBlock"]:has(> div > .stMarkdown .debug-panel-header) {
+    margin-top: 2.2rem;
+    background: rgba(251, 191, 36, 0.07) !important;
+    border: 1px solid rgba(251, 191, 36, 0.35) !important;
+    border-radius: 12px !important;
+    padding: 10px 14px 12px !important;
+}
+.debug-panel-header {
+    font-size: 0.72rem;
+    font-weight: 700;
+    letter-spacing: 1.5px;
+    color: rgba(251, 191, 36, 0.80) !important;
+    text-transform: uppercase;
+    margin-bottom: 6px;
+}
+""")
+
+_CSS_LOGIN_HIDE_SIDEBAR = register_css("login_hide_sidebar", """
+section[data-testid="stSidebar"],
+[data-testid="stSidebarCollapsedControl"] { display: none !important; }
+.stMainBlockContainer, .block-container { margin-left: auto !important; }
+""")
+
+_CSS_LOGIN_HEADER = register_css("login_header", """
+.math-bg-symbols {
+    position: fixed; top: 0; left: 0;
+    width: 100vw; height: 100vh;
+    pointer-events: none; z-index: 0; overflow: hidden;
+}
+.math-sym {
+    position: absolute;
+    color: rgba(139, 92, 246, 0.12);
+    font-family: 'Times New Roman', Georgia, serif;
+    font-style: italic; user-select: none;
+}
+.axis-deco {
+    position: fixed; bottom: 36px; left: 36px;
+    opacity: 0.12; z-index: 0; pointer-events: none;
+}
+.center-glow {
+    position: fixed;
+    width: 700px; height: 700px;
+    background: radial-gradient(circle, rgba(139,92,246,0.07) 0%, transparent 65%);
+    border-radius: 50%;
+    top: 50%; left: 50%;
+    transform: translate(-50%, -50%);
+    pointer-events: none; z-index: 0;
+}
+.mathlab-header {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 14px;
+    margin-bottom: 12px;
+    position: relative;
+    z-index: 1;
+}
+.mathlab-logo-svg {
+    width: 81px; height: 81px; flex-shrink: 0;
+    filter: drop-shadow(0 0 18px rgba(139,92,246,0.65));
+}
+.mathlab-logo-title {
+    font-size: 4.2rem; font-weight: 800; letter-spacing: 8px;
+    background: linear-gradient(135deg, #c4b5fd 0%, #a78bfa 40%, #818cf8 100%);
+    -webkit-background-clip: text; -webkit-text-fill-color: transparent;
+    background-clip: text; line-height: 1;
+    margin: 0;
+}
+""")
+
+_CSS_SIDEBAR_NAV = register_css("sidebar_nav", """
+[data-testid="stSidebarNav"],
+[data-testid="stSidebarNavContainer"],
+[data-testid="stSidebarNavItems"],
+[data-testid="stSidebarNavLink"]
+{ display: none !important; visibility: hidden !important; }
+""")
+
+_CSS_ADMIN_DASHBOARD = register_css("admin_dashboard", """
+.adm-stat {
+    background: rgba(255,255,255,0.03);
+    border: 1px solid rgba(99,102,241,0.22);
+    border-radius: 10px;
+    padding: 0.7rem 0.8rem;
+    text-align: center;
+    height: 100%;
+}
+.adm-stat-lbl  { font-size:0.78rem; color:rgba(255,255,255,0.48); margin-bottom:0.2rem; }
+.adm-stat-val  { font-size:1.9rem; font-weight:800; line-height:1.1; margin-bottom:0.15rem; color:rgba(255,255,255,0.90); }
+.adm-stat-sub  { font-size:0.72rem; color:rgba(255,255,255,0.45); }
+.adm-stat-ok   { color:#4ade80 !important; }
+.adm-stat-bad  { color:#f87171 !important; }
+.adm-shortcut-label {
+    font-size:0.78rem; font-weight:600;
+    color:rgba(255,255,255,0.48);
+    text-align:center; margin-bottom:0.4rem;
+}
+""")
+
+_CSS_HOME = register_css("home", """
+/* 히어로 섹션 — 다크 유리 카드 */
+.hero-container {
+  background: rgba(255,255,255,0.03);
+  backdrop-filter: blur(20px);
+  -webkit-backdrop-filter: blur(20px);
+  border: 1px solid rgba(99,102,241,0.25);
+  border-radius: 20px;
+  padding: 2.5rem 2rem;
+  margin-bottom: 2.5rem;
+  text-align: center;
+  box-shadow: 0 8px 40px rgba(0,0,0,0.30),
+              inset 0 1px 0 rgba(255,255,255,0.06);
+}
+.hero-title {
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  gap: 14px;
+  font-size: 3rem;
+  font-weight: 800;
+  margin: 0 0 0.75rem 0;
+  background: linear-gradient(135deg, #c4b5fd 0%, #a78bfa 45%, #818cf8 100%);
+  -webkit-background-clip: text;
+  -webkit-text-fill-color: transparent;
+  background-clip: text;
+}
+.hero-logo-svg {
+  width: 56px; height: 56px; flex-shrink: 0;
+  -webkit-text-fill-color: initial;
+  filter: drop-shadow(0 0 12px rgba(139,92,246,0.65));
+}
+.hero-subtitle {
+  font-size: 1.1rem;
+  color: rgba(255,255,255,0.55);
+  line-height: 1.7;
+  margin: 0;
+}
+
+/* 교과 카드 */
+.subject-card { height: 100%; }
+.subject-card-icon { font-size: 2.6rem; margin-bottom: 0.6rem; }
+.subject-card-title {
+  font-size: 1.25rem;
+  font-weight: 700;
+  margin: 0 0 0.45rem 0;
+  color: rgba(255,255,255,0.93);
+}
+.subject-card-desc {
+  font-size: 0.9rem;
+  color: rgba(255,255,255,0.50);
+  line-height: 1.55;
+  margin: 0 0 1rem 0;
+}
+""")
+
+_CSS_FOOTER = register_css("footer", """
+.site-footer {
+  margin-top: 1.5rem;
+  padding: 0.75rem 1rem;
+  border-top: 1px solid rgba(99,102,241,0.18);
+  font-size: 0.82rem;
+  color: rgba(255,255,255,0.35);
+  text-align: center;
+  line-height: 1.8;
+}
+""")
+
+_CSS_HIDE_ST_SIDEBAR = register_css("hide_st_sidebar", """
+section[data-testid="stSidebar"],
+[data-testid="stSidebarCollapsedControl"] { display: none !important; }
+""")
+
+_CSS_APP_LAYOUT = register_css("app_layout", """
+/* 페이지 전체 여백 */
+[data-testid="stMainBlockContainer"],
+[data-testid="stMainBlockContainer"] > .block-container,
+[data-testid="stMainBlockContainer"] > div {
+    padding-left: 0.75rem !important;
+    padding-right: 0.75rem !important;
+    padding-top: 0.75rem !important;
+    max-width: 100% !important;
+}
+/* nav/main 레이아웃: #__ml_nav__ 마커를 포함한 컬럼과 그 형제만 대상으로 지정 */
+/* 바깥 HorizontalBlock — nav 마커를 포함할 때만 gap 적용 */
+[data-testid="stHorizontalBlock"]:has(#__ml_nav__) {
+    gap: 2rem !important;
+    padding: 0 !important;
+}
+/* 커스텀 nav 열 */
+[data-testid="column"]:has(#__ml_nav__) {
+    background: transparent !important;
+    padding: 1rem 0.8rem 2rem 0.8rem !important;
+    min-height: calc(100vh - 1.5rem) !important;
+}
+/* nav 열 내 버튼 — 폰트 압축 */
+[data-testid="column"]:has(#__ml_nav__) button {
+    font-size: 0.79rem !important;
+}
+/* nav 열 내 expander 헤더 — 한 줄 말줄임표 */
+[data-testid="column"]:has(#__ml_nav__) [data-testid="stExpander"] summary p,
+[data-testid="column"]:has(#__ml_nav__) [data-testid="stExpander"] summary span {
+    font-size: 0.79rem !important;
+    white-space: nowrap !important;
+    overflow: hidden !important;
+    text-overflow: ellipsis !important;
+}
+/* 메인 콘텐츠 열 (nav 열의 인접 형제) */
+[data-testid="column"]:has(#__ml_nav__) + [data-testid="column"] {
+    padding-left: 1.5rem !important;
+    padding-right: 1rem !important;
+}
+/* 메인 열 내부 중첩 컬럼 리셋 — 외부 CSS 부작용 방지 */
+[data-testid="column"]:has(#__ml_nav__) + [data-testid="column"] [data-testid="stHorizontalBlock"] {
+    gap: 0.5rem !important;
+}
+[data-testid="column"]:has(#__ml_nav__) + [data-testid="column"] [data-testid="column"] {
+    padding: 0 !important;
+    min-height: 0 !important;
+}
+/* 햄버거 버튼 스타일 (사이드바 닫힘 시) */
+[data-testid="stMainBlockContainer"] > div > div > div:first-child button[kind="secondary"]:first-of-type {
+    background: rgba(99,102,241,0.15) !important;
+    border: 1px solid rgba(99,102,241,0.35) !important;
+    color: rgba(255,255,255,0.85) !important;
+    font-size: 1.1rem !important;
+}
+/* 셀렉트박스/드롭다운 팝오버(BaseWeb popover)를 모바일 드로어(z-index:9999) 위로 띄움.
+   드로어가 fixed·불투명이라, 기본 z-index의 드롭다운이 드로어 뒤에 가려져
+   단원 선택이 안 되던 문제를 해결한다. (단원 선택은 사이드바 selectbox로만 가능) */
+[data-baseweb="popover"],
+[data-baseweb="layer"],
+[data-baseweb="tooltip"] {
+    z-index: 2147483600 !important;
+}
+""")
+
+_CSS_APP_NAV_OPEN = register_css("app_nav_open", """
+.stApp {
+    background-image:
+        linear-gradient(to right,
+            #0d0626 calc((100% - 3.5rem) / 6 + 1.75rem),
+            #0f172a calc((100% - 3.5rem) / 6 + 1.75rem)
+        ),
+        linear-gradient(rgba(99,102,241,0.06) 1px, transparent 1px),
+        linear-gradient(90deg, rgba(99,102,241,0.06) 1px, transparent 1px) !important;
+    background-size: 100% 100%, 50px 50px, 50px 50px !important;
+}
+""")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 데이터 모델
 @dataclass
@@ -226,24 +701,7 @@ def _has_lessons(subject_key: str) -> bool:
 
 def _inject_subject_styles():
     """교과 메인에서 쓸 '수업 카드' 전용 스타일을 주입."""
-    st.markdown(
-        """
-        <style>
-          .lesson-card {
-            background: rgba(99,102,241,0.08);
-            border: 1px solid rgba(99,102,241,0.28);
-            border-radius: 12px;
-            padding: 14px 16px;
-            margin: 0.25rem 0 1rem 0;
-            backdrop-filter: blur(8px);
-            -webkit-backdrop-filter: blur(8px);
-          }
-          .lesson-card h4 { margin: 0 0 .35rem 0; font-weight: 700; color: rgba(255,255,255,0.93); }
-          .lesson-card p  { margin: .15rem 0 .5rem 0; color: rgba(255,255,255,0.52); }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    inject_css(_CSS_SUBJECT)
 
 def _lessons_top_nav(subject_key: str):
     """수업 페이지 상단(제목 바로 아래)에 들어갈 네비게이션 버튼들."""
@@ -426,14 +884,14 @@ def _get_login_allowed_units(subject_key: str) -> Optional[set[str]]:
     return set()
 
 
-_PERM_REFRESH_INTERVAL = 300  # 권한 갱신 최소 간격 (초) — API 호출 빈도 제어
+_PERM_RETRY_INTERVAL = 30  # 서버 혼잡으로 권한을 못 읽었을 때 재시도 간격 (초)
 
 
 def _refresh_current_user_permissions() -> None:
     """현재 로그인 사용자의 최신 권한을 시트 기준으로 세션에 반영합니다.
 
-    매 렌더링마다 Sheets를 호출하면 rate limit 병목이 생기므로,
-    세션 내 마지막 갱신 시각 기준으로 _PERM_REFRESH_INTERVAL 초에 1회만 호출합니다.
+    권한표는 auth_utils의 공용 권한 서비스가 권한 버전당 한 번만 계산하므로,
+    세션은 매 렌더링마다 권한 버전 정수만 비교하고 바뀐 경우에만 스냅샷을 읽습니다.
     서버 혼잡(SheetsUnavailableError) 시에는 기존 세션 권한을 그대로 유지합니다.
     """
     user_type = st.session_state.get("_user_type", "")
@@ -441,24 +899,28 @@ def _refresh_current_user_permissions() -> None:
     if not user_type or not user_id:
         return
 
-    # ── 세션별 쓰로틀링: 마지막 갱신 후 _PERM_REFRESH_INTERVAL 초 미경과 시 스킵 ──
-    from time import monotonic
-    last_refresh = st.session_state.get("_perm_last_refresh", 0.0)
-    if monotonic() - last_refresh < _PERM_REFRESH_INTERVAL:
+    get_version = getattr(_auth_utils, "get_permission_version", None)
+    get_snapshot = getattr(_auth_utils, "get_user_permission_snapshot", None)
+    if not callable(get_version) or not callable(get_snapshot):
         return
-    st.session_state["_perm_last_refresh"] = monotonic()
 
-    get_snapshot = getattr(_auth_utils, "get_user_permission_snapshot", None)
-    if not callable(get_snapshot):
+    # ── 권한 버전이 그대로면 스킵 (세션당 정수 비교 1회) ──
+    version = get_version()
+    if st.session_state.get("_perm_version") == version:
+        return
+    from time import monotonic
+    if monotonic() < st.session_state.get("_perm_retry_at", 0.0):
         return
 
     try:
         snap = get_snapshot(user_type, user_id)
     except _SheetsUnavailableError:
-        # 서버 혼잡: 기존 세션 권한 유지, 다음 간격에 재시도
-        return
+        snap = None
     if not snap:
+        # 서버 혼잡 등: 기존 세션 권한 유지, 잠시 뒤 재시도
+        st.session_state["_perm_retry_at"] = monotonic() + _PERM_RETRY_INTERVAL
         return
+    st.session_state["_perm_version"] = version
 
     st.session_state["_user_name"] = snap.get("name", st.session_state.get("_user_name", ""))
     new_subjects = snap.get("allowed_subjects")
@@ -602,205 +1064,16 @@ def _send_register_notify_email(user_type: str, name: str, user_id: str,
 # 로그인 / 회원가입 뷰
 def _inject_login_style(hide_sidebar: bool = True):
     """MathLab 로그인 화면 전용 다크 그리드 스타일을 주입합니다."""
-    sidebar_css = """
-    section[data-testid="stSidebar"],
-    [data-testid="stSidebarCollapsedControl"] { display: none !important; }
-    .stMainBlockContainer, .block-container { margin-left: auto !important; }
-    """ if hide_sidebar else ""
-    st.markdown("""
-    <style>
-    """ + sidebar_css + """
-    .stApp {
-        background-color: #0f172a !important;
-        background-image:
-            linear-gradient(rgba(99, 102, 241, 0.08) 1px, transparent 1px),
-            linear-gradient(90deg, rgba(99, 102, 241, 0.08) 1px, transparent 1px) !important;
-        background-size: 50px 50px !important;
-    }
-    .stApp > .main { background: transparent !important; }
-    header[data-testid="stHeader"], .stDeployButton, footer { display: none !important; }
-
-    /* 세로 중앙 정렬 */
-    [data-testid="stMain"] {
-        display: flex !important;
-        align-items: center !important;
-        min-height: 100vh !important;
-    }
-    /* Streamlit 기본 상하 패딩 축소 → 한 화면에 들어오게 */
-    .block-container, [data-testid="stMainBlockContainer"] {
-        padding-top: 1rem !important;
-        padding-bottom: 1rem !important;
-        width: 100% !important;
-    }
-
-    div[data-testid="stForm"] {
-        background: rgba(255, 255, 255, 0.04) !important;
-        backdrop-filter: blur(20px) !important;
-        -webkit-backdrop-filter: blur(20px) !important;
-        border: 1px solid rgba(255, 255, 255, 0.08) !important;
-        border-radius: 16px !important;
-        padding: 20px 24px 16px !important;
-        box-shadow:
-            0 4px 6px rgba(0, 0, 0, 0.3),
-            0 20px 60px rgba(0, 0, 0, 0.5),
-            inset 0 1px 0 rgba(255, 255, 255, 0.06),
-            0 0 0 1px rgba(139, 92, 246, 0.08) !important;
-    }
-
-    .stApp p, .stApp label, .stApp span, .stApp div, .stApp li {
-        color: rgba(255, 255, 255, 0.75) !important;
-    }
-    /* 사이드바(로컬 디버그 패널)는 라이트 테마 색상 유지 */
-    section[data-testid="stSidebar"] p,
-    section[data-testid="stSidebar"] label,
-    section[data-testid="stSidebar"] span:not(.st-emotion-cache-hidden),
-    section[data-testid="stSidebar"] div,
-    section[data-testid="stSidebar"] li,
-    section[data-testid="stSidebar"] caption,
-    section[data-testid="stSidebar"] small {
-        color: unset !important;
-    }
-
-    .stTextInput > div > div > input,
-    .stTextInput > div > div {
-        background: rgba(255, 255, 255, 0.06) !important;
-        border: 1px solid rgba(255, 255, 255, 0.1) !important;
-        border-radius: 10px !important;
-        color: rgba(255, 255, 255, 0.85) !important;
-        caret-color: #a78bfa !important;
-    }
-    .stTextInput > div > div > input::placeholder { color: rgba(255, 255, 255, 0.25) !important; }
-    .stTextInput > div > div > input:focus {
-        border-color: rgba(139, 92, 246, 0.5) !important;
-        box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.12) !important;
-        background: rgba(255, 255, 255, 0.08) !important;
-    }
-    .stTextInput label {
-        color: rgba(255, 255, 255, 0.55) !important;
-        font-size: 0.82rem !important;
-        font-weight: 500 !important;
-        letter-spacing: 0.5px !important;
-    }
-
-    .stFormSubmitButton > button, .stButton > button {
-        background: linear-gradient(135deg, #7c3aed 0%, #6366f1 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 10px !important;
-        font-weight: 600 !important;
-        letter-spacing: 2px !important;
-        padding: 12px 24px !important;
-        width: 100% !important;
-        box-shadow: 0 4px 20px rgba(124, 58, 237, 0.35), 0 0 0 1px rgba(139, 92, 246, 0.2) !important;
-        transition: all 0.2s ease !important;
-    }
-    .stFormSubmitButton > button:hover, .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 8px 28px rgba(124, 58, 237, 0.45), 0 0 0 1px rgba(139, 92, 246, 0.3) !important;
-    }
-
-    /* 입력 필드 간 세로 여백 축소 */
-    .stTextInput { margin-bottom: 0 !important; }
-    [data-testid="stVerticalBlock"] > [data-testid="stVerticalBlock"] { gap: 0.3rem !important; }
-
-    .stTabs [data-baseweb="tab-list"] {
-        background: transparent !important;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.08) !important;
-        gap: 0 !important;
-    }
-    .stTabs [data-baseweb="tab"] {
-        background: transparent !important;
-        color: rgba(255, 255, 255, 0.35) !important;
-        border: none !important;
-        font-weight: 500 !important;
-        font-size: 0.9rem !important;
-        padding: 8px 20px !important;
-    }
-    .stTabs [aria-selected="true"] {
-        color: #a78bfa !important;
-        border-bottom: 2px solid #a78bfa !important;
-    }
-    .stTabs [data-baseweb="tab-panel"] { background: transparent !important; }
-
-    .stAlert {
-        background: rgba(239, 68, 68, 0.12) !important;
-        border: 1px solid rgba(239, 68, 68, 0.25) !important;
-        border-radius: 10px !important;
-    }
-
-    ::-webkit-scrollbar { width: 6px; }
-    ::-webkit-scrollbar-track { background: rgba(255, 255, 255, 0.03); }
-    ::-webkit-scrollbar-thumb { background: rgba(139, 92, 246, 0.3); border-radius: 3px; }
-
-    /* 로컬 디버그 패널 — container 전체를 하나의 박스로 */
-    [data-testid="stVerticalBlock"]:has(> div > .stMarkdown .debug-panel-header) {
-        margin-top: 2.2rem;
-        background: rgba(251, 191, 36, 0.07) !important;
-        border: 1px solid rgba(251, 191, 36, 0.35) !important;
-        border-radius: 12px !important;
-        padding: 10px 14px 12px !important;
-    }
-    .debug-panel-header {
-        font-size: 0.72rem;
-        font-weight: 700;
-        letter-spacing: 1.5px;
-        color: rgba(251, 191, 36, 0.80) !important;
-        text-transform: uppercase;
-        margin-bottom: 6px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    if hide_sidebar:
+        inject_css(_CSS_LOGIN_HIDE_SIDEBAR, _CSS_LOGIN)
+    else:
+        inject_css(_CSS_LOGIN)
 
 
 def _render_login_header():
     """MathLab 로그인 화면 헤더(로고 + 배경 장식)를 렌더링합니다."""
+    inject_css(_CSS_LOGIN_HEADER)
     st.markdown("""
-    <style>
-    .math-bg-symbols {
-        position: fixed; top: 0; left: 0;
-        width: 100vw; height: 100vh;
-        pointer-events: none; z-index: 0; overflow: hidden;
-    }
-    .math-sym {
-        position: absolute;
-        color: rgba(139, 92, 246, 0.12);
-        font-family: 'Times New Roman', Georgia, serif;
-        font-style: italic; user-select: none;
-    }
-    .axis-deco {
-        position: fixed; bottom: 36px; left: 36px;
-        opacity: 0.12; z-index: 0; pointer-events: none;
-    }
-    .center-glow {
-        position: fixed;
-        width: 700px; height: 700px;
-        background: radial-gradient(circle, rgba(139,92,246,0.07) 0%, transparent 65%);
-        border-radius: 50%;
-        top: 50%; left: 50%;
-        transform: translate(-50%, -50%);
-        pointer-events: none; z-index: 0;
-    }
-    .mathlab-header {
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        gap: 14px;
-        margin-bottom: 12px;
-        position: relative;
-        z-index: 1;
-    }
-    .mathlab-logo-svg {
-        width: 81px; height: 81px; flex-shrink: 0;
-        filter: drop-shadow(0 0 18px rgba(139,92,246,0.65));
-    }
-    .mathlab-logo-title {
-        font-size: 4.2rem; font-weight: 800; letter-spacing: 8px;
-        background: linear-gradient(135deg, #c4b5fd 0%, #a78bfa 40%, #818cf8 100%);
-        -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-        background-clip: text; line-height: 1;
-        margin: 0;
-    }
-    </style>
 
     <div class="center-glow"></div>
 
@@ -1285,15 +1558,7 @@ def set_route(view: str, subject: Optional[str] = None,
 # 공통 UI
 def _inject_sidebar_nav_visibility(dev: bool):
     """Streamlit 기본 멀티페이지 내비게이션(home, Dev Tree)을 항상 숨깁니다."""
-    st.markdown("""
-    <style>
-    [data-testid="stSidebarNav"],
-    [data-testid="stSidebarNavContainer"],
-    [data-testid="stSidebarNavItems"],
-    [data-testid="stSidebarNavLink"]
-    { display: none !important; visibility: hidden !important; }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css(_CSS_SIDEBAR_NAV)
     # JS MutationObserver는 브라우저 세션당 한 번만 주입하면 됨
     if "_sidebar_nav_js_injected" not in st.session_state:
         st.session_state["_sidebar_nav_js_injected"] = True
@@ -1658,28 +1923,7 @@ def _render_admin_dashboard():
 
     has_alert = total_pend > 0 or unconfirmed > 0 or locked_cnt > 0
 
-    st.markdown("""
-    <style>
-    .adm-stat {
-        background: rgba(255,255,255,0.03);
-        border: 1px solid rgba(99,102,241,0.22);
-        border-radius: 10px;
-        padding: 0.7rem 0.8rem;
-        text-align: center;
-        height: 100%;
-    }
-    .adm-stat-lbl  { font-size:0.78rem; color:rgba(255,255,255,0.48); margin-bottom:0.2rem; }
-    .adm-stat-val  { font-size:1.9rem; font-weight:800; line-height:1.1; margin-bottom:0.15rem; color:rgba(255,255,255,0.90); }
-    .adm-stat-sub  { font-size:0.72rem; color:rgba(255,255,255,0.45); }
-    .adm-stat-ok   { color:#4ade80 !important; }
-    .adm-stat-bad  { color:#f87171 !important; }
-    .adm-shortcut-label {
-        font-size:0.78rem; font-weight:600;
-        color:rgba(255,255,255,0.48);
-        text-align:center; margin-bottom:0.4rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css(_CSS_ADMIN_DASHBOARD)
 
     with st.container(border=True):
         title_col, refresh_col = st.columns([5, 1])
@@ -1747,66 +1991,7 @@ def _render_admin_dashboard():
 
 def _inject_home_styles():
     """홈 뷰의 CSS 스타일을 주입합니다."""
-    st.markdown(
-        """
-        <style>
-          /* 히어로 섹션 — 다크 유리 카드 */
-          .hero-container {
-            background: rgba(255,255,255,0.03);
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            border: 1px solid rgba(99,102,241,0.25);
-            border-radius: 20px;
-            padding: 2.5rem 2rem;
-            margin-bottom: 2.5rem;
-            text-align: center;
-            box-shadow: 0 8px 40px rgba(0,0,0,0.30),
-                        inset 0 1px 0 rgba(255,255,255,0.06);
-          }
-          .hero-title {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 14px;
-            font-size: 3rem;
-            font-weight: 800;
-            margin: 0 0 0.75rem 0;
-            background: linear-gradient(135deg, #c4b5fd 0%, #a78bfa 45%, #818cf8 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-          }
-          .hero-logo-svg {
-            width: 56px; height: 56px; flex-shrink: 0;
-            -webkit-text-fill-color: initial;
-            filter: drop-shadow(0 0 12px rgba(139,92,246,0.65));
-          }
-          .hero-subtitle {
-            font-size: 1.1rem;
-            color: rgba(255,255,255,0.55);
-            line-height: 1.7;
-            margin: 0;
-          }
-
-          /* 교과 카드 */
-          .subject-card { height: 100%; }
-          .subject-card-icon { font-size: 2.6rem; margin-bottom: 0.6rem; }
-          .subject-card-title {
-            font-size: 1.25rem;
-            font-weight: 700;
-            margin: 0 0 0.45rem 0;
-            color: rgba(255,255,255,0.93);
-          }
-          .subject-card-desc {
-            font-size: 0.9rem;
-            color: rgba(255,255,255,0.50);
-            line-height: 1.55;
-            margin: 0 0 1rem 0;
-          }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    inject_css(_CSS_HOME)
 
 def home_view():
     # CSS 스타일링 주입 (뷰가 렌더링될 때마다 적용)
@@ -2203,7 +2388,6 @@ def ot_view(subject_key: str):
 
 
 def lessons_view(subject_key: str):
-    keep_scroll(key=f"{subject_key}/lessons", mount="sidebar")
     label = SUBJECTS.get(subject_key, subject_key)
     if LESSON_HEADER_VISIBLE:
         st.title(f"🔖 {label} 수업")
@@ -2321,23 +2505,16 @@ def lessons_view(subject_key: str):
         for i, item in enumerate(items_node.get("items", []), start=1):
             typ = item.get("type"); title = item.get("title", "")
             st.markdown(f"### {i}. {title}")
-            if typ == "gslides":
-                embed_iframe(item["src"], height=item.get("height", 480))
-            elif typ == "gsheet":
-                embed_iframe(item["src"], height=item.get("height", 700))
-            elif typ == "iframe":
-                embed_iframe(item["src"], height=item.get("height", 800))
+            # iframe형 자료는 화면에 들어올 때만 붙인다(gslides/gsheet/iframe/canva/pdf/youtube)
+            if render_lesson_embed(item):
+                if typ == "pdf" and item.get("download"):
+                    st.link_button("PDF 다운로드", url=item["download"], use_container_width=True)
             elif typ == "tongrami":
                 if st.button(f"🌐 통그라미 열기", key=f"tongrami_{subject_key}_{i}_{sel_key}", use_container_width=True):
                     st.session_state["_embed_url"]   = item["src"]
                     st.session_state["_embed_title"] = title
                     set_route("embed", subject=subject_key, unit=sel_key)
                     _do_rerun()
-            elif typ == "canva":
-                components.html(
-                    f'''<iframe loading="lazy" style="border:0;width:100%;height:{item.get("height",600)}px;" allowfullscreen src="{item["src"]}"></iframe>''',
-                    height=item.get("height", 600)
-                )
             elif typ == "url":
                 st.link_button("문서 열기", url=item["src"], use_container_width=True)
             elif typ == "activity":
@@ -2346,13 +2523,6 @@ def lessons_view(subject_key: str):
                     back_key = (minor or middle or majors[maj_idx]).get("key")
                     set_route("activity", subject=subj, activity=slug, unit=back_key, origin=subject_key)
                     _do_rerun()
-            elif typ == "pdf":
-                embed_pdf(item["src"], height=item.get("height", 800))
-                if item.get("download"):
-                    st.link_button("PDF 다운로드", url=item["download"], use_container_width=True)
-            elif typ == "youtube":
-                url = to_youtube_embed(item["src"])
-                embed_iframe(url, height=item.get("height", 400), scrolling=False)
             elif typ == "image":
                 imgs = item.get("srcs") or item.get("src")
                 caption = item.get("caption")
@@ -2401,31 +2571,17 @@ def lessons_view(subject_key: str):
             typ = item.get("type"); title = item.get("title", "")
             st.markdown(f"### {i}. {title}")
 
-            if typ == "gslides":
-                embed_iframe(item["src"], height=item.get("height", 480))
-            elif typ == "gsheet":
-                embed_iframe(item["src"], height=item.get("height", 700))
-            elif typ == "iframe":
-                embed_iframe(item["src"], height=item.get("height", 800))
+            if render_lesson_embed(item):
+                if typ == "pdf" and item.get("download"):
+                    st.link_button("PDF 다운로드", url=item["download"], use_container_width=True)
             elif typ == "tongrami":
                 if st.button(f"🌐 통그라미 열기", key=f"tongrami_{subject_key}_{i}_{cur_key}", use_container_width=True):
                     st.session_state["_embed_url"]   = item["src"]
                     st.session_state["_embed_title"] = title
                     set_route("embed", subject=subject_key, unit=cur_key)
                     _do_rerun()
-            elif typ == "canva":
-                components.html(
-                    f'''
-                    <iframe loading="lazy" style="border:0; width:100%; height:{item.get("height",600)}px;"
-                            allowfullscreen src="{item["src"]}"></iframe>
-                    ''',
-                    height=item.get("height", 600)
-                )
             elif typ == "url":
                 st.link_button("문서 열기", url=item["src"], use_container_width=True)
-            elif typ == "youtube":
-                url = to_youtube_embed(item["src"])
-                embed_iframe(url, height=item.get("height", 400), scrolling=False)
             elif typ == "activity":
                 subj = item.get("subject"); slug = item.get("slug")
                 if st.button(f"▶ 액티비티 열기: {title}", key=f"lesson_open_{cur_key}_{slug}", use_container_width=True):
@@ -2512,10 +2668,10 @@ def activity_view(subject_key: str, slug: str, registry: Dict[str, List[Activity
             set_route("home"); _do_rerun()
 
     # ✅ 스크롤 유지 스크립트를 사이드바에 주입 → 본문에 '빈 공간' 생성 안 됨
-    keep_scroll(key=f"{subject_key}/{slug}", mount="sidebar")
 
     # ⚠️ 여기에는 divider/빈 마크다운을 넣지 마세요 (여백 원인)
-    act.render()
+    with profile_phase(f"activity:{subject_key}/{slug}"):
+        act.render()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 개인정보처리방침 팝업
@@ -3504,19 +3660,9 @@ def feedback_view():
 # ─────────────────────────────────────────────────────────────────────────────
 # Footer
 def _render_footer():
+    inject_css(_CSS_FOOTER)
     st.markdown(
         """
-        <style>
-          .site-footer {
-            margin-top: 1.5rem;
-            padding: 0.75rem 1rem;
-            border-top: 1px solid rgba(99,102,241,0.18);
-            font-size: 0.82rem;
-            color: rgba(255,255,255,0.35);
-            text-align: center;
-            line-height: 1.8;
-          }
-        </style>
         <div class="site-footer">
           © 2026 MathLab. All rights reserved. &nbsp;|&nbsp;
           개인정보책임자: 김대섭 교사 (휘문고등학교) &nbsp;|&nbsp; 문의: 02-500-9513
@@ -3616,12 +3762,104 @@ def _render_debug_sidebar():
                      help="현재 URL을 430×932(iPhone 14) 크기 팝업으로 엽니다"):
             st.session_state["_mobile_popup_sidebar"] = True
             _do_rerun()
+
+        # ⏱️ rerun 프로파일러 — 켜 둔 세션의 단계별 시간·Sheets 호출·전송량 누적
+        st.toggle("⏱️ rerun 프로파일러", key="_profiler_on")
+        if st.session_state.get("_profiler_on"):
+            rows = profile_stats()
+            if rows:
+                st.dataframe(
+                    rows, use_container_width=True, hide_index=True, height=260,
+                    column_config={
+                        "key": "단계", "n": "샘플",
+                        "p50_ms": "p50(ms)", "p90_ms": "p90(ms)", "p99_ms": "p99(ms)",
+                        "sheets_avg": "Sheets", "kb_avg": "KB",
+                    },
+                )
+            else:
+                st.caption("다음 rerun부터 기록됩니다.")
+            p1, p2 = st.columns(2)
+            with p1:
+                st.download_button(
+                    "CSV", profile_stats_csv(), file_name="rerun_profile.csv",
+                    mime="text/csv", key="_dbg_prof_csv", use_container_width=True,
+                    disabled=not rows,
+                )
+            with p2:
+                if st.button("초기화", key="_dbg_prof_reset", use_container_width=True):
+                    reset_profile_stats()
+                    _do_rerun()
+
+        # 🧠 세션 메모리 — 세션별 session_state 사용량(활동 상태는 화면을 떠나면 압축/파일로 내보냄)
+        with st.expander("🧠 세션 메모리", expanded=False):
+            rows = session_footprints()
+            if rows:
+                st.dataframe(
+                    rows, use_container_width=True, hide_index=True, height=220,
+                    column_config={
+                        "session": "세션", "user": "사용자", "kb": "KB",
+                        "top_owner": "가장 큰 활동", "top_kb": "활동 KB", "age_s": "경과(초)",
+                    },
+                )
+            else:
+                st.caption("다음 rerun부터 기록됩니다.")
+
+        # ♻️ 시뮬레이션 캐시 — 같은 설정·시드의 시뮬레이션은 세션 간에 한 번만 계산
+        with st.expander("♻️ 시뮬레이션 캐시", expanded=False):
+            usage = sim_cache_usage()
+            st.caption(f"{usage['entries']}개 · {usage['kb']:,.0f} / {usage['budget_kb']:,} KB")
+            rows = sim_cache_stats()
+            if rows:
+                st.dataframe(
+                    rows, use_container_width=True, hide_index=True, height=220,
+                    column_config={
+                        "function": "함수", "hits": "적중", "misses": "계산", "bypass": "우회(시드 없음)",
+                        "hit_rate": "적중률", "entries": "항목", "kb": "KB", "ratio": "압축비",
+                        "compute_s": "계산(초)",
+                    },
+                )
+            else:
+                st.caption("아직 캐시된 시뮬레이션이 없습니다.")
+            if st.button("비우기", key="_dbg_simcache_clear", use_container_width=True):
+                clear_sim_cache()
+                _do_rerun()
+
+        # 🧩 HTML 템플릿 캐시 — 대형 임베드 활동 HTML(조립 결과 문자열 보관)
+        with st.expander("🧩 HTML 템플릿 캐시", expanded=False):
+            tstats = template_cache_stats()
+            looked = tstats["hits"] + tstats["misses"]
+            st.caption(
+                f"{tstats['entries']}개 · {tstats['bytes'] / 1024:,.0f} KB · "
+                f"적중 {tstats['hits']} / 조립 {tstats['misses']}"
+                + (f" ({tstats['hits'] / looked:.0%})" if looked else "")
+                + f" · 축출 {tstats['evictions']}"
+            )
+
+        # 📦 라이브러리 번들 — static/vendor/ 보유 여부(없으면 CDN으로 폴백 중)
+        with st.expander("📦 라이브러리 번들", expanded=False):
+            status = vendor_bundle_status()
+            st.caption(" · ".join(f"{'✅' if ok else '☁️ CDN'} {lib}" for lib, ok in status["libs"].items()))
+            if status["error"]:
+                st.caption(f"내려받기 실패: {status['error']}")
         st.markdown("---")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 메인
 def main():
+    # 프로파일러(디버그 패널에서 켬)가 꺼져 있으면 계측 없이 그대로 실행
+    start_rerun_profile()
+    try:
+        _run_app()
+    finally:
+        end_rerun_profile()
+        end_rerun_state()   # 화면에 없는 활동의 큰 세션 상태 내보내기
+
+
+def _run_app():
+    # 스크롤 유지 스크립트: 사이드바 맨 위 고정 자리 → 매 rerun 같은 iframe 재사용
+    install_scroll_keeper()
+
     # 로컬 디버깅 패널 (local_debug_mode = true 시 활성화)
     _render_debug_sidebar()
 
@@ -3642,11 +3880,16 @@ def main():
         st.stop()
     # ──────────────────────────────────────────────────────────────────────────
 
-    _refresh_current_user_permissions()
-    _log_visit()   # 세션 최초 1회 방문 기록
-    _inject_app_theme()  # 전체 앱 다크 테마 적용
-    registry = discover_activities()
-    view, subject, activity, unit = get_route()  # unit 포함
+    with profile_phase("permissions"):
+        _refresh_current_user_permissions()
+    with profile_phase("log_visit"):
+        _log_visit()   # 세션 최초 1회 방문 기록
+    with profile_phase("theme"):
+        _inject_app_theme()  # 전체 앱 다크 테마 적용
+    with profile_phase("discover_activities"):
+        registry = discover_activities()
+    with profile_phase("route"):
+        view, subject, activity, unit = get_route()  # unit 포함
 
     # ── 커스텀 사이드바 레이아웃 ──────────────────────────────────────────────
     # 기본 Streamlit 사이드바 숨기기 (디버그 모드 제외)
@@ -3655,102 +3898,21 @@ def main():
     except Exception:
         _is_local_debug = False
     if not _is_local_debug:
-        st.markdown("""
-        <style>
-        section[data-testid="stSidebar"],
-        [data-testid="stSidebarCollapsedControl"] { display: none !important; }
-        </style>
-        """, unsafe_allow_html=True)
+        inject_css(_CSS_HIDE_ST_SIDEBAR)
 
-    st.markdown("""
-    <style>
-    /* 페이지 전체 여백 */
-    [data-testid="stMainBlockContainer"],
-    [data-testid="stMainBlockContainer"] > .block-container,
-    [data-testid="stMainBlockContainer"] > div {
-        padding-left: 0.75rem !important;
-        padding-right: 0.75rem !important;
-        padding-top: 0.75rem !important;
-        max-width: 100% !important;
-    }
-    /* nav/main 레이아웃: #__ml_nav__ 마커를 포함한 컬럼과 그 형제만 대상으로 지정 */
-    /* 바깥 HorizontalBlock — nav 마커를 포함할 때만 gap 적용 */
-    [data-testid="stHorizontalBlock"]:has(#__ml_nav__) {
-        gap: 2rem !important;
-        padding: 0 !important;
-    }
-    /* 커스텀 nav 열 */
-    [data-testid="column"]:has(#__ml_nav__) {
-        background: transparent !important;
-        padding: 1rem 0.8rem 2rem 0.8rem !important;
-        min-height: calc(100vh - 1.5rem) !important;
-    }
-    /* nav 열 내 버튼 — 폰트 압축 */
-    [data-testid="column"]:has(#__ml_nav__) button {
-        font-size: 0.79rem !important;
-    }
-    /* nav 열 내 expander 헤더 — 한 줄 말줄임표 */
-    [data-testid="column"]:has(#__ml_nav__) [data-testid="stExpander"] summary p,
-    [data-testid="column"]:has(#__ml_nav__) [data-testid="stExpander"] summary span {
-        font-size: 0.79rem !important;
-        white-space: nowrap !important;
-        overflow: hidden !important;
-        text-overflow: ellipsis !important;
-    }
-    /* 메인 콘텐츠 열 (nav 열의 인접 형제) */
-    [data-testid="column"]:has(#__ml_nav__) + [data-testid="column"] {
-        padding-left: 1.5rem !important;
-        padding-right: 1rem !important;
-    }
-    /* 메인 열 내부 중첩 컬럼 리셋 — 외부 CSS 부작용 방지 */
-    [data-testid="column"]:has(#__ml_nav__) + [data-testid="column"] [data-testid="stHorizontalBlock"] {
-        gap: 0.5rem !important;
-    }
-    [data-testid="column"]:has(#__ml_nav__) + [data-testid="column"] [data-testid="column"] {
-        padding: 0 !important;
-        min-height: 0 !important;
-    }
-    /* 햄버거 버튼 스타일 (사이드바 닫힘 시) */
-    [data-testid="stMainBlockContainer"] > div > div > div:first-child button[kind="secondary"]:first-of-type {
-        background: rgba(99,102,241,0.15) !important;
-        border: 1px solid rgba(99,102,241,0.35) !important;
-        color: rgba(255,255,255,0.85) !important;
-        font-size: 1.1rem !important;
-    }
-    /* 셀렉트박스/드롭다운 팝오버(BaseWeb popover)를 모바일 드로어(z-index:9999) 위로 띄움.
-       드로어가 fixed·불투명이라, 기본 z-index의 드롭다운이 드로어 뒤에 가려져
-       단원 선택이 안 되던 문제를 해결한다. (단원 선택은 사이드바 selectbox로만 가능) */
-    [data-baseweb="popover"],
-    [data-baseweb="layer"],
-    [data-baseweb="tooltip"] {
-        z-index: 2147483600 !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css(_CSS_APP_LAYOUT)
 
     _sidebar_open = st.session_state.get("_sidebar_open", True)
 
     if _sidebar_open:
         # stApp 배경 자체를 2색으로 분할: 왼쪽(사이드바)=짙은 보라, 오른쪽(메인)=기본 navy
         # columns([1,5]) + padding 0.75rem×2 + gap 2rem → 분기점 = (100% - 3.5rem)/6 + 1.75rem
-        st.markdown("""
-        <style>
-        .stApp {
-            background-image:
-                linear-gradient(to right,
-                    #0d0626 calc((100% - 3.5rem) / 6 + 1.75rem),
-                    #0f172a calc((100% - 3.5rem) / 6 + 1.75rem)
-                ),
-                linear-gradient(rgba(99,102,241,0.06) 1px, transparent 1px),
-                linear-gradient(90deg, rgba(99,102,241,0.06) 1px, transparent 1px) !important;
-            background-size: 100% 100%, 50px 50px, 50px 50px !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        inject_css(_CSS_APP_NAV_OPEN)
         nav_col, main_col = st.columns([1, 5])
         with nav_col:
             st.markdown('<div id="__ml_nav__"></div>', unsafe_allow_html=True)
-            sidebar_navigation(registry)
+            with profile_phase("sidebar_navigation"):
+                sidebar_navigation(registry)
             # ── 모바일 드로어: JS로 column을 fixed 오버레이로 변환 ──
             components.html("""
             <script>
@@ -3816,7 +3978,7 @@ def main():
             _do_rerun()
         main_col = st.container()
 
-    with main_col:
+    with main_col, profile_phase(f"view:{view}"):
         if view == "home":
             home_view()
         elif view == "change_password":
@@ -0,0 +1,153 @@
+# ifs_utils.py — 카오스 게임 / IFS 점 생성 엔진 (numpy 벡터화)
+"""
+카오스 게임의 한 걸음은 아핀 점화식
+
+    p[n+1] = r[k_n] * p[n] + (1 - r[k_n]) * v[k_n]      (k_n: n번째에 고른 꼭짓점)
+
+입니다. 점마다 파이썬 for 루프를 도는 대신, 블록 단위 누적곱·누적합으로 닫힌 형태를
+계산하고 블록 시작점만 같은 방식으로 재귀 스캔해 수백만 점을 한 번에 만듭니다.
+
+    from ifs_utils import regular_polygon, vertex_sequence, chaos_points
+
+    V = regular_polygon(3)
+    idx = vertex_sequence(len(V), 1_000_000, weights=(1, 1, 1), seed=42)
+    pts = chaos_points(V, idx, ratio=0.5, start=V.mean(axis=0))
+
+- ratio: 공통 수축비(스칼라) 또는 꼭짓점별 수축비 배열, 모두 0 < r < 1
+- 계산은 float64, 결과는 기본 float32 (out=으로 기존 버퍼에 이어 쓰기 가능)
+"""
+import math
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+_MAX_BLOCK = 4096
+# 블록 안에서 누적곱이 이 크기(10^-_EXP_RANGE)보다 작아지지 않도록 블록 길이를 정함
+_EXP_RANGE = 280.0
+_A_FLOOR = 1e-20
+
+RatioLike = Union[float, Sequence[float], np.ndarray]
+
+
+def regular_polygon(n: int, radius: float = 1.0, center=(0.0, 0.0),
+                    rotation: float = math.pi / 2) -> np.ndarray:
+    """정n각형 꼭짓점 (n, 2). 기본은 첫 꼭짓점이 위쪽."""
+    t = rotation + 2.0 * math.pi * np.arange(int(n)) / int(n)
+    return np.column_stack([center[0] + radius * np.cos(t), center[1] + radius * np.sin(t)])
+
+
+def vertex_sequence(n_vertices: int, size: int, weights: Optional[Sequence[float]] = None,
+                    seed=None) -> np.ndarray:
+    """꼭짓점 번호 수열. 꼭짓점이 256개 미만이면 uint8로 돌려줍니다."""
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    p = None
+    if weights is not None:
+        w = np.asarray(weights, dtype=np.float64)
+        if w.shape != (int(n_vertices),) or np.any(w < 0) or w.sum() <= 0:
+            raise ValueError("weights must be non-negative with one entry per vertex")
+        p = w / w.sum()
+    dtype = np.uint8 if n_vertices < 256 else np.uint32
+    return rng.choice(int(n_vertices), size=int(size), p=p).astype(dtype, copy=False)
+
+
+def _block_len(a_min: float) -> int:
+    if a_min >= 1.0:
+        return _MAX_BLOCK
+    return int(max(1, min(_MAX_BLOCK, _EXP_RANGE // -math.log10(a_min))))
+
+
+def _scan_uniform(a: float, x: np.ndarray, p0: float) -> np.ndarray:
+    """
+    계수가 모두 a인 x[n+1] = a*x[n] + c[n] 을, c가 담긴 1차원 float64 버퍼 x 위에서 제자리로
+    계산합니다. 거듭제곱 표 하나를 모든 블록이 공유합니다.
+    """
+    n = x.shape[0]
+    if n == 0:
+        return x
+    a = max(float(a), _A_FLOOR)
+    block = min(_block_len(a), n)
+    q = a ** np.arange(1, block + 1, dtype=np.float64)           # a, a², …
+    inv = 1.0 / q
+    full = (n // block) * block
+    last = p0
+    if full:
+        x2 = x[:full].reshape(-1, block)
+        x2 *= inv
+        np.cumsum(x2, axis=1, out=x2)
+        x2 *= q                                                   # 블록 시작점을 0으로 둔 값
+        starts = np.empty(x2.shape[0])
+        starts[0] = p0
+        if x2.shape[0] > 1:
+            # 블록 시작점: s[b+1] = a^block * s[b] + x2[b, -1] → 블록 수준에서 같은 스캔
+            starts[1:] = _scan_uniform(q[-1], x2[:-1, -1].copy(), p0)
+        x2 += starts[:, None] * q
+        last = x2[-1, -1]
+    tail = x[full:]
+    if tail.shape[0]:
+        k = tail.shape[0]
+        tail *= inv[:k]
+        np.cumsum(tail, out=tail)
+        tail += last
+        tail *= q[:k]
+    return x
+
+
+def _affine_scan(a: np.ndarray, c: np.ndarray, p0: np.ndarray) -> np.ndarray:
+    """x[n+1] = a[n]*x[n] + c[n], x[0]=p0 일 때 x[1..N]을 돌려줍니다. a: (N,), c: (N, d)."""
+    n = a.shape[0]
+    if n == 0:
+        return np.empty_like(c)
+    # 1e-20보다 작은 계수는 float64 정밀도 밖이므로 잘라서 블록 길이를 14 이상으로 유지
+    a = np.maximum(a, _A_FLOOR)
+    a_min = float(a.min())
+    block = _block_len(a_min)
+    if n <= block:
+        q = np.cumprod(a)                         # q[i] = a[0]…a[i]
+        s = np.cumsum(c / q[:, None], axis=0)     # Σ_{j≤i} c[j] / q[j]
+        return q[:, None] * (p0 + s)
+
+    m = -(-n // block)
+    pad = m * block - n
+    if pad:
+        a = np.concatenate([a, np.ones(pad)])
+        c = np.concatenate([c, np.zeros((pad, c.shape[1]))])
+    a2 = a.reshape(m, block)
+    c2 = c.reshape(m, block, -1)
+    q = np.cumprod(a2, axis=1)                                    # 블록 안 누적곱
+    local = q[:, :, None] * np.cumsum(c2 / q[:, :, None], axis=1)  # 블록 시작점을 0으로 둔 값
+    # 블록 시작점 s[b]: s[b+1] = q[b,-1]*s[b] + local[b,-1]  → 같은 스캔을 블록 수준에서 재귀
+    starts = np.empty((m, c.shape[1]))
+    starts[0] = p0
+    if m > 1:
+        starts[1:] = _affine_scan(q[:-1, -1], local[:-1, -1], p0)
+    out = q[:, :, None] * starts[:, None, :] + local
+    return out.reshape(m * block, -1)[:n]
+
+
+def chaos_points(vertices, idx: np.ndarray, ratio: RatioLike = 0.5, start=None,
+                 out: Optional[np.ndarray] = None, dtype=np.float32) -> np.ndarray:
+    """
+    꼭짓점 번호 수열 idx를 따라간 카오스 게임 점 (len(idx), d).
+
+    start는 시작점(기본: 꼭짓점 무게중심)이며 결과에는 포함되지 않습니다. 마지막 점이
+    다음 호출의 start가 되므로 긴 수열을 나눠 이어 만들 수 있습니다.
+    """
+    V = np.asarray(vertices, dtype=np.float64)
+    idx = np.asarray(idx)
+    r = np.asarray(ratio, dtype=np.float64)
+    if r.ndim == 0:
+        r = np.full(V.shape[0], float(r))
+    if r.shape != (V.shape[0],) or np.any(r <= 0.0) or np.any(r >= 1.0):
+        raise ValueError("ratio must be in (0, 1), scalar or one per vertex")
+    p0 = V.mean(axis=0) if start is None else np.asarray(start, dtype=np.float64)
+
+    if out is None:
+        out = np.empty((idx.shape[0], V.shape[1]), dtype=dtype)
+    cv = (1.0 - r)[:, None] * V
+    if np.all(r == r[0]):
+        # 공통 수축비: 좌표별 1차원 버퍼에서 제자리 스캔(가장 빠른 경로)
+        for j in range(V.shape[1]):
+            out[:, j] = _scan_uniform(r[0], np.take(cv[:, j], idx), float(p0[j]))
+    else:
+        out[...] = _affine_scan(r[idx], cv[idx], p0)
+    return out
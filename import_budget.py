@@ -0,0 +1,150 @@
+# import_budget.py — 시작 시 import 시간 리포트와 예산 검사
+"""
+홈 화면만 띄우는 프로세스가 하는 일(home.py 모듈 로드 + 모든 활동 모듈 로드)을 새
+파이썬 프로세스에서 `python -X importtime`으로 재현하고 다음을 출력합니다.
+
+    - 최상위 패키지별 import 시간(self 합계) 상위 목록
+    - 활동 모듈별 로드 시간과 그 모듈이 처음 끌어온 무거운 패키지
+    - 예산 검사: 모듈 로드 실패가 있거나, _FORBIDDEN 패키지가 올라오거나, 전체 시간이
+      --budget-ms를 넘으면 종료 코드 1
+
+st.secrets는 bench_views와 같은 가짜 값(_FAKE_SECRETS)으로 채워 두므로, 모듈 최상위에서
+비밀값을 읽는 활동도 실제 배포처럼 끝까지 로드됩니다(실패한 모듈은 시간이 덜 잡히므로 예산 위반).
+
+사용 예:
+    python import_budget.py                 # 리포트 + 예산 검사
+    python import_budget.py --top 30 --budget-ms 6000
+
+무거운 의존성은 lazy_utils.lazy_import / lazy_from 또는 함수 안 import로 미룹니다.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from bench_views import _FAKE_SECRETS, ACTIVITIES_ROOT, ROOT, _activity_slugs, _subjects
+
+# 홈 화면만 보는 프로세스에 올라오면 안 되는 패키지
+_FORBIDDEN = ("scipy", "matplotlib", "wordcloud", "anthropic")
+# 리포트에 "무거운 패키지"로 표시할 패키지
+_HEAVY = _FORBIDDEN + ("pandas", "plotly", "gspread", "pyarrow", "PIL", "sympy")
+_DEFAULT_BUDGET_MS = 8000.0
+
+# 하위 프로세스에서 실행: home.py와 모든 활동 모듈을 discover_activities처럼 로드
+_PROBE = r"""
+import importlib.util, json, sys, time
+sys.path.insert(0, {root!r})
+heavy = {heavy!r}
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+def _present():
+    return {{h for h in heavy if h in sys.modules}}
+rows = []
+t0 = time.perf_counter()
+before = _present()
+# AppTest와 같은 방식으로 가짜 비밀값 주입. streamlit import는 home.py 몫으로 잡습니다.
+import streamlit as st
+from streamlit.runtime.secrets import Secrets
+st.secrets = Secrets()
+st.secrets._secrets = json.loads({secrets!r})
+t1 = t0
+for name, path in [("home", {home!r})] + [(p.rsplit("/", 1)[-1][:-3], p) for p in {paths!r}]:
+    try:
+        _load(name, path)
+        err = None
+    except Exception as e:
+        err = f"{{type(e).__name__}}: {{e}}"[:160]
+    now, loaded = time.perf_counter(), _present()
+    rows.append([path, (now - t1) * 1000.0, sorted(loaded - before), err])
+    t1, before = now, loaded
+total = (time.perf_counter() - t0) * 1000.0
+print("@@PROBE@@" + json.dumps({{"rows": rows, "total_ms": total, "loaded": sorted(_present())}}))
+"""
+
+
+def _activity_paths() -> List[str]:
+    paths = []
+    for subject in _subjects():
+        for slug in _activity_slugs(subject):
+            paths.append(str(ACTIVITIES_ROOT / subject / f"{slug}.py"))
+    return paths
+
+
+def _parse_importtime(stderr: str) -> Dict[str, float]:
+    """-X importtime 출력 → 최상위 패키지별 self 시간(ms) 합계."""
+    by_pkg: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, _cum, name = [x.strip() for x in rest.split("|")]
+            by_pkg[name.split(".")[0]] += int(self_us) / 1000.0
+        except ValueError:
+            continue
+    return by_pkg
+
+
+def run_probe() -> dict:
+    code = _PROBE.format(
+        root=str(ROOT), heavy=list(_HEAVY), secrets=json.dumps(_FAKE_SECRETS),
+        home=str(ROOT / "home.py"), paths=_activity_paths(),
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=str(ROOT),
+    )
+    marker = next((l for l in proc.stdout.splitlines() if l.startswith("@@PROBE@@")), None)
+    if marker is None:
+        raise RuntimeError(f"probe failed:\n{proc.stderr[-2000:]}")
+    data = json.loads(marker[len("@@PROBE@@"):])
+    data["packages"] = _parse_importtime(proc.stderr)
+    return data
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="시작 시 import 시간 리포트와 예산 검사")
+    ap.add_argument("--top", type=int, default=20, help="패키지·활동 상위 N개 출력")
+    ap.add_argument("--budget-ms", type=float, default=_DEFAULT_BUDGET_MS,
+                    help=f"home.py + 활동 전체 로드 시간 예산(기본 {_DEFAULT_BUDGET_MS:.0f}ms)")
+    args = ap.parse_args(argv)
+
+    data = run_probe()
+
+    print(f"== 패키지별 import 시간 (self 합계, 상위 {args.top})")
+    for pkg, ms in sorted(data["packages"].items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {ms:9.1f} ms  {pkg}")
+
+    print(f"\n== 모듈별 로드 시간 (상위 {args.top})")
+    rows = sorted(data["rows"], key=lambda r: r[1], reverse=True)
+    for row in rows[:args.top]:
+        path, ms, pulled = row[0], row[1], row[2]
+        rel = Path(path).relative_to(ROOT) if Path(path).is_absolute() else path
+        extra = f"  ← {', '.join(pulled)}" if pulled else ""
+        err = f"  [{row[3]}]" if row[3] else ""
+        print(f"  {ms:9.1f} ms  {rel}{extra}{err}")
+
+    print(f"\n== 합계 {data['total_ms']:.0f} ms, 로드된 무거운 패키지: {', '.join(data['loaded']) or '없음'}")
+
+    problems = []
+    failed = [r for r in data["rows"] if r[3]]
+    for r in failed:
+        problems.append(f"로드 실패: {Path(r[0]).relative_to(ROOT)}  [{r[3]}]")
+    forbidden = [p for p in data["loaded"] if p in _FORBIDDEN]
+    if forbidden:
+        culprits = [Path(r[0]).name for r in data["rows"] if set(r[2]) & set(forbidden)]
+        problems.append(f"금지 패키지 로드: {', '.join(forbidden)} (원인: {', '.join(culprits)})")
+    if data["total_ms"] > args.budget_ms:
+        problems.append(f"시작 import 시간 {data['total_ms']:.0f}ms > 예산 {args.budget_ms:.0f}ms")
+    for p in problems:
+        print(f"BUDGET  {p}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
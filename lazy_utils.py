@@ -0,0 +1,88 @@
+# lazy_utils.py — 무거운 의존성 지연 import
+"""
+home.py는 활동 목록을 만들 때 모든 활동 모듈을 import하므로, 활동 최상위의
+`from scipy.stats import norm` 같은 한 줄이 홈 화면만 보는 프로세스에도 scipy를 올립니다.
+
+    from lazy_utils import lazy_import, lazy_from
+
+    stats = lazy_import("scipy.stats")        # 모듈 프록시
+    norm = lazy_from("scipy.stats", "norm")   # 모듈 속성 프록시
+
+프록시는 처음 속성에 접근하거나 호출할 때 실제로 import하며, 이후에는 캐시된 대상을
+그대로 씁니다. 시작 시 어떤 패키지가 올라오는지는 import_budget.py로 확인합니다.
+"""
+import importlib
+import threading
+import types
+from typing import Any
+
+_import_lock = threading.Lock()
+
+
+class _LazyModule(types.ModuleType):
+    """첫 속성 접근 때 import되는 모듈 프록시."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        target = self.__dict__["_lazy_target"]
+        if target is None:
+            with _import_lock:
+                target = self.__dict__["_lazy_target"]
+                if target is None:
+                    target = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_target"] = target
+        return target
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._load(), attr)
+        # 다음 접근부터는 프록시를 거치지 않도록 캐시
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "lazy"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+class _LazyAttr:
+    """모듈 속성(함수·클래스·분포 객체 등)의 지연 프록시."""
+
+    __slots__ = ("_module", "_attr", "_target")
+
+    def __init__(self, module: str, attr: str):
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_attr", attr)
+        object.__setattr__(self, "_target", None)
+
+    def _load(self) -> Any:
+        target = object.__getattribute__(self, "_target")
+        if target is None:
+            mod = importlib.import_module(object.__getattribute__(self, "_module"))
+            target = getattr(mod, object.__getattribute__(self, "_attr"))
+            object.__setattr__(self, "_target", target)
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {object.__getattribute__(self, '_module')}.{object.__getattribute__(self, '_attr')}>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """모듈 프록시를 돌려줍니다. 실제 import는 첫 속성 접근 때 일어납니다."""
+    return _LazyModule(name)
+
+
+def lazy_from(module: str, attr: str) -> Any:
+    """`from module import attr` 의 지연 버전."""
+    return _LazyAttr(module, attr)
@@ -31,33 +31,14 @@ import auth_utils as _auth_utils
 
 st.set_page_config(page_title="회원 관리", layout="wide")
 
-from theme_utils import inject_dark_theme, inject_hide_nav
+from theme_utils import inject_dark_theme, inject_hide_nav, inject_page_nav_style
 inject_dark_theme()
 inject_hide_nav()
 
 # ── 커스텀 사이드바 ──────────────────────────────────────────────────────────
 _nav_col, _main_col = st.columns([1, 5], gap="small")
 with _nav_col:
-    st.markdown('''<style>
-    [data-testid="stMainBlockContainer"] {
-        padding-left: 0 !important;
-        padding-right: 0.5rem !important;
-    }
-    [data-testid="column"]:first-child {
-        background: linear-gradient(180deg,rgba(6,8,22,0.99) 0%,rgba(4,8,20,0.99) 100%) !important;
-        border-right: 2px solid rgba(99,102,241,0.35) !important;
-        border-radius: 0 !important;
-        min-height: 100vh !important;
-        box-shadow: 4px 0 24px rgba(0,0,0,0.55) !important;
-        padding: 1rem 0.6rem 2rem 0.8rem !important;
-    }
-    [data-testid="column"]:nth-child(2) {
-        padding-left: 1rem !important;
-    }
-    [data-testid="column"]:first-child button {
-        font-size: 0.79rem !important;
-    }
-    </style>''', unsafe_allow_html=True)
+    inject_page_nav_style()
     if st.button("🏠 홈으로", key="_97_nav_home", use_container_width=True):
         st.switch_page("home.py")
     if st.session_state.get("_dev_mode", False):
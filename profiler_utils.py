@@ -0,0 +1,218 @@
+# profiler_utils.py — rerun 단계별 프로파일러 (옵트인)
+"""
+main()의 각 단계(권한 갱신, 방문 기록, 테마, 활동 탐색, 라우팅, 사이드바, 뷰)와
+act.render()마다 벽시계 시간·Google Sheets API 호출 수·브라우저로 보낸 바이트를 기록하고,
+단계/뷰/활동 slug별 최근 샘플로 p50·p90·p99를 계산합니다.
+
+    prof_on = start_rerun_profile()          # 꺼져 있으면 아무것도 하지 않음
+    with profile_phase("permissions"):
+        ...
+    end_rerun_profile()
+
+- Sheets 호출 수: gspread HTTPClient.request를 한 번 감싸 프로파일 중인 스레드에서만 셉니다.
+- 전송 바이트: 현재 ScriptRunContext의 enqueue를 rerun 동안만 감싸 ForwardMsg 크기를 더합니다.
+- 통계는 프로세스 전역이며, 프로파일러를 켠 세션의 rerun만 반영됩니다.
+"""
+import csv
+import io
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+_SESSION_FLAG = "_profiler_on"
+_MAX_SAMPLES = 200      # 키별로 보관할 최근 샘플 수
+_MAX_KEYS = 500         # 키(단계·뷰·slug) 수 상한
+
+# ── 전역 통계 ─────────────────────────────────────────────────────────────────
+# 키 → deque[(ms, sheets 호출 수, 바이트)]
+_samples: Dict[str, Deque[Tuple[float, int, int]]] = {}
+_samples_lock = threading.Lock()
+
+# ── 스레드별 진행 중인 프로파일 ──────────────────────────────────────────────
+_local = threading.local()
+
+
+class _Frame:
+    __slots__ = ("name", "t0", "sheets", "bytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.t0 = time.perf_counter()
+        self.sheets = 0
+        self.bytes = 0
+
+
+def _stack() -> Optional[List[_Frame]]:
+    return getattr(_local, "stack", None)
+
+
+def _count(sheets: int = 0, nbytes: int = 0) -> None:
+    stack = _stack()
+    if not stack:
+        return
+    for f in stack:
+        f.sheets += sheets
+        f.bytes += nbytes
+
+
+def _record(key: str, ms: float, sheets: int, nbytes: int) -> None:
+    with _samples_lock:
+        dq = _samples.get(key)
+        if dq is None:
+            if len(_samples) >= _MAX_KEYS:
+                return
+            dq = _samples[key] = deque(maxlen=_MAX_SAMPLES)
+        dq.append((ms, sheets, nbytes))
+
+
+# ── 계측 훅 ───────────────────────────────────────────────────────────────────
+_sheets_hooked = False
+_hook_lock = threading.Lock()
+
+
+def _hook_sheets() -> None:
+    """gspread HTTP 클라이언트를 한 번만 감싸 Sheets 호출을 셉니다."""
+    global _sheets_hooked
+    with _hook_lock:
+        if _sheets_hooked:
+            return
+        _sheets_hooked = True
+        try:
+            from gspread.http_client import HTTPClient
+        except Exception:
+            return
+        original = HTTPClient.request
+
+        def request(self, *args, **kwargs):
+            record_sheets_call()
+            return original(self, *args, **kwargs)
+
+        HTTPClient.request = request
+
+
+def _hook_enqueue() -> None:
+    """이번 rerun 동안 ForwardMsg 바이트를 세도록 ScriptRunContext.enqueue를 감쌉니다."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        ctx = None
+    if ctx is None:
+        return
+    original = ctx._enqueue
+
+    def enqueue(msg):
+        try:
+            _count(nbytes=msg.ByteSize())
+        except Exception:
+            pass
+        return original(msg)
+
+    ctx._enqueue = enqueue
+    _local.restore = (ctx, original)
+
+
+def _unhook_enqueue() -> None:
+    restore = getattr(_local, "restore", None)
+    if restore is not None:
+        ctx, original = restore
+        ctx._enqueue = original
+        _local.restore = None
+
+
+# ── 공개 API ──────────────────────────────────────────────────────────────────
+def record_sheets_call() -> None:
+    """Sheets API 호출 1회를 현재 단계들에 더합니다(가짜 백엔드에서도 호출)."""
+    _count(sheets=1)
+
+
+def profiling_enabled() -> bool:
+    return bool(st.session_state.get(_SESSION_FLAG, False))
+
+
+def start_rerun_profile() -> bool:
+    """프로파일러가 켜져 있으면 이번 rerun 계측을 시작하고 True를 돌려줍니다."""
+    if not profiling_enabled():
+        _local.stack = None
+        return False
+    _hook_sheets()
+    _unhook_enqueue()
+    _local.stack = [_Frame("rerun")]
+    _hook_enqueue()
+    return True
+
+
+def end_rerun_profile() -> None:
+    """rerun 전체 합계를 기록하고 계측을 해제합니다. 중복 호출해도 안전합니다."""
+    stack = _stack()
+    _unhook_enqueue()
+    _local.stack = None
+    if not stack:
+        return
+    root = stack[0]
+    _record("rerun", (time.perf_counter() - root.t0) * 1000.0, root.sheets, root.bytes)
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """단계 하나를 계측합니다. 바깥 단계에는 안쪽 단계의 비용이 포함됩니다."""
+    stack = _stack()
+    if stack is None:
+        yield
+        return
+    frame = _Frame(name)
+    stack.append(frame)
+    try:
+        yield
+    finally:
+        stack.remove(frame)
+        _record(name, (time.perf_counter() - frame.t0) * 1000.0, frame.sheets, frame.bytes)
+
+
+def _pct(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+
+def profile_stats() -> List[Dict[str, float]]:
+    """키별 샘플 수와 시간 p50/p90/p99, 평균 Sheets 호출·전송 KB (p90 시간 내림차순)."""
+    with _samples_lock:
+        snapshot = {k: list(v) for k, v in _samples.items()}
+    rows = []
+    for key, samples in snapshot.items():
+        if not samples:
+            continue
+        ms = sorted(s[0] for s in samples)
+        n = len(samples)
+        rows.append({
+            "key": key,
+            "n": n,
+            "p50_ms": round(_pct(ms, 0.50), 1),
+            "p90_ms": round(_pct(ms, 0.90), 1),
+            "p99_ms": round(_pct(ms, 0.99), 1),
+            "sheets_avg": round(sum(s[1] for s in samples) / n, 2),
+            "kb_avg": round(sum(s[2] for s in samples) / n / 1024.0, 1),
+        })
+    rows.sort(key=lambda r: r["p90_ms"], reverse=True)
+    return rows
+
+
+def profile_stats_csv() -> bytes:
+    rows = profile_stats()
+    buf = io.StringIO()
+    fields = ["key", "n", "p50_ms", "p90_ms", "p99_ms", "sheets_avg", "kb_avg"]
+    writer = csv.DictWriter(buf, fieldnames=fields)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8-sig")
+
+
+def reset_profile_stats() -> None:
+    with _samples_lock:
+        _samples.clear()
@@ -0,0 +1,149 @@
+# raster_utils.py — 대량 점 산점도용 서버 측 밀도 래스터
+"""
+수십만~천만 개 점을 Plotly 산점도 JSON으로 보내는 대신, 표시 해상도의 2차원 히스토그램에
+누적해 로그 음영 PNG(수십 KB) 한 장으로 보냅니다.
+
+    raster = DensityRaster((0, 1, 0, 0.9), width=800)
+    raster.add(new_pts)                 # 새로 생긴 점만 누적(점진적 갱신)
+    st.image(raster.to_png(dot=2))
+
+- 누적은 np.bincount 한 번이라 점 수에 선형이고, 이미 넣은 점은 다시 세지 않습니다.
+- to_png는 count → log1p 정규화 → 색상표 인덱스(팔레트 PNG)로 바꾸며, dot>1이면 점 크기만큼 번지게 합니다.
+- 정적 도형(삼각형 테두리·라벨)은 overlay 콜백에서 PIL ImageDraw로 그립니다.
+- 세션에는 counts 배열만 두고 매 rerun DensityRaster(..., counts=배열)로 감싸 쓰면,
+  state_utils가 배열 크기를 그대로 세고 화면을 떠날 때 내보낼 수 있습니다.
+"""
+import io
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+Extent = Tuple[float, float, float, float]   # (xmin, xmax, ymin, ymax)
+OVERLAY_INK = 255   # 팔레트에서 overlay 선·글자에 쓰는 인덱스
+
+# 색상표 기준점(0→1): 흰 배경 → 하늘색 → 남색
+_COLORMAPS = {
+    "blues": [(255, 255, 255), (158, 202, 225), (49, 130, 189), (8, 48, 107)],
+    "magma": [(255, 255, 255), (252, 187, 125), (183, 55, 121), (28, 16, 68)],
+}
+
+
+def _lut(name: str) -> np.ndarray:
+    stops = np.asarray(_COLORMAPS.get(name, _COLORMAPS["blues"]), dtype=np.float64)
+    xs = np.linspace(0.0, 1.0, len(stops))
+    t = np.linspace(0.0, 1.0, 256)
+    return np.stack([np.interp(t, xs, stops[:, k]) for k in range(3)], axis=1).astype(np.uint8)
+
+
+def _box_sum(counts: np.ndarray, radius: int) -> np.ndarray:
+    """(2r+1)² 창 안의 합(적분 영상). 점 크기를 키우는 용도."""
+    if radius <= 0:
+        return counts
+    h, w = counts.shape
+    s = np.zeros((h + 1, w + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(counts, axis=0), axis=1, out=s[1:, 1:])
+    y0 = np.clip(np.arange(h) - radius, 0, h); y1 = np.clip(np.arange(h) + radius + 1, 0, h)
+    x0 = np.clip(np.arange(w) - radius, 0, w); x1 = np.clip(np.arange(w) + radius + 1, 0, w)
+    return (s[y1][:, x1] - s[y0][:, x1] - s[y1][:, x0] + s[y0][:, x0])
+
+
+class DensityRaster:
+    """고정 범위·해상도의 점 개수 격자. 새 점만 add()로 더합니다.
+    counts를 주면 그 (height, width) uint32 배열을 복사 없이 그대로 갱신합니다."""
+
+    def __init__(self, extent: Extent, width: int = 800, height: Optional[int] = None,
+                 counts: Optional[np.ndarray] = None):
+        xmin, xmax, ymin, ymax = (float(v) for v in extent)
+        if not (xmax > xmin and ymax > ymin):
+            raise ValueError("extent must be (xmin, xmax, ymin, ymax) with xmin<xmax, ymin<ymax")
+        self.extent = (xmin, xmax, ymin, ymax)
+        self.width = int(width)
+        self.height = int(height) if height else max(1, round(self.width * (ymax - ymin) / (xmax - xmin)))
+        if counts is None:
+            counts = np.zeros((self.height, self.width), dtype=np.uint32)
+        elif counts.shape != (self.height, self.width) or counts.dtype != np.uint32:
+            raise ValueError("counts must be a (height, width) uint32 array")
+        self.counts = counts
+        self.n = 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.counts.nbytes)
+
+    def reset(self) -> None:
+        self.counts.fill(0)
+        self.n = 0
+
+    def pixel(self, x: float, y: float) -> Tuple[float, float]:
+        """데이터 좌표 → 이미지 픽셀 좌표(y축 위쪽이 +)."""
+        xmin, xmax, ymin, ymax = self.extent
+        return ((x - xmin) / (xmax - xmin) * self.width,
+                (ymax - y) / (ymax - ymin) * self.height)
+
+    def add(self, pts: np.ndarray) -> None:
+        """점 (N, 2)를 격자에 누적합니다. 범위 밖 점은 세지 않지만 n에는 포함됩니다."""
+        pts = np.asarray(pts)
+        if pts.shape[0] == 0:
+            return
+        xmin, xmax, ymin, ymax = self.extent
+        col = ((pts[:, 0] - xmin) * (self.width / (xmax - xmin))).astype(np.int64)
+        row = ((ymax - pts[:, 1]) * (self.height / (ymax - ymin))).astype(np.int64)
+        ok = (col >= 0) & (col < self.width) & (row >= 0) & (row < self.height)
+        flat = row[ok] * self.width + col[ok]
+        self.counts += np.bincount(flat, minlength=self.width * self.height).reshape(
+            self.height, self.width).astype(np.uint32, copy=False)
+        self.n += int(pts.shape[0])
+
+    def to_index(self, dot: int = 1, log: bool = True) -> np.ndarray:
+        """색상표 인덱스(0~254) 격자. 255는 overlay 선 색으로 남겨 둡니다."""
+        c = _box_sum(self.counts.astype(np.float64), max(0, (int(dot) - 1) // 2))
+        peak = float(c.max())
+        if peak <= 0:
+            v = np.zeros(c.shape)
+        elif log:
+            v = np.log1p(c) / np.log1p(peak)
+        else:
+            v = c / peak
+        # 한 점만 있어도 보이도록 0이 아닌 칸은 최소 밝기를 줌
+        v = np.where(c > 0, 0.25 + 0.75 * v, 0.0)
+        return (v * 254).astype(np.uint8)
+
+    def to_png(self, dot: int = 1, colormap: str = "blues", log: bool = True,
+               overlay: Optional[Callable[["object", "DensityRaster"], None]] = None,
+               overlay_color=(60, 60, 60)) -> bytes:
+        """
+        팔레트(8비트) PNG 바이트 — RGB보다 훨씬 작습니다.
+        overlay(draw, raster)로 도형·라벨을 덧그릴 수 있으며, 선 색은 OVERLAY_INK(=255)입니다.
+        """
+        from PIL import Image, ImageDraw
+        palette = _lut(colormap)
+        palette[OVERLAY_INK] = overlay_color
+        img = Image.fromarray(self.to_index(dot=dot, log=log)).convert("P")
+        img.putpalette(palette.reshape(-1).tolist())
+        if overlay is not None:
+            overlay(ImageDraw.Draw(img), self)
+        buf = io.BytesIO()
+        img.save(buf, format="PNG", optimize=True)
+        return buf.getvalue()
+
+
+def density_png(pts: np.ndarray, extent: Extent, width: int = 800, **kwargs) -> bytes:
+    """한 번에 그리는 경우의 단축 함수."""
+    raster = DensityRaster(extent, width=width)
+    raster.add(pts)
+    return raster.to_png(**kwargs)
+
+
+def polygon_overlay(vertices: Sequence[Sequence[float]], labels: Sequence[str] = (),
+                    width: int = 2) -> Callable:
+    """꼭짓점을 잇는 테두리(+라벨)를 그리는 overlay 콜백(색은 to_png의 overlay_color)."""
+    def draw_fn(draw, raster: "DensityRaster") -> None:
+        px = [raster.pixel(float(x), float(y)) for x, y in vertices]
+        draw.line(px + [px[0]], fill=OVERLAY_INK, width=width)
+        cx = sum(p[0] for p in px) / len(px); cy = sum(p[1] for p in px) / len(px)
+        for (x, y), text in zip(px, labels):
+            # 무게중심 반대쪽으로 살짝 띄워 선과 겹치지 않게
+            dx, dy = x - cx, y - cy
+            norm = max(1e-9, (dx * dx + dy * dy) ** 0.5)
+            draw.text((x + 14 * dx / norm - 3, y + 14 * dy / norm - 6), text, fill=OVERLAY_INK)
+    return draw_fn
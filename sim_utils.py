@@ -0,0 +1,199 @@
+# sim_utils.py — 확률 시뮬레이션 활동용 배치(벡터화) 엔진
+"""
+활동마다 경로·시행을 파이썬 for 루프로 하나씩 만들던 부분을, 행렬 한 번(또는 메모리 상한에
+맞춘 몇 덩어리)으로 뽑아 축 방향 연산으로 처리합니다.
+
+    from sim_utils import lln_paths
+    res = lln_paths("베르누이", {"p": 0.5}, n=5000, paths=200, seed=0, eps=0.1, mu=0.5)
+    res.grid, res.xbar, res.prop_inside
+
+- 메모리: 한 덩어리의 작업 배열이 _CHUNK_BYTES를 넘지 않도록 행(경로) 단위로 나눕니다.
+- 표시용 경로는 로그 간격 n 격자로 줄이고(decimation), 통계는 전체 해상도로 계산합니다.
+"""
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+_CHUNK_BYTES = 32 << 20     # 덩어리 하나의 작업 배열 상한(32MB)
+_PLOT_POINTS = 400          # 경로 하나당 표시 점 수(로그 간격)
+
+
+def rows_per_chunk(n: int, bytes_per_value: int = 8) -> int:
+    """폭 n(값 하나 bytes_per_value바이트)인 작업 행렬을 _CHUNK_BYTES 안에서 몇 행씩 만들지."""
+    return max(1, _CHUNK_BYTES // max(1, n * bytes_per_value))
+
+
+def log_grid(n: int, points: int = _PLOT_POINTS) -> np.ndarray:
+    """1..n 을 로그 간격으로 고른 정수 격자(1과 n 포함, 중복 제거)."""
+    if n <= points:
+        return np.arange(1, n + 1)
+    g = np.unique(np.round(np.geomspace(1, n, points)).astype(np.int64))
+    # 앞부분은 정수 간격이 촘촘해 중복이 빠지므로 부족한 만큼 선형 격자를 섞음
+    if g.shape[0] < points:
+        g = np.unique(np.concatenate([g, np.round(np.linspace(1, n, points - g.shape[0])).astype(np.int64)]))
+    return g
+
+
+# ── 큰 수의 법칙: 표본평균 경로 ───────────────────────────────────────────────
+def _draw(dist: str, params: Dict[str, float], shape: Tuple[int, int], rng: np.random.Generator) -> np.ndarray:
+    """분포별 표본 행렬. 베르누이는 0/1 정수, 나머지는 float32(누적합은 float64로)."""
+    if dist == "베르누이":
+        return (rng.random(shape, dtype=np.float32) < float(params.get("p", 0.5))).astype(np.int8)
+    if dist == "정규분포":
+        mu = float(params.get("mu", 0.0)); sigma = max(1e-9, float(params.get("sigma", 1.0)))
+        x = rng.standard_normal(shape, dtype=np.float32)
+        x *= sigma
+        x += mu
+        return x
+    return rng.random(shape, dtype=np.float32)     # 균등분포[0,1] 및 기본값
+
+
+@dataclass(frozen=True)
+class LLNResult:
+    grid: np.ndarray          # 표시용 n 격자 (g,)
+    xbar: np.ndarray          # 경로별 표본평균을 격자에서 샘플링 (paths, g) float32
+    prop_inside: np.ndarray   # 전체 해상도 P(|X̄ₙ−μ|<ε) 추정 (n,)
+    xbar_last: np.ndarray     # 경로별 마지막 표본평균 (paths,)
+
+
+def lln_paths(dist: str, params: Dict[str, float], n: int, paths: int, seed: int,
+              eps: float, mu: float, plot_points: int = _PLOT_POINTS) -> LLNResult:
+    """
+    paths × n 표본을 덩어리 단위로 한 번에 뽑아 누적평균 경로를 만듭니다.
+    밴드 안 비율은 모든 n에서 정확히 세고, 경로 자체는 로그 격자에서만 보관합니다.
+    """
+    n = int(n); paths = int(paths)
+    rng = np.random.default_rng(int(seed))
+    grid = log_grid(n, plot_points)
+    denom = np.arange(1, n + 1, dtype=np.float64)
+    xbar_grid = np.empty((paths, grid.shape[0]), dtype=np.float32)
+    inside_count = np.zeros(n, dtype=np.int64)
+    xbar_last = np.empty(paths, dtype=np.float64)
+
+    rows = rows_per_chunk(n)
+    for r0 in range(0, paths, rows):
+        r1 = min(paths, r0 + rows)
+        xbar = np.cumsum(_draw(dist, params, (r1 - r0, n), rng), axis=1, dtype=np.float64)
+        xbar /= denom
+        inside_count += (np.abs(xbar - mu) < eps).sum(axis=0)
+        xbar_grid[r0:r1] = xbar[:, grid - 1]
+        xbar_last[r0:r1] = xbar[:, -1]
+    return LLNResult(grid=grid, xbar=xbar_grid, prop_inside=inside_count / max(1, paths),
+                     xbar_last=xbar_last)
+
+
+# ── 표본분산: (1/n) vs (1/(n−1)) 추정량 ─────────────────────────────────────
+@dataclass(frozen=True)
+class VarianceTrials:
+    trials: int
+    mean_biased: float        # 평균[(1/n)·Σ(Xᵢ−X̄)²]
+    mean_unbiased: float      # 평균[(1/(n−1))·Σ(Xᵢ−X̄)²]
+    grid: np.ndarray          # 누적 평균을 기록한 시행 수(로그 간격)
+    cum_biased: np.ndarray
+    cum_unbiased: np.ndarray
+    edges: np.ndarray         # 히스토그램 구간 경계 (bins+1,)
+    hist_biased: np.ndarray   # 구간별 빈도 (bins,)
+    hist_unbiased: np.ndarray
+
+
+def variance_trials(values, n: int, trials: int, seed: int, bins: int = 60,
+                    plot_points: int = _PLOT_POINTS) -> VarianceTrials:
+    """
+    모집단 values에서 복원추출한 크기 n 표본을 trials번 만들어 두 분산 추정량을 비교합니다.
+    (trials × n) 행렬을 덩어리로 나눠 흘려보내며, 원시 추정값 대신 고정 구간 히스토그램과
+    로그 격자 누적 평균만 쌓으므로 시행 수와 무관하게 메모리가 일정합니다.
+    """
+    vals = np.asarray(values, dtype=np.float64)
+    n = int(n); trials = int(trials)
+    rng = np.random.default_rng(int(seed))
+    # 불편추정량의 최댓값: n/(n−1) · (범위²/4) → 두 추정량 모두 [0, upper]에 들어감
+    spread = float(vals.max() - vals.min()) if vals.size else 0.0
+    upper = max(1e-9, spread * spread / 4.0 * n / (n - 1)) * (1.0 + 1e-9)
+    edges = np.linspace(0.0, upper, int(bins) + 1)
+    hist_b = np.zeros(int(bins), dtype=np.int64)
+    hist_u = np.zeros(int(bins), dtype=np.int64)
+
+    grid = log_grid(trials, plot_points)
+    cum_b = np.empty(grid.shape[0]); cum_u = np.empty(grid.shape[0])
+    total_b = total_u = 0.0
+    g = 0                                             # 아직 채우지 않은 첫 격자 위치
+
+    rows = rows_per_chunk(n)
+    for t0 in range(0, trials, rows):
+        t1 = min(trials, t0 + rows)
+        samples = vals[rng.integers(0, vals.size, size=(t1 - t0, n))]
+        samples -= samples.mean(axis=1, keepdims=True)
+        ss = np.einsum("ij,ij->i", samples, samples)
+        s2_b = ss / n
+        s2_u = ss / (n - 1)
+        hist_b += np.histogram(s2_b, bins=edges)[0]
+        hist_u += np.histogram(s2_u, bins=edges)[0]
+
+        # 이 덩어리에 걸친 격자 지점의 누적 평균
+        g_end = np.searchsorted(grid, t1, side="right")
+        if g_end > g:
+            offs = grid[g:g_end] - t0 - 1
+            cum_b[g:g_end] = (total_b + np.cumsum(s2_b)[offs]) / grid[g:g_end]
+            cum_u[g:g_end] = (total_u + np.cumsum(s2_u)[offs]) / grid[g:g_end]
+            g = g_end
+        total_b += float(s2_b.sum())
+        total_u += float(s2_u.sum())
+
+    return VarianceTrials(
+        trials=trials, mean_biased=total_b / max(1, trials), mean_unbiased=total_u / max(1, trials),
+        grid=grid, cum_biased=cum_b, cum_unbiased=cum_u,
+        edges=edges, hist_biased=hist_b, hist_unbiased=hist_u,
+    )
+
+
+# ── 중첩 표본 크기의 도수: 다항분포로 직접 ────────────────────────────────────
+def nested_multinomial(sizes, probs, seed=None) -> np.ndarray:
+    """
+    크기가 커지는 표본들(예: 10, 100, …, 10⁹)의 결과별 도수 (len(sizes), k).
+    시행을 하나씩 돌리지 않고 직전 크기와의 차이만큼만 다항분포로 뽑아 더하므로,
+    10^k 결과는 10^(k−1) 결과를 그대로 이어받고 전체 비용은 크기 개수에 비례합니다.
+    sizes는 오름차순이어야 합니다.
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    if sizes.ndim != 1 or np.any(np.diff(sizes) < 0) or (sizes.size and sizes[0] < 0):
+        raise ValueError("sizes must be a non-decreasing 1-D sequence of non-negative ints")
+    p = np.asarray(probs, dtype=np.float64)
+    p = p / p.sum()
+    rng = np.random.default_rng(seed)
+    steps = rng.multinomial(np.diff(sizes, prepend=0), p)   # 크기별 증분 도수
+    return np.cumsum(steps, axis=0)
+
+
+# ── 중심극한정리: 표본평균을 분포에서 직접 ──────────────────────────────────
+def sample_means(dist: str, params: Dict[str, float], n: int, m: int, seed=None) -> np.ndarray:
+    """
+    크기 n 표본의 표본평균 m개 (m,) float64. (m × n) 행렬을 만들지 않고 X̄의 정확한
+    분포에서 바로 뽑습니다.
+      - "정규"    : X̄ ~ N(μ, σ²/n)
+      - "지수"    : ΣX ~ Gamma(n, 1/λ) → X̄ ~ Gamma(n, 1/(nλ))
+      - "베르누이": ΣX ~ B(n, p)
+      - "균등"    : 닫힌 형태가 없어(어윈–홀) _CHUNK_BYTES 단위 행렬로 뽑아 평균
+    """
+    n = int(n); m = int(m)
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    if dist == "정규":
+        mu = float(params.get("mu", 0.0)); sigma = max(1e-9, float(params.get("sigma", 1.0)))
+        return rng.normal(mu, sigma / np.sqrt(n), size=m)
+    if dist == "지수":
+        lam = max(1e-9, float(params.get("lambda", 1.0)))
+        return rng.gamma(shape=n, scale=1.0 / (n * lam), size=m)
+    if dist == "베르누이":
+        p = min(1.0, max(0.0, float(params.get("p", 0.5))))
+        return rng.binomial(n, p, size=m) / n
+    if dist == "균등":
+        a = float(params.get("a", 0.0)); b = float(params.get("b", 1.0))
+        out = np.empty(m)
+        rows = rows_per_chunk(n, bytes_per_value=4)
+        for r0 in range(0, m, rows):
+            r1 = min(m, r0 + rows)
+            out[r0:r1] = rng.random((r1 - r0, n), dtype=np.float32).mean(axis=1, dtype=np.float64)
+        out *= (b - a)
+        out += a
+        return out
+    raise ValueError(f"unknown distribution: {dist}")
@@ -0,0 +1,260 @@
+# state_utils.py — 시뮬레이션 활동의 세션 상태 메모리 관리
+"""
+활동이 st.session_state에 넣어 두는 큰 배열(점 좌표, 난수 인덱스 등)은 사용자가 다른
+화면으로 가도 세션이 끝날 때까지 그대로 남습니다. 이 모듈은 활동별로 등록된 키를
+
+    - 화면에 있는 동안: 그대로 둠
+    - 화면을 떠나면(해당 rerun에서 track_state가 호출되지 않으면): zlib 압축 또는
+      임시 memmap 파일로 내보냄(spill)
+    - 세션 예산을 넘으면: 오래 안 본 활동의 상태를 통째로 삭제(evict) → 다시 열면 초기화
+
+합니다. 활동 쪽 사용법:
+
+    from state_utils import track_state
+    track_state("sierpinski_chaos", K_SIG, K_IDX, K_PTS, K_DONE, K_P_LAST)
+
+등록하는 키는 "전부 지워져도 활동이 처음부터 다시 만들 수 있는" 묶음이어야 합니다
+(예: 서명 키를 함께 넣어야 삭제 후 재계산이 일어남).
+
+home.py는 rerun 끝에 end_rerun_state()를 호출하며, 세션별 사용량은 session_footprints()로
+디버그 패널에 표시합니다.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+
+_OWNERS_KEY = "_state_owners"        # {owner: {"keys": [...], "last": ts}}
+_TOUCHED_KEY = "_state_touched"      # 이번 rerun에서 track_state한 owner 집합
+
+_SPILL_MIN_BYTES = 256 << 10         # 이보다 작은 값은 그대로 둠
+_MEMMAP_MIN_BYTES = 4 << 20          # 이보다 큰 배열은 압축 대신 memmap 파일로
+_SESSION_BUDGET_BYTES = 48 << 20     # 세션당 메모리(활성 + 압축) 상한
+_ZLIB_LEVEL = 1                      # 속도 우선
+_FOOTPRINT_TTL_S = 3600              # 갱신 없는 세션 기록 보관 시간
+
+_SPILL_DIR = os.path.join(tempfile.gettempdir(), "mathlab_state")
+
+
+# ── 크기 추정 ─────────────────────────────────────────────────────────────────
+def _sizeof(value: Any) -> int:
+    if isinstance(value, _Spilled):
+        return value.resident_bytes
+    nbytes = getattr(value, "nbytes", None)           # numpy 배열
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    mem = getattr(value, "memory_usage", None)        # pandas DataFrame/Series
+    if callable(mem):
+        try:
+            total = mem(deep=False)
+            return int(getattr(total, "sum", lambda: total)())
+        except Exception:
+            pass
+    if isinstance(value, (list, tuple, set, dict)):
+        return sys.getsizeof(value) + 8 * len(value)
+    return sys.getsizeof(value)
+
+
+# ── 내보낸 값 ─────────────────────────────────────────────────────────────────
+class _Spilled:
+    """압축 바이트 또는 memmap 파일로 내보낸 numpy 배열."""
+
+    __slots__ = ("shape", "dtype", "blob", "path", "_finalizer", "__weakref__")
+
+    def __init__(self, arr):
+        import numpy as np
+        arr = np.ascontiguousarray(arr)
+        self.shape = arr.shape
+        self.dtype = arr.dtype
+        self.blob: Optional[bytes] = None
+        self.path: Optional[str] = None
+        self._finalizer = None
+        if arr.nbytes >= _MEMMAP_MIN_BYTES:
+            try:
+                os.makedirs(_SPILL_DIR, exist_ok=True)
+                path = os.path.join(_SPILL_DIR, f"{uuid.uuid4().hex}.npy")
+                mm = np.lib.format.open_memmap(path, mode="w+", dtype=arr.dtype, shape=arr.shape)
+                mm[...] = arr
+                mm.flush()
+                del mm
+                self.path = path
+                # 세션이 끝나 session_state가 버려지면 파일도 지움
+                self._finalizer = weakref.finalize(self, _remove_quietly, path)
+                return
+            except Exception:
+                self.path = None
+        self.blob = zlib.compress(arr.tobytes(), _ZLIB_LEVEL)
+
+    @property
+    def resident_bytes(self) -> int:
+        return len(self.blob) if self.blob is not None else 0
+
+    def load(self):
+        import numpy as np
+        if self.path is not None:
+            arr = np.array(np.load(self.path, mmap_mode="r"))
+            if self._finalizer is not None:
+                self._finalizer()
+            return arr
+        return np.frombuffer(zlib.decompress(self.blob), dtype=self.dtype).reshape(self.shape).copy()
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _spillable(value: Any) -> bool:
+    return (
+        type(value).__module__ == "numpy"
+        and hasattr(value, "dtype") and getattr(value, "dtype").hasobject is False
+        and getattr(value, "nbytes", 0) >= _SPILL_MIN_BYTES
+    )
+
+
+# ── 세션별 기록(디버그 패널용) ──────────────────────────────────────────────
+_footprints: Dict[str, Dict[str, Any]] = {}
+_footprints_lock = threading.Lock()
+
+
+def _session_id() -> str:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx is not None else "-"
+    except Exception:
+        return "-"
+
+
+# ── 공개 API ──────────────────────────────────────────────────────────────────
+def track_state(owner: str, *keys: str) -> None:
+    """
+    owner(활동 이름)가 쓰는 세션 키를 등록하고, 내보냈던 값이 있으면 되살립니다.
+    활동 render()에서 해당 키를 읽기 전에 호출합니다.
+    """
+    owners = st.session_state.setdefault(_OWNERS_KEY, {})
+    entry = owners.setdefault(owner, {"keys": [], "last": 0.0})
+    for k in keys:
+        if k not in entry["keys"]:
+            entry["keys"].append(k)
+    entry["last"] = time.time()
+    st.session_state.setdefault(_TOUCHED_KEY, set()).add(owner)
+
+    for k in entry["keys"]:
+        value = st.session_state.get(k)
+        if isinstance(value, _Spilled):
+            st.session_state[k] = value.load()
+
+
+def end_rerun_state() -> None:
+    """rerun 끝: 이번에 화면에 없던 활동의 큰 값을 내보내고, 예산 초과 시 오래된 활동을 비웁니다."""
+    try:
+        owners = st.session_state.get(_OWNERS_KEY)
+        touched = st.session_state.pop(_TOUCHED_KEY, set())
+    except Exception:
+        return
+    if owners:
+        for owner, entry in owners.items():
+            if owner in touched:
+                continue
+            for k in entry["keys"]:
+                value = st.session_state.get(k)
+                if _spillable(value):
+                    try:
+                        st.session_state[k] = _Spilled(value)
+                    except Exception:
+                        pass
+        _enforce_budget(owners, touched)
+    _record_footprint()
+
+
+def _enforce_budget(owners: Dict[str, Dict[str, Any]], touched: set) -> None:
+    def owner_bytes(entry):
+        return sum(_sizeof(st.session_state[k]) for k in entry["keys"] if k in st.session_state)
+
+    total = sum(owner_bytes(e) for e in owners.values())
+    if total <= _SESSION_BUDGET_BYTES:
+        return
+    # 화면에 없는 활동부터, 오래 안 본 순서로 삭제
+    for owner, entry in sorted(owners.items(), key=lambda kv: kv[1]["last"]):
+        if owner in touched:
+            continue
+        freed = owner_bytes(entry)
+        for k in entry["keys"]:
+            st.session_state.pop(k, None)
+        total -= freed
+        if total <= _SESSION_BUDGET_BYTES:
+            break
+
+
+def session_state_usage() -> List[Dict[str, Any]]:
+    """현재 세션의 키별 사용량(바이트 내림차순). owner는 등록된 활동 이름, 없으면 '-'."""
+    owners = st.session_state.get(_OWNERS_KEY) or {}
+    key_owner = {k: o for o, e in owners.items() for k in e["keys"]}
+    rows = []
+    for k in list(st.session_state.keys()):
+        if k in (_OWNERS_KEY, _TOUCHED_KEY):
+            continue
+        try:
+            v = st.session_state[k]
+        except Exception:
+            continue
+        spilled = isinstance(v, _Spilled)
+        rows.append({
+            "key": str(k),
+            "owner": key_owner.get(k, "-"),
+            "kb": round(_sizeof(v) / 1024.0, 1),
+            "state": ("memmap" if v.path else "zlib") if spilled else "live",
+        })
+    rows.sort(key=lambda r: r["kb"], reverse=True)
+    return rows
+
+
+def _record_footprint() -> None:
+    try:
+        rows = session_state_usage()
+    except Exception:
+        return
+    by_owner: Dict[str, float] = {}
+    for r in rows:
+        by_owner[r["owner"]] = by_owner.get(r["owner"], 0.0) + r["kb"]
+    now = time.time()
+    with _footprints_lock:
+        _footprints[_session_id()] = {
+            "kb": round(sum(by_owner.values()), 1),
+            "owners": by_owner,
+            "user": st.session_state.get("_user_id", ""),
+            "ts": now,
+        }
+        for sid in [s for s, f in _footprints.items() if now - f["ts"] > _FOOTPRINT_TTL_S]:
+            _footprints.pop(sid, None)
+
+
+def session_footprints() -> List[Dict[str, Any]]:
+    """프로세스 안 세션별 최근 사용량(KB 내림차순)과 가장 큰 활동."""
+    with _footprints_lock:
+        snapshot = dict(_footprints)
+    rows = []
+    for sid, f in snapshot.items():
+        top = max(f["owners"].items(), key=lambda kv: kv[1], default=("-", 0.0))
+        rows.append({
+            "session": sid[:8],
+            "user": f["user"],
+            "kb": f["kb"],
+            "top_owner": top[0],
+            "top_kb": round(top[1], 1),
+            "age_s": int(time.time() - f["ts"]),
+        })
+    rows.sort(key=lambda r: r["kb"], reverse=True)
+    return rows
@@ -0,0 +1,35 @@
+# static_utils.py — Streamlit 정적 파일 서빙(app/static/) 사용 가능 여부
+"""
+static/ 아래에 파일을 써서 app/static/... 주소로 내려보내는 모듈들(theme_utils의 CSS,
+vendor_utils의 라이브러리 번들, component_utils의 컴포넌트 페이지, galton_utils의 재생 데이터)이
+같은 판단을 공유합니다. 거짓이면 각 모듈은 인라인 삽입·CDN으로 폴백합니다.
+
+    from static_utils import static_serving_enabled
+    if static_serving_enabled():
+        ...
+"""
+from functools import lru_cache
+
+import streamlit as st
+
+# Streamlit 1.57 미만(tornado 서버)은 이미지·글꼴 등 일부 확장자가 아닌 정적 파일을
+# text/plain + nosniff로 보내 브라우저가 .css/.js를 버립니다. 그보다 낮으면 정적 경로를 쓰지 않음.
+_STATIC_MIME_MIN_VERSION = (1, 57)
+
+
+@lru_cache(maxsize=None)
+def _static_mime_ok() -> bool:
+    try:
+        major, minor = (int(x) for x in st.__version__.split(".")[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= _STATIC_MIME_MIN_VERSION
+
+
+def static_serving_enabled() -> bool:
+    """app/static/ 아래 .css/.js를 올바른 MIME 타입으로 내려줄 수 있으면 True."""
+    try:
+        enabled = bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+    return enabled and _static_mime_ok()
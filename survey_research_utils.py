@@ -3,6 +3,9 @@
 Google Sheets 탭: pre_survey / post_survey / survey_config
 """
 from __future__ import annotations
+import threading
+import time
+import pandas as pd
 import streamlit as st
 from datetime import datetime, timezone, timedelta
 
@@ -67,48 +70,245 @@ def _get_or_create_ws(sh, name: str, header: list):
         ws.append_row(header)
         return ws
 
-# ── 설정 (활성화 토글) ────────────────────────────────────────────────────────
+# ── 설문 데이터 저장소 (프로세스 공용) ──────────────────────────────────────
+# 워크시트 핸들·설정·제출자 색인·응답 프레임을 앱 수명 동안 한 곳에 보관합니다.
+#  - get_config     : 메모리 값 반환(_CONFIG_TTL마다 시트와 동기화)
+#  - set_config     : 셀 1개만 쓰고 메모리 값 즉시 갱신(write-through, 재조회 없음)
+#  - has_submitted  : 학번 집합 조회(_INDEX_TTL마다 학번 열 1개만 다시 읽음)
+#  - submit_survey  : 시트에 기록된 뒤에만 반환(그룹 커밋). 한 요청이 기록 중일 때 도착한
+#                     제출들은 대기했다가 다음 append_rows 1회로 함께 기록
+#  - get_responses  : 관리자 분석용 DataFrame — 이전 로딩 이후 추가된 행만 읽어 이어 붙임
+_CONFIG_TTL     = 300   # 설정 재동기화 주기(초)
+_INDEX_TTL      = 120   # 제출자 색인 재동기화 주기(초)
+_SUBMIT_TIMEOUT = 30.0  # 제출 1건이 기록을 기다리는 최대 시간(초)
+
+
+def _header_for(sheet_name: str) -> list:
+    return PRE_HEADER if sheet_name == SHEET_PRE else POST_HEADER
+
+
+def _uid(user_id) -> str:
+    return str(user_id).strip()
+
+
+class _PendingRow:
+    """기록을 기다리는 제출 1행. 기록한 쪽이 error를 채우고 done을 올립니다."""
+    __slots__ = ("sheet", "row", "done", "error")
+
+    def __init__(self, sheet: str, row: list):
+        self.sheet = sheet
+        self.row = row
+        self.done = threading.Event()
+        self.error: Exception | None = None
+
+
+class _SurveyStore:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._ws: dict[str, object] = {}
+        # 설정: key → (값, 시트 행 번호)
+        self.config: dict[str, bool] = {}
+        self.config_rows: dict[str, int] = {}
+        self.config_n_rows = 0
+        self.config_loaded_at = 0.0
+        # 제출자 색인: 시트 → 학번 집합
+        self.submitted: dict[str, set[str]] = {}
+        self.index_loaded_at: dict[str, float] = {}
+        # 응답 프레임: 시트 → DataFrame / 반영된 시트 행 수(헤더 제외)
+        self.frames: dict[str, pd.DataFrame] = {}
+        self.frame_rows: dict[str, int] = {}
+        # 기록 대기열(도착 순) / 시트 쓰기는 한 번에 한 요청만
+        self.pending: list[_PendingRow] = []
+        self._write_lock = threading.Lock()
+
+    # ── 워크시트 ──────────────────────────────────────────────────────────
+    def ws(self, name: str, header: list):
+        with self.lock:
+            ws = self._ws.get(name)
+            if ws is None:
+                sh = _get_spreadsheet()
+                if sh is None:
+                    return None
+                ws = _get_or_create_ws(sh, name, header)
+                self._ws[name] = ws
+            return ws
+
+    # ── 설정 ──────────────────────────────────────────────────────────────
+    def load_config(self) -> None:
+        ws = self.ws(SHEET_CONFIG, CONFIG_HEADER)
+        if ws is None:
+            raise RuntimeError("설문 스프레드시트에 연결할 수 없습니다.")
+        values = ws.get_all_values()
+        config: dict[str, bool] = {}
+        rows: dict[str, int] = {}
+        for i, row in enumerate(values[1:], start=2):
+            if not row or not str(row[0]).strip():
+                continue
+            key = str(row[0]).strip()
+            config[key] = (str(row[1]).strip().upper() == "TRUE") if len(row) > 1 else False
+            rows.setdefault(key, i)
+        with self.lock:
+            self.config, self.config_rows = config, rows
+            self.config_n_rows = len(values)
+            self.config_loaded_at = time.monotonic()
+
+    def get_config(self, key: str) -> bool:
+        if time.monotonic() - self.config_loaded_at >= _CONFIG_TTL:
+            try:
+                self.load_config()
+            except Exception:
+                # API 실패 시 마지막 성공 값 유지 (버튼이 사라지는 현상 방지), 30초 뒤 재시도
+                self.config_loaded_at = time.monotonic() - _CONFIG_TTL + 30
+        return self.config.get(key, False)
+
+    def set_config(self, key: str, value: bool) -> None:
+        if not self.config_loaded_at:
+            self.load_config()
+        ws = self.ws(SHEET_CONFIG, CONFIG_HEADER)
+        if ws is None:
+            raise RuntimeError("설문 스프레드시트에 연결할 수 없습니다.")
+        val_str = "TRUE" if value else "FALSE"
+        with self.lock:
+            row = self.config_rows.get(key)
+            if row is not None:
+                ws.update_cell(row, 2, val_str)
+            else:
+                ws.append_row([key, val_str])
+                self.config_n_rows = max(self.config_n_rows, 1) + 1
+                self.config_rows[key] = self.config_n_rows
+            self.config[key] = value
+
+    # ── 제출자 색인 ───────────────────────────────────────────────────────
+    def load_index(self, sheet_name: str) -> None:
+        ws = self.ws(sheet_name, _header_for(sheet_name))
+        if ws is None:
+            raise RuntimeError("설문 스프레드시트에 연결할 수 없습니다.")
+        ids = {_uid(v) for v in ws.col_values(2)[1:] if _uid(v)}
+        with self.lock:
+            # 제출은 취소되지 않으므로 합집합(읽는 사이 기록된 학번을 잃지 않도록)
+            self.submitted.setdefault(sheet_name, set()).update(ids)
+            self.index_loaded_at[sheet_name] = time.monotonic()
 
-# API 실패 시 마지막 성공 값을 유지하는 fallback 저장소
-_config_fallback: dict[str, bool] = {}
+    def has_submitted(self, sheet_name: str, user_id: str) -> bool:
+        uid = _uid(user_id)
+        known = self.submitted.get(sheet_name)
+        if known is not None and uid in known:
+            return True     # 제출은 취소되지 않으므로 재확인 불필요
+        if time.monotonic() - self.index_loaded_at.get(sheet_name, 0.0) >= _INDEX_TTL:
+            try:
+                self.load_index(sheet_name)
+            except Exception:
+                self.index_loaded_at[sheet_name] = time.monotonic() - _INDEX_TTL + 30
+        return uid in self.submitted.get(sheet_name, set())
 
+    # ── 제출 (그룹 커밋) ──────────────────────────────────────────────────
+    def submit(self, sheet_name: str, row: list) -> None:
+        """row를 시트에 기록하고 반환. 실패·시간 초과면 예외(행은 기록되지 않음)."""
+        item = _PendingRow(sheet_name, row)
+        with self.lock:
+            self.pending.append(item)
+        if self._write_lock.acquire(timeout=_SUBMIT_TIMEOUT):
+            try:
+                # 앞 요청이 이 행까지 함께 기록했으면 바로 끝
+                if not item.done.is_set():
+                    self._write_pending()
+            finally:
+                self._write_lock.release()
+        else:
+            with self.lock:
+                if item in self.pending:        # 아직 아무도 가져가지 않음 → 취소
+                    self.pending.remove(item)
+                    raise TimeoutError("시트 기록 대기 시간이 초과되었습니다.")
+            # 다른 요청이 이 행을 기록하는 중
+            if not item.done.wait(_SUBMIT_TIMEOUT):
+                raise TimeoutError("시트 기록 결과를 확인하지 못했습니다.")
+        if item.error is not None:
+            raise item.error
+
+    def _write_pending(self) -> None:
+        """대기열 전체를 시트별 append_rows 1회로 기록하고 각 행에 결과를 알림."""
+        with self.lock:
+            batch, self.pending = self.pending, []
+        by_sheet: dict[str, list[_PendingRow]] = {}
+        for item in batch:
+            by_sheet.setdefault(item.sheet, []).append(item)
+        for sheet_name, items in by_sheet.items():
+            try:
+                ws = self.ws(sheet_name, _header_for(sheet_name))
+                if ws is None:
+                    raise RuntimeError("설문 스프레드시트에 연결할 수 없습니다.")
+                ws.append_rows([it.row for it in items], value_input_option="RAW")
+            except Exception as e:
+                for it in items:
+                    it.error = e
+            else:
+                with self.lock:
+                    self.submitted.setdefault(sheet_name, set()).update(
+                        _uid(it.row[1]) for it in items
+                    )
+            for it in items:
+                it.done.set()
+
+    # ── 관리자 분석용 응답 프레임 ─────────────────────────────────────────
+    def get_responses(self, sheet_name: str, reload: bool = False) -> pd.DataFrame:
+        header = _header_for(sheet_name)
+        ws = self.ws(sheet_name, header)
+        if ws is None:
+            return self.frames.get(sheet_name, pd.DataFrame(columns=header))
+        with self.lock:
+            if reload or sheet_name not in self.frames:
+                values = ws.get_all_values()
+                cols = values[0] if values and any(values[0]) else header
+                body = values[1:]
+                self.frames[sheet_name] = self._to_frame([r for r in body if any(r)], cols)
+                self.frame_rows[sheet_name] = len(body)
+            else:
+                # 응답 시트는 행 추가만 일어나므로 마지막으로 읽은 행 다음부터만 읽음
+                df = self.frames[sheet_name]
+                start = self.frame_rows[sheet_name] + 2
+                fetched = ws.get(f"A{start}:{_col_letter(len(df.columns))}")
+                new = [r for r in fetched if any(r)]
+                if new:
+                    self.frames[sheet_name] = pd.concat(
+                        [df, self._to_frame(new, list(df.columns))], ignore_index=True
+                    )
+                self.frame_rows[sheet_name] += len(fetched)
+            df = self.frames[sheet_name]
+            if "학번" in df.columns:
+                self.submitted.setdefault(sheet_name, set()).update(
+                    _uid(v) for v in df["학번"] if _uid(v)
+                )
+            return df
+
+    @staticmethod
+    def _to_frame(rows: list[list], cols: list) -> pd.DataFrame:
+        n = len(cols)
+        return pd.DataFrame([(list(r) + [""] * n)[:n] for r in rows], columns=cols)
+
+
+def _col_letter(n: int) -> str:
+    s = ""
+    while n > 0:
+        n, r = divmod(n - 1, 26)
+        s = chr(65 + r) + s
+    return s or "A"
+
+
+@st.cache_resource(show_spinner=False)
+def _get_store() -> _SurveyStore:
+    return _SurveyStore()
+
+# ── 설정 (활성화 토글) ────────────────────────────────────────────────────────
 
-@st.cache_data(ttl=300, show_spinner=False)
 def get_config(key: str) -> bool:
-    """survey_config 탭에서 key 값을 읽어 True/False 반환. 5분 캐시."""
-    try:
-        sh = _get_spreadsheet()
-        if sh is None:
-            return _config_fallback.get(key, False)
-        ws = _get_or_create_ws(sh, SHEET_CONFIG, CONFIG_HEADER)
-        for row in ws.get_all_records(numericise_ignore=["all"]):
-            if str(row.get("key", "")).strip() == key:
-                result = str(row.get("value", "FALSE")).strip().upper() == "TRUE"
-                _config_fallback[key] = result   # 성공 시 fallback 갱신
-                return result
-        _config_fallback.setdefault(key, False)
-        return _config_fallback[key]
-    except Exception:
-        # API 실패 시 마지막 성공 값 반환 (버튼이 사라지는 현상 방지)
-        return _config_fallback.get(key, False)
+    """survey_config 탭의 key 값을 True/False로 반환. 메모리 값 사용(5분마다 동기화)."""
+    return _get_store().get_config(key)
 
 
 def set_config(key: str, value: bool) -> bool:
-    """survey_config 탭에 key=value 저장. 성공 True."""
+    """survey_config 탭에 key=value 저장(메모리 값도 즉시 반영). 성공 True."""
     try:
-        sh = _get_spreadsheet()
-        if sh is None:
-            return False
-        ws = _get_or_create_ws(sh, SHEET_CONFIG, CONFIG_HEADER)
-        val_str = "TRUE" if value else "FALSE"
-        all_vals = ws.get_all_values()
-        for i, row in enumerate(all_vals):
-            if row and str(row[0]).strip() == key:
-                ws.update_cell(i + 1, 2, val_str)
-                get_config.clear()  # 캐시 무효화
-                return True
-        ws.append_row([key, val_str])
-        get_config.clear()  # 캐시 무효화
+        _get_store().set_config(key, value)
         return True
     except Exception as e:
         st.error(f"설정 저장 실패: {e}")
@@ -117,31 +317,20 @@ def set_config(key: str, value: bool) -> bool:
 # ── 제출 확인 / 저장 ──────────────────────────────────────────────────────────
 
 def has_submitted(sheet_name: str, user_id: str) -> bool:
-    """해당 학번이 이미 제출했는지 확인."""
+    """해당 학번이 이미 제출했는지 확인(메모리 색인 조회)."""
     try:
-        sh = _get_spreadsheet()
-        if sh is None:
-            return False
-        header = PRE_HEADER if sheet_name == SHEET_PRE else POST_HEADER
-        ws = _get_or_create_ws(sh, sheet_name, header)
-        for row in ws.get_all_records(numericise_ignore=["all"]):
-            if str(row.get("학번", "")).strip() == str(user_id).strip():
-                return True
-        return False
+        return _get_store().has_submitted(sheet_name, user_id)
     except Exception:
         return False
 
 
 def submit_survey(sheet_name: str, user_id: str, answers: dict) -> bool:
-    """설문 응답 1행 추가. 성공 True."""
+    """설문 응답 1행을 시트에 기록. 기록이 끝난 뒤에만 True.
+    동시에 들어온 제출은 append_rows 1회로 묶어 기록됩니다."""
     try:
-        sh = _get_spreadsheet()
-        if sh is None:
-            return False
-        header = PRE_HEADER if sheet_name == SHEET_PRE else POST_HEADER
-        ws = _get_or_create_ws(sh, sheet_name, header)
+        header = _header_for(sheet_name)
 
-        uid = str(user_id).strip()
+        uid = _uid(user_id)
         grade    = uid[4]     if len(uid) >= 5 else "?"
         class_no = uid[5:7]   if len(uid) >= 7 else "?"
         now_str  = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
@@ -150,12 +339,18 @@ def submit_survey(sheet_name: str, user_id: str, answers: dict) -> bool:
         for col in header[4:]:
             row.append(answers.get(col, ""))
 
-        ws.append_row(row)
+        _get_store().submit(sheet_name, row)
         return True
     except Exception as e:
         st.error(f"제출 실패: {e}")
         return False
 
+
+def get_responses(sheet_name: str, reload: bool = False) -> pd.DataFrame:
+    """관리자 분석용 응답 DataFrame(공유 객체이므로 수정하지 말 것).
+    reload=True면 시트 전체를 다시 읽고, 아니면 새로 추가된 행만 읽어 이어 붙입니다."""
+    return _get_store().get_responses(sheet_name, reload=reload)
+
 # ── 세션 헬퍼 ─────────────────────────────────────────────────────────────────
 
 def current_user() -> dict:
@@ -1,9 +1,11 @@
 # survey_utils.py
 from __future__ import annotations
-import re, time, urllib.parse
+import hashlib, io, re, threading, time, urllib.parse
 from collections import Counter
-from typing import Iterable, List, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import pandas as pd
+import requests
 
 # ── (A) 구글 시트/퍼블리시 URL ⇒ CSV export URL로 자동 변환 ─────────────────
 def make_csv_export_url(url: str) -> str:
@@ -50,28 +52,283 @@ def load_csv_live(csv_or_sheet_url: str, cache_bust: int = 0) -> pd.DataFrame:
     df = df.dropna(axis=1, how="all")
     return df
 
+# ── (B-2) 공유 피드: 모든 접속자가 프로세스 내 사본 1개를 함께 사용 ─────────
+# 교실 프로젝터 + 학생 태블릿 30대가 같은 시트를 폴링해도 원격 요청은
+# URL당 타이머 1개 주기로만 발생합니다.
+#  - ETag/Last-Modified 조건부 요청(304면 재파싱 없음)
+#  - 본문 해시가 같으면 재파싱 없음
+#  - 이전 본문 뒤에 행만 추가된 경우 추가된 행만 파싱해 이어 붙임
+_MIN_FETCH_INTERVAL = 2.0   # 접속자별 주기가 아무리 짧아도 원격 요청은 최소 이 간격(초)
+_FETCH_TIMEOUT      = 15    # 원격 요청 타임아웃(초)
+_MAX_SHARED_FEEDS   = 32    # 동시에 유지할 URL 수 상한(초과 시 가장 오래된 것부터 제거)
+
+
+@dataclass
+class _SharedCsvFeed:
+    url: str
+    body: bytes = b""
+    digest: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    raw_df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    df: pd.DataFrame = field(default_factory=pd.DataFrame)   # 빈 열 제거본(접속자 공용, 수정 금지)
+    fetched_at: float = 0.0     # 마지막 원격 확인 시각(304 포함)
+    changed_at: float = 0.0     # 마지막으로 내용이 바뀐 시각
+    last_status: str = ""       # "full" | "appended" | "not-modified" | "unchanged"
+    fetch_count: int = 0
+    parse_count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+_feeds: Dict[str, _SharedCsvFeed] = {}
+_feeds_lock = threading.Lock()
+
+
+def _get_feed(csv_url: str) -> _SharedCsvFeed:
+    with _feeds_lock:
+        feed = _feeds.get(csv_url)
+        if feed is None:
+            if len(_feeds) >= _MAX_SHARED_FEEDS:
+                oldest = min(_feeds.values(), key=lambda f: f.fetched_at)
+                _feeds.pop(oldest.url, None)
+            feed = _SharedCsvFeed(url=csv_url)
+            _feeds[csv_url] = feed
+        return feed
+
+
+def _parse_appended_rows(feed: _SharedCsvFeed, body: bytes) -> Optional[pd.DataFrame]:
+    """새 본문이 이전 본문 + 추가 행이면 추가 행만 파싱해 합친 DataFrame을 반환.
+    이어 붙일 수 없는 변경(수정·삭제·열 변경)이면 None."""
+    old = feed.body
+    if not old or not feed.digest or len(body) <= len(old) or not body.startswith(old):
+        return None
+    tail = body[len(old):]
+    # 이전 본문이 행 경계에서 끝났는지 확인(마지막 행이 수정 중인 경우 배제)
+    if not (old.endswith(b"\n") or tail.startswith((b"\r\n", b"\n"))):
+        return None
+    tail = tail.lstrip(b"\r\n")
+    if not tail.strip():
+        return None
+    try:
+        added = pd.read_csv(io.BytesIO(tail), header=None)
+    except Exception:
+        return None
+    if added.shape[1] != feed.raw_df.shape[1]:
+        return None
+    added.columns = feed.raw_df.columns
+    return pd.concat([feed.raw_df, added], ignore_index=True)
+
+
+def _refresh_feed(feed: _SharedCsvFeed) -> None:
+    headers = {}
+    if feed.etag:
+        headers["If-None-Match"] = feed.etag
+    if feed.last_modified:
+        headers["If-Modified-Since"] = feed.last_modified
+    resp = requests.get(feed.url, headers=headers, timeout=_FETCH_TIMEOUT)
+    now = time.time()
+    feed.fetch_count += 1
+    # 사본 보유 여부는 본문 해시로 판단(머리글만 있는 시트는 raw_df가 비어 있어도 사본이 있음)
+    if resp.status_code == 304 and feed.digest:
+        feed.fetched_at = now
+        feed.last_status = "not-modified"
+        return
+    resp.raise_for_status()
+    body = resp.content
+    digest = hashlib.sha1(body).hexdigest()
+    feed.etag = resp.headers.get("ETag", "")
+    feed.last_modified = resp.headers.get("Last-Modified", "")
+    if digest == feed.digest:
+        feed.fetched_at = now
+        feed.last_status = "unchanged"
+        return
+
+    df = _parse_appended_rows(feed, body)
+    status = "appended"
+    if df is None:
+        df = pd.read_csv(io.BytesIO(body)) if body.strip() else pd.DataFrame()
+        status = "full"
+    feed.parse_count += 1
+    feed.body, feed.digest, feed.raw_df = body, digest, df
+    feed.df = df.dropna(axis=1, how="all")
+    feed.fetched_at = feed.changed_at = now
+    feed.last_status = status
+
+
+def load_csv_shared(csv_or_sheet_url: str, max_age: Optional[float] = None,
+                    force: bool = False) -> Tuple[pd.DataFrame, dict]:
+    """공유 사본에서 CSV를 읽어 (DataFrame, 메타정보)를 반환.
+    반환된 DataFrame은 모든 접속자가 공유하므로 수정하지 말고 필요하면 copy() 하세요.
+
+    max_age : 사본이 이 시간(초)보다 오래됐으면 원격 확인. None이면 최초 1회만 받음.
+    force   : 주기와 무관하게 즉시 원격 확인(조건부 요청이므로 변경 없으면 재파싱 없음).
+    다른 접속자가 이미 받아오는 중이면 기다리지 않고 현재 사본을 바로 돌려줍니다.
+    """
+    if not csv_or_sheet_url:
+        return pd.DataFrame(), {}
+    feed = _get_feed(make_csv_export_url(csv_or_sheet_url))
+
+    age = time.time() - feed.fetched_at
+    stale = feed.fetched_at == 0.0 or force or (
+        max_age is not None and age >= max(float(max_age), _MIN_FETCH_INTERVAL)
+    )
+    if stale:
+        # 최초 로딩은 반드시 기다리고, 이후에는 한 명만 갱신(나머지는 기존 사본 사용)
+        if feed.lock.acquire(blocking=not feed.digest):
+            try:
+                # 대기하는 동안 다른 접속자가 이미 갱신했으면 다시 받지 않음
+                if feed.fetched_at == 0.0 or time.time() - feed.fetched_at >= _MIN_FETCH_INTERVAL:
+                    _refresh_feed(feed)
+            finally:
+                feed.lock.release()
+
+    meta = {
+        "url":         feed.url,
+        "fetched_at":  feed.fetched_at,
+        "changed_at":  feed.changed_at,
+        "status":      feed.last_status,
+        "fetch_count": feed.fetch_count,
+        "parse_count": feed.parse_count,
+    }
+    return feed.df, meta
+
 # ── (C) 이하 기존 유틸 ──────────────────────────────────────────────────────
+_MCQ_SPLIT_RE = re.compile(r"[;,]\s*")
+_URL_RE       = re.compile(r"http[s]?://\S+")
+_NON_WORD_RE  = re.compile(r"[^\w\sㄱ-힣]")
+
+
+def _split_mcq(v: str) -> List[str]:
+    return [p for p in _MCQ_SPLIT_RE.split(v.strip()) if p]
+
+
+def _tokenize_one(t: str) -> List[str]:
+    t = _URL_RE.sub(" ", str(t))
+    t = _NON_WORD_RE.sub(" ", t)
+    return [tok for tok in t.split() if len(tok) >= 2]
+
+
 def parse_mcq_series(s: pd.Series) -> Counter:
     cnt = Counter()
     for v in s.dropna().astype(str):
-        parts = re.split(r"[;,]\s*", v.strip())
-        for p in parts:
-            if p:
-                cnt[p] += 1
+        cnt.update(_split_mcq(v))
     return cnt
 
 def basic_tokenize_korean(texts: Iterable[str]) -> List[str]:
     tokens: List[str] = []
     for t in texts:
-        t = str(t)
-        t = re.sub(r"http[s]?://\S+", " ", t)
-        t = re.sub(r"[^\w\sㄱ-힣]", " ", t)
-        for tok in t.split():
-            if len(tok) >= 2:
-                tokens.append(tok)
+        tokens.extend(_tokenize_one(t))
     return tokens
 
 def top_n_tokens(tokens: List[str], n: int = 50, stopwords: Iterable[str] =()) -> List[Tuple[str,int]]:
     sw = set(x.strip() for x in stopwords if x)
     c = Counter(tok for tok in tokens if tok not in sw)
     return c.most_common(n)
+
+# ── (D) 증분 집계: 새로 들어온(또는 바뀐) 응답 행만 토큰화·집계 ─────────────
+# 행 번호별로 원문과 기여분(Counter)을 기억해 두고, 원문이 같은 행은 건너뜁니다.
+# 불용어는 집계 시점이 아니라 조회 시점에 걸러내므로 불용어를 바꿔도 재스캔이 없습니다.
+_MAX_ROW_COUNTERS = 64
+
+
+class RowCounter:
+    """응답 열 하나에 대한 누적 빈도 집계기(행 단위 증분 갱신)."""
+
+    def __init__(self, split: Callable[[str], List[str]]):
+        self._split = split
+        self._rows: List[Optional[str]] = []
+        self._row_counts: List[Counter] = []
+        self.total: Counter = Counter()
+        self.n_tokens = 0
+        self.version = 0            # 집계가 바뀔 때마다 +1
+        self.lock = threading.Lock()
+
+    def update(self, values: pd.Series) -> int:
+        """열 값으로 집계를 갱신하고, 다시 처리한 행 수를 반환."""
+        vals = [None if pd.isna(v) else str(v) for v in values.tolist()]
+        with self.lock:
+            processed = 0
+            # 줄어든 행(삭제) 기여분 제거
+            while len(self._rows) > len(vals):
+                self._rows.pop()
+                self._sub(self._row_counts.pop())
+                processed += 1
+            for i, v in enumerate(vals):
+                if i < len(self._rows):
+                    if self._rows[i] == v:
+                        continue
+                    self._sub(self._row_counts[i])
+                c = Counter(self._split(v)) if v is not None else Counter()
+                if i < len(self._rows):
+                    self._rows[i], self._row_counts[i] = v, c
+                else:
+                    self._rows.append(v)
+                    self._row_counts.append(c)
+                self.total.update(c)
+                self.n_tokens += sum(c.values())
+                processed += 1
+            if processed:
+                self.version += 1
+            return processed
+
+    def _sub(self, c: Counter) -> None:
+        self.total.subtract(c)
+        self.n_tokens -= sum(c.values())
+        for k in c:
+            if self.total[k] <= 0:
+                del self.total[k]
+
+    def top(self, n: int = 50, stopwords: Iterable[str] = ()) -> List[Tuple[str, int]]:
+        """불용어를 뺀 상위 n개. 불용어 수만큼만 더 뽑아 거르므로 전체 재집계가 없습니다."""
+        sw = set(x.strip() for x in stopwords if x)
+        with self.lock:
+            cand = self.total.most_common(n + len(sw))
+        return [(k, v) for k, v in cand if k not in sw][:n]
+
+    def counts(self) -> Counter:
+        with self.lock:
+            return Counter(self.total)
+
+
+_row_counters: Dict[Tuple[str, str, str], RowCounter] = {}
+_row_counters_lock = threading.Lock()
+
+
+def get_row_counter(source: str, column: str, kind: str = "text") -> RowCounter:
+    """(데이터 출처, 열, 종류)별 공유 집계기. kind: "text"(자유응답) | "mcq"(객관식)."""
+    key = (source, column, kind)
+    with _row_counters_lock:
+        rc = _row_counters.get(key)
+        if rc is None:
+            if len(_row_counters) >= _MAX_ROW_COUNTERS:
+                _row_counters.pop(next(iter(_row_counters)))
+            rc = RowCounter(_tokenize_one if kind == "text" else _split_mcq)
+            _row_counters[key] = rc
+        return rc
+
+
+# 워드클라우드 이미지 캐시: 빈도 분포가 '의미 있게' 바뀌었을 때만 다시 그림
+_WC_CHANGE_THRESHOLD = 0.05   # 정규화 빈도 L1 거리 5% 미만이면 기존 이미지 재사용
+_MAX_WC_IMAGES       = 32
+
+_wc_cache: Dict[tuple, Tuple[Dict[str, int], bytes]] = {}
+_wc_cache_lock = threading.Lock()
+
+
+def _freq_distance(a: Dict[str, int], b: Dict[str, int]) -> float:
+    sa, sb = sum(a.values()) or 1, sum(b.values()) or 1
+    return 0.5 * sum(abs(a.get(k, 0) / sa - b.get(k, 0) / sb) for k in set(a) | set(b))
+
+
+def cached_wordcloud(key: tuple, freqs: Dict[str, int], render: Callable[[Dict[str, int]], bytes]) -> bytes:
+    """key(열·설정)별로 렌더링된 PNG를 재사용. 분포 변화가 임계값 이상일 때만 render(freqs) 호출."""
+    with _wc_cache_lock:
+        hit = _wc_cache.get(key)
+    if hit is not None and _freq_distance(hit[0], freqs) < _WC_CHANGE_THRESHOLD:
+        return hit[1]
+    png = render(freqs)
+    with _wc_cache_lock:
+        if key not in _wc_cache and len(_wc_cache) >= _MAX_WC_IMAGES:
+            _wc_cache.pop(next(iter(_wc_cache)))
+        _wc_cache[key] = (dict(freqs), png)
+    return png
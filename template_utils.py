@@ -0,0 +1,68 @@
+# template_utils.py — 대형 임베드 HTML 활동용 템플릿 캐시
+"""
+수십~수백 KB짜리 활동 HTML을 render()마다 .replace()·f-string·base64 인코딩으로 다시
+조립하지 않도록, (템플릿 이름, 파라미터 해시)별로 한 번만 만들어 문자열 그대로 보관합니다.
+
+    html = cached_html("perspective_projection", _build_html)
+    html = cached_html("euclidea_bingo", _build_html, is_teacher)
+    components.html(html, ...)
+
+보관은 프로세스 전역 LRU(개수·메모리 바이트 상한)입니다. str은 불변이므로 적중 시에는
+보관한 객체를 그대로 돌려주며 압축 해제·디코딩·복사가 없습니다.
+활동 모듈은 home.py가 파일 경로로 다시 로드할 수 있으므로 캐시는 이 모듈에 둡니다.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+_MAX_TEMPLATES = 48          # 보관할 최대 (템플릿, 파라미터) 조합 수
+_MAX_BYTES = 16 << 20        # 보관 문자열 메모리 합계 상한(16MB, sys.getsizeof 기준)
+
+_templates: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_templates_bytes = 0
+_templates_lock = threading.Lock()
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _param_digest(params: Tuple[Any, ...]) -> str:
+    return hashlib.sha1(repr(params).encode("utf-8")).hexdigest()
+
+
+def cached_html(name: str, build: Callable[..., str], *params: Any) -> str:
+    """build(*params)를 (name, params 해시)별로 한 번만 실행하고 결과 HTML을 돌려줍니다.
+
+    params는 repr()이 값을 온전히 드러내는 단순 값(bool·int·str·tuple 등)이어야 합니다.
+    """
+    global _templates_bytes
+    key = (name, _param_digest(params))
+    with _templates_lock:
+        html = _templates.get(key)
+        if html is not None:
+            _templates.move_to_end(key)
+            _stats["hits"] += 1
+            return html
+
+    # 조립은 락 밖에서 — 동시에 같은 키를 만들면 나중 결과가 덮어써도 내용은 같습니다
+    html = build(*params)
+    with _templates_lock:
+        _stats["misses"] += 1
+        old = _templates.pop(key, None)
+        if old is not None:
+            _templates_bytes -= sys.getsizeof(old)
+        _templates[key] = html
+        _templates_bytes += sys.getsizeof(html)
+        while len(_templates) > 1 and (
+            len(_templates) > _MAX_TEMPLATES or _templates_bytes > _MAX_BYTES
+        ):
+            _, evicted = _templates.popitem(last=False)
+            _templates_bytes -= sys.getsizeof(evicted)
+            _stats["evictions"] += 1
+    return html
+
+
+def template_cache_stats() -> Dict[str, int]:
+    """적중/미스/축출 횟수와 현재 보관 개수·메모리 바이트."""
+    with _templates_lock:
+        return {**_stats, "entries": len(_templates), "bytes": _templates_bytes}
@@ -2,9 +2,21 @@
 """
 home.py와 pages/ 하위 파일 모두에서 동일한 다크 테마를 적용하기 위해
 공통 CSS를 이 파일 한 곳에서 관리합니다.
+
+CSS는 최초 사용 시 한 번 압축(minify)·해시되어 static/css/<이름>.<해시>.css 로
+기록되고, Streamlit 정적 파일 서빙(server.enableStaticServing)으로 제공됩니다.
+매 rerun에는 <link> 한 줄만 전송되며, 정적 서빙이 꺼져 있거나(Streamlit 1.57 미만은 .css를
+text/plain으로 보내므로 꺼진 것으로 봄) 파일을 쓸 수 없으면 기존처럼 인라인 <style>로 주입합니다.
 """
+import hashlib
+import re
+import threading
+from pathlib import Path
+
 import streamlit as st
 
+from static_utils import static_serving_enabled
+
 _DARK_THEME_CSS = """
 <style>
 /* ══════════════════════════════════════════════════════════════════════
@@ -690,6 +702,102 @@ section[data-testid="stSidebar"] nav
 """
 
 
+# ── 정적 CSS 번들 ─────────────────────────────────────────────────────────────
+_STATIC_DIR = Path(__file__).parent / "static"
+_CSS_DIR    = _STATIC_DIR / "css"
+_CSS_URL    = "app/static/css"
+
+_css_bundles: dict[str, tuple[str, str | None]] = {}   # 이름 → (압축 CSS, 정적 파일명 | None)
+_css_lock = threading.Lock()
+
+
+def _minify_css(css: str) -> str:
+    """<style> 태그·주석·불필요한 공백을 제거합니다(선택자 의미는 유지)."""
+    css = re.sub(r"</?style[^>]*>", "", css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def _write_css_file(name: str, minified: str) -> str | None:
+    digest = hashlib.sha1(minified.encode("utf-8")).hexdigest()[:10]
+    filename = f"{name}.{digest}.css"
+    path = _CSS_DIR / filename
+    try:
+        if not path.exists():
+            _CSS_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(minified, encoding="utf-8")
+            tmp.replace(path)
+            # 같은 이름의 이전 해시 파일 정리
+            for old in _CSS_DIR.glob(f"{name}.*.css"):
+                if old.name != filename:
+                    old.unlink(missing_ok=True)
+        return filename
+    except OSError:
+        return None
+
+
+def register_css(name: str, css: str) -> str:
+    """CSS 묶음을 이름으로 등록(빌드)하고 이름을 그대로 반환합니다.
+    같은 내용이면 다시 빌드하지 않으므로 모듈 최상위에서 호출해도 됩니다."""
+    minified = _minify_css(css)
+    with _css_lock:
+        cur = _css_bundles.get(name)
+        if cur is None or cur[0] != minified:
+            _css_bundles[name] = (minified, _write_css_file(name, minified))
+    return name
+
+
+def css_tag(*names: str) -> str:
+    """등록된 CSS 묶음들을 가리키는 <link> 태그(또는 폴백 <style>) 문자열."""
+    use_static = static_serving_enabled()
+    parts = []
+    for name in names:
+        minified, filename = _css_bundles[name]
+        if use_static and filename:
+            parts.append(f'<link rel="stylesheet" href="{_CSS_URL}/{filename}">')
+        else:
+            parts.append(f"<style>{minified}</style>")
+    return "".join(parts)
+
+
+def inject_css(*names: str) -> None:
+    """등록된 CSS 묶음을 현재 페이지에 주입합니다. 매 rerun마다 호출해야 합니다."""
+    st.markdown(css_tag(*names), unsafe_allow_html=True)
+
+
+# 회원관리·진도표 등 pages/ 공통 좌측 내비 열 스타일
+_PAGE_NAV_CSS = """
+[data-testid="stMainBlockContainer"] {
+    padding-left: 0 !important;
+    padding-right: 0.5rem !important;
+}
+[data-testid="column"]:first-child {
+    background: linear-gradient(180deg,rgba(6,8,22,0.99) 0%,rgba(4,8,20,0.99) 100%) !important;
+    border-right: 2px solid rgba(99,102,241,0.35) !important;
+    border-radius: 0 !important;
+    min-height: 100vh !important;
+    box-shadow: 4px 0 24px rgba(0,0,0,0.55) !important;
+    padding: 1rem 0.6rem 2rem 0.8rem !important;
+}
+[data-testid="column"]:nth-child(2) {
+    padding-left: 1rem !important;
+}
+[data-testid="column"]:first-child button {
+    font-size: 0.79rem !important;
+}
+"""
+
+register_css("dark_theme", _DARK_THEME_CSS)
+register_css("show_sidebar", _SHOW_SIDEBAR_CSS)
+register_css("hide_nav", _HIDE_NAV_CSS)
+register_css("page_nav", _PAGE_NAV_CSS)
+
+
 def inject_dark_theme(hide_sidebar: bool = True):
     """MathLab 다크 테마를 현재 페이지에 주입합니다. 매 rerun마다 주입해야 합니다.
     
@@ -698,12 +806,17 @@ def inject_dark_theme(hide_sidebar: bool = True):
                       False이면 사이드바를 표시합니다 (pages/ 하위 파이지에서 사용).
     """
     # 항상 풀 다크테마 CSS 주입 (sidebar hide 포함)
-    st.markdown(_DARK_THEME_CSS, unsafe_allow_html=True)
+    inject_css("dark_theme")
     if not hide_sidebar:
         # hide 규칙보다 높은 specificity(html body prefix)로 사이드바 강제 표시
-        st.markdown(_SHOW_SIDEBAR_CSS, unsafe_allow_html=True)
+        inject_css("show_sidebar")
 
 
 def inject_hide_nav():
     """Streamlit 기본 멀티페이지 네비게이션을 숨깁니다."""
-    st.markdown(_HIDE_NAV_CSS, unsafe_allow_html=True)
+    inject_css("hide_nav")
+
+
+def inject_page_nav_style():
+    """pages/ 하위 페이지의 좌측 내비 열 스타일을 주입합니다."""
+    inject_css("page_nav")
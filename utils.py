@@ -34,69 +34,120 @@ def anchor(name: str = "content"):
 def scroll_to(name: str = "content"):
     components.html(f"<script>window.location.hash = '{name}'</script>", height=0)
 
-def keep_scroll(key: str = "default", mount: str = "sidebar"):
+# ── 스크롤 유지 ──────────────────────────────────────────────────────────────
+# 위치는 라우트(pathname + query string)별로 sessionStorage에 저장합니다.
+# 리스너는 iframe이 아니라 부모 문서에 <script>로 넣어 부모 쪽에서 실행합니다. iframe 안에서
+# 만든 콜백은 iframe이 사라지면(keeper를 부르지 않는 페이지로 이동, 프런트엔드 재마운트)
+# 더 이상 불리지 않기 때문입니다. 부모 쪽 window.__mlScrollKeeper 가드는 부모 문서가 살아
+# 있는 동안만 유지되므로, 새 iframe이 다시 설치를 시도해도 중복 설치되지 않습니다.
+_SCROLL_KEEPER_HTML = """
+<html><head><meta charset="utf-8" />
+<style>html,body{margin:0!important;padding:0!important;width:0!important;height:0!important;overflow:hidden!important;}</style>
+</head><body><script>
+function keeper(){
+  // 부모 문서에서 실행됨(window/document = 앱 페이지)
+  var W = window, D = document;
+  if (W.__mlScrollKeeper) return;
+  W.__mlScrollKeeper = true;
+
+  var INTENT_MS = 700, SETTLE_MS = 1200;
+  var lastIntent = 0, lastMutation = 0, restoring = false, pending = false;
+
+  function routeKey(){ return 'st_scroll::' + W.location.pathname + W.location.search; }
+  function scroller(){
+    var sels = ['[data-testid="stMain"]', 'section.main', '[data-testid="stAppViewContainer"]'];
+    for (var i = 0; i < sels.length; i++) {
+      var el = D.querySelector(sels[i]);
+      if (el && el.scrollHeight > el.clientHeight + 1) {
+        var oy = W.getComputedStyle(el).overflowY;
+        if (oy === 'auto' || oy === 'scroll') return el;
+      }
+    }
+    return D.scrollingElement || D.documentElement;
+  }
+  function saved(){
+    var y = W.sessionStorage.getItem(routeKey());
+    return y === null ? null : parseFloat(y);
+  }
+  function save(){ try { W.sessionStorage.setItem(routeKey(), String(scroller().scrollTop)); } catch (e) {} }
+  function restore(){
+    pending = false;
+    var y = saved(), el = scroller();
+    if (y === null || Math.abs(el.scrollTop - y) < 2) return;
+    if (Date.now() - lastIntent < INTENT_MS) return;
+    restoring = true;
+    el.scrollTop = y;
+    W.requestAnimationFrame(function(){ restoring = false; });
+  }
+  function schedule(){ if (!pending) { pending = true; W.requestAnimationFrame(restore); } }
+
+  // 사용자가 직접 스크롤하려는 입력
+  function intent(){ lastIntent = Date.now(); }
+  ['wheel', 'touchmove', 'keydown'].forEach(function(t){
+    D.addEventListener(t, intent, { capture: true, passive: true });
+  });
+  D.addEventListener('pointerdown', function(e){ if (e.target === scroller()) intent(); }, { capture: true, passive: true });
+  W.addEventListener('hashchange', intent);
+
+  // 스크롤 이벤트는 버블링되지 않으므로 캡처 단계에서 받음
+  var ticking = false;
+  D.addEventListener('scroll', function(){
+    if (restoring || ticking) return;
+    ticking = true;
+    W.requestAnimationFrame(function(){
+      ticking = false;
+      var userMoved = Date.now() - lastIntent < INTENT_MS;
+      var layoutJump = Date.now() - lastMutation < SETTLE_MS;
+      if (!userMoved && layoutJump && saved() !== null) schedule();  // rerun 중 레이아웃 변화로 튄 경우
+      else save();
+    });
+  }, { capture: true, passive: true });
+
+  // rerun으로 DOM이 바뀌면 잠시 동안 저장 위치를 다시 맞춤(라우트가 바뀌면 새 키로)
+  new W.MutationObserver(function(){
+    lastMutation = Date.now();
+    schedule();
+  }).observe(D.body, { childList: true, subtree: true });
+  schedule();
+}
+(function(){
+  var P = window.parent;
+  if (P.__mlScrollKeeper) return;
+  var s = P.document.createElement('script');
+  s.textContent = '(' + keeper.toString() + ')();';
+  P.document.head.appendChild(s);
+})();
+</script></body></html>
+"""
+
+
+def install_scroll_keeper():
+    """
+    rerun 후 스크롤 위치를 라우트별로 복원하는 스크립트를 한 번 설치합니다.
+    매 rerun 같은 자리(사이드바 맨 위)에서 호출해야 iframe이 재사용됩니다.
     """
-    rerun 후 직전 스크롤 위치 복원 스크립트.
-    mount: 'sidebar' | 'main'  (여백을 없애려면 'sidebar' 권장)
-    - 일부 환경에서 components.html이 기본 높이(≈150px)를 차지하는 문제를 피하기 위해
-      height=1 로 지정 + iframe 내부에서 body를 0x0 로 축소합니다.
+    with st.sidebar:
+        components.html(_SCROLL_KEEPER_HTML, height=1, scrolling=False)
+        # 사이드바 쪽 components 외곽 여백도 0으로(한 번만 주입)
+        if "_side_comp_tight" not in st.session_state:
+            st.session_state["_side_comp_tight"] = True
+            st.markdown(
+                """
+                <style>
+                  /* 사이드바 안의 컴포넌트 컨테이너 여백 최소화 */
+                  section[data-testid="stSidebar"] .stComponent { margin: 0 !important; padding: 0 !important; }
+                </style>
+                """,
+                unsafe_allow_html=True,
+            )
+
+
+def keep_scroll(key: str = "default", mount: str = "sidebar"):
     """
-    html = f"""
-    <html>
-      <head>
-        <meta charset="utf-8" />
-        <style>
-          /* iframe 내부를 사실상 0x0로 축소 */
-          html, body {{
-            margin:0 !important; padding:0 !important;
-            width:0 !important; height:0 !important; overflow:hidden !important;
-          }}
-        </style>
-      </head>
-      <body>
-        <script>
-        (function(){{
-          const KEY = 'st_scroll::{key}::' + location.pathname + location.search;
-          function restore(){{
-            const y = sessionStorage.getItem(KEY);
-            if (y !== null) window.scrollTo(0, parseFloat(y));
-          }}
-          restore(); setTimeout(restore, 50); setTimeout(restore, 250);
-          let ticking = false;
-          window.addEventListener('scroll', function(){{
-            if (!ticking) {{
-              window.requestAnimationFrame(function(){{
-                sessionStorage.setItem(KEY, window.scrollY);
-                ticking = false;
-              }}); ticking = true;
-            }}
-          }});
-          setInterval(function(){{
-            sessionStorage.setItem(KEY, window.scrollY);
-          }}, 500);
-        }})();
-        </script>
-      </body>
-    </html>
+    (호환용) 예전에는 호출할 때마다 스크롤 복원 iframe과 0.5초 타이머를 새로 만들었습니다.
+    이제 위치는 라우트별로 저장되므로 key·mount는 무시하고 install_scroll_keeper()만 호출합니다.
     """
-    # height=1 로 지정(0은 일부 빌드에서 기본값으로 치환되어 큰 빈칸이 생김)
-    if mount == "sidebar":
-        with st.sidebar:
-            components.html(html, height=1, scrolling=False)
-            # 사이드바 쪽 components 외곽 여백도 0으로(한 번만 주입)
-            if "_side_comp_tight" not in st.session_state:
-                st.session_state["_side_comp_tight"] = True
-                st.markdown(
-                    """
-                    <style>
-                      /* 사이드바 안의 컴포넌트 컨테이너 여백 최소화 */
-                      section[data-testid="stSidebar"] .stComponent { margin: 0 !important; padding: 0 !important; }
-                    </style>
-                    """,
-                    unsafe_allow_html=True,
-                )
-    else:
-        components.html(html, height=1, scrolling=False)
+    install_scroll_keeper()
 
 # 레거시 호환(아무 것도 안 함)
 def set_base_page(title: str, icon: str = "📊"):
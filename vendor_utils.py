@@ -0,0 +1,224 @@
+# vendor_utils.py — 활동 iframe 공용 JS/CSS 라이브러리(p5 · KaTeX · Chart.js) 자체 호스팅
+"""
+components.html iframe 안에서 쓰는 외부 라이브러리를 라이브러리마다 하나의 고정 버전으로
+static/vendor/<라이브러리>@<버전>/ 에 두고, Streamlit 정적 파일 서빙(app/static/...)으로 제공합니다.
+
+활동 HTML은 CDN 주소 대신 "vendor:<라이브러리>/<파일>" 형태로 참조하고, 렌더링 직전에
+vendor_html()을 거쳐 실제 주소로 바뀝니다. 예전 CDN 주소(cdnjs·jsdelivr, 버전 무관)도
+같은 고정 버전의 로컬 파일로 바꿔 주므로 버전이 섞여 있던 페이지도 한 벌만 내려받습니다.
+
+정적 서빙이 꺼져 있거나(또는 Streamlit 1.57 미만이거나) 파일이 없으면 고정 버전의
+jsdelivr 주소로 폴백합니다.
+
+번들 준비(static/vendor/ 는 빌드 산출물이라 저장소에 넣지 않습니다 — .gitignore):
+  - 개발 컨테이너(.devcontainer)는 패키지 설치 단계(updateContentCommand)에서
+    python vendor_utils.py 를 실행합니다.
+  - 교내망 서버 배포: pip install -r requirements.txt 바로 다음에 인터넷이 되는 곳에서
+        python vendor_utils.py
+    를 실행하고, 만들어진 static/vendor/ 를 앱과 함께 복사합니다. 그러면 CDN이 막혀도
+    그대로 동작합니다(내려받기에 실패하면 0이 아닌 코드로 끝나므로 배포 스크립트가 멈춤).
+  - 빌드 단계가 없는 배포(Streamlit Cloud 등)는 프로세스가 처음 활동 HTML을 만들 때
+    백그라운드로 한 번 내려받고, 받기 전까지와 실패 시에는 CDN 주소를 씁니다.
+
+캐시 헤더: Streamlit 정적 경로는 Last-Modified/ETag만 보내고 Cache-Control은 보내지 않으며
+설정으로 바꿀 수도 없습니다(브라우저는 경험적 신선도만 적용). 경로에 버전이 들어 있어 내용이
+바뀌지 않으므로, 앞단 프록시에서 오래 캐시하도록 지정하면 됩니다. 예(nginx):
+    location /app/static/vendor/ {
+        proxy_pass http://streamlit;
+        add_header Cache-Control "public, max-age=31536000, immutable";
+    }
+"""
+import re
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from static_utils import static_serving_enabled
+
+_STATIC_DIR = Path(__file__).parent / "static"
+_VENDOR_DIR = _STATIC_DIR / "vendor"
+_VENDOR_URL = "app/static/vendor"
+
+# ── 고정 버전 목록 ──────────────────────────────────────────────────────────────
+# 이름 → (버전, CDN 기본 주소, 번들 파일 목록)
+_PINNED: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "p5": (
+        "1.9.0",
+        "https://cdn.jsdelivr.net/npm/p5@1.9.0/lib",
+        ("p5.min.js",),
+    ),
+    "katex": (
+        "0.16.10",
+        "https://cdn.jsdelivr.net/npm/katex@0.16.10/dist",
+        ("katex.min.css", "katex.min.js", "contrib/auto-render.min.js"),
+    ),
+    "chart.js": (
+        "4.4.0",
+        "https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist",
+        ("chart.umd.min.js",),
+    ),
+}
+
+# 예전 CDN 주소 → (라이브러리, 파일) — 버전은 무시하고 고정 버전으로 통일
+_LEGACY_CDN_RE = re.compile(
+    r"https://(?:"
+    r"cdnjs\.cloudflare\.com/ajax/libs/(?P<cdnjs>p5\.js)/[\d.]+"
+    r"|cdn\.jsdelivr\.net/npm/(?P<npm>p5|katex|chart\.js)@[\d.]+/(?:lib|dist)"
+    r")/(?P<file>[\w./-]+)"
+)
+_VENDOR_REF_RE = re.compile(r"vendor:(?P<lib>[\w.]+)/(?P<file>[\w./-]+)")
+
+# KaTeX CSS가 참조하는 글꼴 — woff2만 받아 둡니다(지원 브라우저는 woff2를 우선 사용)
+_KATEX_FONT_RE = re.compile(r"url\((fonts/[\w-]+\.woff2)\)")
+
+
+def _local_path(lib: str, file: str) -> Path:
+    version = _PINNED[lib][0]
+    return _VENDOR_DIR / f"{lib}@{version}" / file
+
+
+@lru_cache(maxsize=None)
+def _has_local(lib: str, file: str) -> bool:
+    return _local_path(lib, file).is_file()
+
+
+def vendor_url(lib: str, file: str, base: str = "") -> str:
+    """라이브러리 파일의 주소. 로컬 번들이 있으면 정적 경로, 없으면 고정 버전 CDN.
+
+    base는 정적 경로 앞에 붙는 상대 접두어입니다(앱 루트가 아닌 곳에서 열리는
+    선언형 컴포넌트 iframe은 "../../").
+    """
+    ensure_bundle()
+    version, cdn_base, _ = _PINNED[lib]
+    if static_serving_enabled() and _has_local(lib, file):
+        return f"{base}{_VENDOR_URL}/{lib}@{version}/{file}"
+    return f"{cdn_base}/{file}"
+
+
+def vendor_tags(*libs: str) -> str:
+    """라이브러리들의 기본 <script>/<link> 태그 묶음(KaTeX는 CSS + JS + auto-render)."""
+    parts = []
+    for lib in libs:
+        for file in _PINNED[lib][2]:
+            url = vendor_url(lib, file)
+            if file.endswith(".css"):
+                parts.append(f'<link rel="stylesheet" href="{url}">')
+            else:
+                parts.append(f'<script src="{url}"></script>')
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _rewrite(html: str, base: str, use_static: bool, bundle_gen: int) -> str:
+    def _ref_repl(m: re.Match) -> str:
+        lib = m.group("lib")
+        if lib not in _PINNED:
+            return m.group(0)
+        return vendor_url(lib, m.group("file"), base)
+
+    def _legacy_repl(m: re.Match) -> str:
+        lib = "p5" if m.group("cdnjs") else m.group("npm")
+        return vendor_url(lib, m.group("file"), base)
+
+    html = _VENDOR_REF_RE.sub(_ref_repl, html)
+    return _LEGACY_CDN_RE.sub(_legacy_repl, html)
+
+
+def vendor_html(html: str, base: str = "") -> str:
+    """활동 HTML의 vendor: 참조와 예전 CDN 주소를 고정 버전 주소로 바꿉니다."""
+    # 정적 서빙 설정·번들 세대가 캐시 키에 들어가도록 함께 넘깁니다(받은 뒤엔 로컬 주소로)
+    ensure_bundle()
+    return _rewrite(html, base, static_serving_enabled(), _bundle_gen)
+
+
+# ── 번들 내려받기 ───────────────────────────────────────────────────────────────
+_bundle_lock = threading.Lock()
+_bundle_started = False
+_bundle_gen = 0                     # 새 파일을 받을 때마다 증가(_rewrite 캐시 무효화)
+_bundle_error: str | None = None    # 마지막 시작 시 내려받기 실패 사유(관리자 확인용)
+
+
+def download_bundle(force: bool = False) -> list[Path]:
+    """고정 버전 파일들을 CDN에서 static/vendor/ 로 내려받습니다(이미 있으면 건너뜀).
+    KaTeX CSS는 글꼴을 모두 받은 뒤에 기록하므로, 중간에 실패해도 글꼴 없는 CSS가 남지 않습니다."""
+    global _bundle_gen
+    import requests
+
+    written: list[Path] = []
+
+    def _get(lib: str, file: str) -> bytes:
+        path = _local_path(lib, file)
+        if path.exists() and not force:
+            return path.read_bytes()
+        resp = requests.get(f"{_PINNED[lib][1]}/{file}", timeout=30)
+        resp.raise_for_status()
+        return resp.content
+
+    def _write(lib: str, file: str, body: bytes) -> None:
+        path = _local_path(lib, file)
+        if path.exists() and not force:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(body)
+        tmp.replace(path)
+        written.append(path)
+
+    try:
+        for lib, (_, _, files) in _PINNED.items():
+            for file in files:
+                body = _get(lib, file)
+                if lib == "katex" and file == "katex.min.css":
+                    for font in sorted(set(_KATEX_FONT_RE.findall(body.decode("utf-8")))):
+                        _write(lib, font, _get(lib, font))
+                _write(lib, file, body)
+    finally:
+        if written:
+            _has_local.cache_clear()
+            _bundle_gen += 1
+    return written
+
+
+def _bundle_worker() -> None:
+    global _bundle_error
+    try:
+        download_bundle()
+        _bundle_error = None
+    except Exception as e:
+        _bundle_error = f"{type(e).__name__}: {e}"
+
+
+def ensure_bundle() -> None:
+    """static/vendor/ 에 빠진 파일이 있으면 프로세스당 한 번 백그라운드로 내려받기 시작."""
+    global _bundle_started
+    if _bundle_started:
+        return
+    with _bundle_lock:
+        if _bundle_started:
+            return
+        _bundle_started = True
+    if not static_serving_enabled():
+        return
+    if all(_has_local(lib, f) for lib, (_, _, files) in _PINNED.items() for f in files):
+        return
+    threading.Thread(target=_bundle_worker, daemon=True).start()
+
+
+def bundle_generation() -> int:
+    """번들 세대. 새 파일을 받을 때마다 1씩 커지므로, 변환한 HTML을 보관하는 쪽의 캐시 키로 씁니다."""
+    return _bundle_gen
+
+
+def vendor_bundle_status() -> dict:
+    """로컬 번들 상태: 라이브러리별 보유 여부와 마지막 내려받기 오류."""
+    return {
+        "libs": {lib: all(_has_local(lib, f) for f in files)
+                 for lib, (_, _, files) in _PINNED.items()},
+        "error": _bundle_error,
+    }
+
+
+if __name__ == "__main__":
+    for p in download_bundle(force="--force" in sys.argv):
+        print(p.relative_to(_STATIC_DIR.parent))